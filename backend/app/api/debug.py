@@ -2,25 +2,31 @@
 Debug endpoint to fetch log files
 """
 from fastapi import APIRouter, HTTPException, Query
-from pathlib import Path
 
-router = APIRouter()
+from app.core.logger import session_log_path
+from app.runtime.services.checker_deltas import checker_metrics
+from app.runtime.turn_manager import turn_metrics
+from app.services.ai_service import get_ai_scheduler
+from app.services.summarizer import get_summary_queue
 
-LOGS_DIR = Path("logs")
+router = APIRouter()
 
 @router.get("/logs/{session_id}")
 async def get_session_log(session_id: str, since: int = Query(0)):
     """
     Fetches the log file for a given session.
     Can be used to poll for new log entries by providing the 'since'
-    query parameter with the last known file size.
+    query parameter with the last known file size. When the log rolled over
+    into a new segment since the last poll, reading restarts from its beginning.
     """
-    log_file = LOGS_DIR / f"session_{session_id}.log"
+    log_file = session_log_path(session_id)
 
     if not log_file.exists():
         raise HTTPException(status_code=404, detail="Log file not found for this session.")
 
     with open(log_file, 'r', encoding='utf-8') as f:
+        if since > log_file.stat().st_size:
+            since = 0
         f.seek(since)
         content = f.read()
         current_size = f.tell()
@@ -28,4 +34,20 @@ async def get_session_log(session_id: str, since: int = Query(0)):
     return {
         "content": content,
         "size": current_size
-    }
\ No newline at end of file
+    }
+
+
+@router.get("/metrics")
+async def get_metrics():
+    """
+    Counts of turns, writer streams and checker calls cancelled by client
+    disconnects, checker deltas applied and rejected (per section and reason),
+    background narrative summaries (queued, dropped under backpressure, stale),
+    and model call scheduling (load and time queued per priority).
+    """
+    return {
+        "turns": dict(turn_metrics),
+        "checker": dict(checker_metrics),
+        "summaries": get_summary_queue().metrics(),
+        "ai": get_ai_scheduler().metrics(),
+    }
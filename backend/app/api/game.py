@@ -1,22 +1,73 @@
 """
 Main game API endpoints.
 """
-from fastapi import APIRouter, HTTPException
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import dataclass, field
+from fastapi import APIRouter, Header, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Any, Literal, Dict
+import asyncio
+import logging
+import os
+import socket
+import time
 import uuid
-import json
 
-from app.core.loader import GameLoader
+from app.api.streaming import ClosingStreamingResponse, sse_stream
+from app.core.loader import GameCache, GameLoader
+from app.core.logger import start_session_log
+from app.core.settings import GameSettings
 from app.runtime.engine import PlotPlayEngine
 from app.runtime.types import PlayerAction
 from app.services.ai_service import AIService
+from app.storage import SessionRepository, create_session_repository
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
-# In-memory session storage. In a production app, this would be a database or Redis.
+# Live engines for sessions served by this process. Every completed turn is also
+# written behind to the session repository, which is the source of truth: with
+# several workers a cached engine is only reused while its revision is current.
+# At most MAX_LIVE_SESSIONS engines are kept; the least recently used are evicted.
 game_sessions: Dict[str, PlotPlayEngine] = {}
+_session_repository: SessionRepository | None = None
+
+# Loaded game definitions, shared by every session this worker serves.
+game_cache = GameCache()
+
+# Identifies this process when taking session leases in a shared store.
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+@dataclass
+class _TurnQueue:
+    """Requests for one session in this worker: they take turns in arrival order."""
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Requests holding or waiting for the lock
+    pending: int = 0
+    # Idempotency key -> turn shared by every duplicate of that request
+    inflight: dict[str, asyncio.Task] = field(default_factory=dict)
+    # Idempotency keys of streamed turns in progress
+    streaming: set[str] = field(default_factory=set)
+
+
+# Present only while a session has requests in flight.
+_turn_queues: Dict[str, _TurnQueue] = {}
+
+
+def get_session_repository() -> SessionRepository:
+    global _session_repository
+    if _session_repository is None:
+        _session_repository = create_session_repository()
+    return _session_repository
+
+
+def close_session_repository() -> None:
+    global _session_repository
+    if _session_repository is not None:
+        _session_repository.close()
+        _session_repository = None
 
 
 class StartGameRequest(BaseModel):
@@ -47,18 +98,177 @@ class GameResponse(BaseModel):
     action_summary: str | None = None
 
 
-def _get_engine(session_id: str) -> PlotPlayEngine:
+async def _get_engine(session_id: str) -> PlotPlayEngine:
+    repository = get_session_repository()
     engine = game_sessions.get(session_id)
-    if not engine:
+    if engine:
+        stored = repository.revision(session_id)
+        if stored is None or stored <= engine.revision:
+            _remember_engine(session_id, engine)
+            return engine
+
+    # Rehydrate sessions persisted by an earlier process, or advanced by another worker.
+    record = repository.load(session_id)
+    if not record:
         raise HTTPException(status_code=404, detail="Session not found")
+    game_def = await game_cache.aget(record.game_id)
+    engine = PlotPlayEngine.restore(
+        game_def, record, ai_service=AIService(), repository=repository, lease=try_session_lease,
+    )
+    _remember_engine(session_id, engine)
     return engine
 
 
+def _remember_engine(session_id: str, engine: PlotPlayEngine) -> None:
+    """Mark the engine most recently used, evicting the least recently used idle ones past the limit."""
+    game_sessions.pop(session_id, None)
+    game_sessions[session_id] = engine
+    limit = GameSettings().max_live_sessions
+    for stale_id, stale in list(game_sessions.items()):
+        if len(game_sessions) <= limit:
+            break
+        # Mid-turn and never-persisted engines cannot be rehydrated yet.
+        if stale_id == session_id or stale._turn_active or stale.revision == 0:
+            continue
+        del game_sessions[stale_id]
+        stale.close()
+
+
+async def watch_games(interval: float) -> None:
+    """Dev mode: reload edited games and swap them into this worker's live sessions."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            reloaded = await asyncio.to_thread(game_cache.refresh)
+            for game_id, game_def in reloaded.items():
+                sessions = [engine for engine in game_sessions.values() if engine.runtime.game.meta.id == game_id]
+                for engine in sessions:
+                    engine.reload_game(game_def)
+                logger.info("Reloaded game '%s' into %d live session(s)", game_id, len(sessions))
+        except Exception:
+            logger.exception("Game hot reload failed")
+
+
+def _turn_queue(session_id: str) -> _TurnQueue:
+    queue = _turn_queues.get(session_id)
+    if queue is None:
+        queue = _turn_queues[session_id] = _TurnQueue()
+    return queue
+
+
+def _prune_turn_queue(session_id: str) -> None:
+    queue = _turn_queues.get(session_id)
+    if (
+        queue is not None
+        and not queue.pending
+        and not queue.inflight
+        and not queue.streaming
+        and not queue.lock.locked()
+    ):
+        del _turn_queues[session_id]
+
+
+async def _acquire_session(session_id: str) -> str:
+    """
+    Take the session's turn in this worker, then its lease, waiting briefly if
+    another request holds either. Past SESSION_TURN_QUEUE waiting requests,
+    answer 429 right away instead of queueing more turns.
+    """
+    repository = get_session_repository()
+    settings = GameSettings()
+    queue = _turn_queue(session_id)
+    if queue.pending > settings.session_turn_queue:
+        raise HTTPException(status_code=429, detail="Too many pending turns for this session")
+    owner = f"{WORKER_ID}:{uuid.uuid4().hex[:8]}"
+    deadline = time.monotonic() + settings.session_lease_wait_s
+    queue.pending += 1
+    try:
+        try:
+            await asyncio.wait_for(queue.lock.acquire(), timeout=settings.session_lease_wait_s)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=409, detail="Session is busy")
+        try:
+            delay = 0.01
+            while not repository.acquire_lease(session_id, owner, settings.session_lease_ttl_s):
+                if time.monotonic() >= deadline:
+                    raise HTTPException(status_code=409, detail="Session is busy")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.25)
+        except BaseException:
+            queue.lock.release()
+            raise
+    except BaseException:
+        queue.pending -= 1
+        _prune_turn_queue(session_id)
+        raise
+    return owner
+
+
+async def _release_session(session_id: str, owner: str) -> None:
+    """Make the session's latest snapshot durable, then hand the lease and turn back."""
+    repository = get_session_repository()
+    try:
+        await asyncio.to_thread(repository.flush)
+    except Exception:
+        logger.exception("Failed to flush session %s before releasing it", session_id)
+    finally:
+        repository.release_lease(session_id, owner)
+        queue = _turn_queues[session_id]
+        queue.lock.release()
+        queue.pending -= 1
+        _prune_turn_queue(session_id)
+
+
+@asynccontextmanager
+async def session_lease(session_id: str):
+    """Serialize turns for one session across requests, workers and nodes."""
+    owner = await _acquire_session(session_id)
+    try:
+        yield
+    finally:
+        await _release_session(session_id, owner)
+
+
+@asynccontextmanager
+async def try_session_lease(session_id: str):
+    """
+    Non-blocking session_lease for background work (summaries): yields False at
+    once, holding nothing, while a request holds or waits for the session in
+    this worker or another worker holds its lease. It never takes a place in
+    the session's turn queue.
+    """
+    queue = _turn_queue(session_id)
+    if queue.pending or queue.lock.locked():
+        _prune_turn_queue(session_id)
+        yield False
+        return
+    # Free and nobody waiting, so this returns without blocking.
+    await queue.lock.acquire()
+    repository = get_session_repository()
+    owner = f"{WORKER_ID}:{uuid.uuid4().hex[:8]}"
+    held = False
+    try:
+        held = repository.acquire_lease(session_id, owner, GameSettings().session_lease_ttl_s)
+        yield held
+    finally:
+        try:
+            if held:
+                try:
+                    await asyncio.to_thread(repository.flush)
+                except Exception:
+                    logger.exception("Failed to flush session %s before releasing it", session_id)
+                finally:
+                    repository.release_lease(session_id, owner)
+        finally:
+            queue.lock.release()
+            _prune_turn_queue(session_id)
+
+
 @router.get("/list")
 async def list_games():
     """List all available games."""
     loader = GameLoader()
-    return {"games": loader.list_games()}
+    return {"games": await asyncio.to_thread(loader.list_games)}
 
 
 @router.post("/start")
@@ -66,19 +276,22 @@ async def start_game(request: StartGameRequest) -> GameResponse:
     """Start a new game session."""
     session_id = str(uuid.uuid4())
     try:
-        loader = GameLoader()
-        game_def = loader.load_game(request.game_id)
+        game_def = await game_cache.aget(request.game_id)
         # IMPORTANT: Use real AIService (OpenRouter) for production
         # Tests use MockAIService (see tests/conftest.py)
         ai_service = AIService()
-        engine = PlotPlayEngine(game_def, session_id, ai_service=ai_service)
+        start_session_log(session_id)
+        engine = PlotPlayEngine(
+            game_def, session_id, ai_service=ai_service, repository=get_session_repository(), lease=try_session_lease,
+        )
 
-        game_sessions[session_id] = engine
+        _remember_engine(session_id, engine)
 
         # A default "look around" action to generate the first narrative block
-        result = await engine.process_action(
-            PlayerAction(action_type="do", action_text="Look around and observe the surroundings")
-        )
+        async with session_lease(session_id):
+            result = await engine.process_action(
+                PlayerAction(action_type="do", action_text="Look around and observe the surroundings")
+            )
 
         return GameResponse(
             session_id=session_id,
@@ -96,23 +309,25 @@ async def start_game(request: StartGameRequest) -> GameResponse:
 
 
 @router.post("/start/stream")
-async def start_game_stream(request: StartGameRequest):
+async def start_game_stream(request: StartGameRequest, http_request: Request):
     """Start a new game session with streaming narrative (fast opening scene)."""
     session_id = str(uuid.uuid4())
 
     async def generate():
         try:
             print(f"[START] Loading game {request.game_id}...")
-            loader = GameLoader()
-            game_def = loader.load_game(request.game_id)
+            game_def = await game_cache.aget(request.game_id)
             print(f"[START] Game loaded, creating engine...")
             # IMPORTANT: Use real AIService (OpenRouter) for production
             # Tests use MockAIService (see tests/conftest.py)
             ai_service = AIService()
-            engine = PlotPlayEngine(game_def, session_id, ai_service=ai_service)
+            start_session_log(session_id)
+            engine = PlotPlayEngine(
+                game_def, session_id, ai_service=ai_service, repository=get_session_repository(), lease=try_session_lease,
+            )
             print(f"[START] Engine created")
 
-            game_sessions[session_id] = engine
+            _remember_engine(session_id, engine)
 
             # Send session info first
             session_event = {
@@ -120,7 +335,7 @@ async def start_game_stream(request: StartGameRequest):
                 "session_id": session_id,
                 "generated_seed": engine.runtime.generated_seed
             }
-            yield f"data: {json.dumps(session_event)}\n\n"
+            yield session_event
             print(f"[START] Session created event sent")
 
             # Send initial state snapshot immediately (before narrative)
@@ -134,7 +349,7 @@ async def start_game_stream(request: StartGameRequest):
                 "state_summary": initial_state,
                 "choices": initial_choices
             }
-            yield f"data: {json.dumps(initial_state_event)}\n\n"
+            yield initial_state_event
             print(f"[START] Initial state sent")
 
             # Send action summary immediately
@@ -142,22 +357,27 @@ async def start_game_stream(request: StartGameRequest):
                 "type": "action_summary",
                 "content": "You arrive at the scene."
             }
-            yield f"data: {json.dumps(action_summary_event)}\n\n"
+            yield action_summary_event
             print(f"[START] Action summary sent")
 
-            # Stream opening scene (Writer only, no Checker)
+            # Stream the opening scene: writer tokens are forwarded as they arrive
             print(f"[START] Starting opening scene stream...")
-            result = await engine.process_action(
-                PlayerAction(action_type="do", action_text="Look around and observe the surroundings")
-            )
-            completion_event = {
-                "type": "complete",
-                "narrative": result.narrative,
-                "choices": result.choices,
-                "state_summary": result.state_summary,
-                "action_summary": result.action_summary,
-            }
-            yield f"data: {json.dumps(completion_event)}\n\n"
+            opening_action = PlayerAction(action_type="do", action_text="Look around and observe the surroundings")
+            async with session_lease(session_id):
+                async with aclosing(engine.process_action_stream(opening_action)) as stream:
+                    async for chunk in stream:
+                        if chunk["type"] == "action_summary":
+                            # Already announced above
+                            continue
+                        if chunk["type"] == "complete":
+                            chunk = {
+                                "type": "complete",
+                                "narrative": chunk["narrative"],
+                                "choices": chunk["choices"],
+                                "state_summary": chunk["state_summary"],
+                                "action_summary": chunk["action_summary"],
+                            }
+                        yield chunk
 
             yield "data: [DONE]\n\n"
             print(f"[START] Done!")
@@ -170,15 +390,49 @@ async def start_game_stream(request: StartGameRequest):
                 "type": "error",
                 "message": str(e)
             }
-            yield f"data: {json.dumps(error_event)}\n\n"
+            yield error_event
 
-    return StreamingResponse(generate(), media_type="text/event-stream")
+    return StreamingResponse(sse_stream(generate(), request=http_request), media_type="text/event-stream")
 
 
 @router.post("/action/{session_id}")
-async def process_action(session_id: str, action: GameAction) -> GameResponse:
-    """Process a game action."""
-    engine = _get_engine(session_id)
+async def process_action(
+    session_id: str,
+    action: GameAction,
+    idempotency_key: str | None = Header(default=None),
+) -> GameResponse:
+    """
+    Process a game action.
+    Requests repeating the Idempotency-Key of one still in flight share its result.
+    """
+    if idempotency_key is None:
+        async with session_lease(session_id):
+            return await _process_action(session_id, action)
+
+    queue = _turn_queue(session_id)
+    turn = queue.inflight.get(idempotency_key)
+    if turn is None:
+        turn = asyncio.ensure_future(_leased_action(session_id, action))
+        queue.inflight[idempotency_key] = turn
+
+        def _done(task: asyncio.Task) -> None:
+            queue.inflight.pop(idempotency_key, None)
+            _prune_turn_queue(session_id)
+            if not task.cancelled():
+                task.exception()  # retrieved by the awaiting requests
+
+        turn.add_done_callback(_done)
+    # Shielded: a duplicate giving up must not cancel the turn the others wait on.
+    return await asyncio.shield(turn)
+
+
+async def _leased_action(session_id: str, action: GameAction) -> GameResponse:
+    async with session_lease(session_id):
+        return await _process_action(session_id, action)
+
+
+async def _process_action(session_id: str, action: GameAction) -> GameResponse:
+    engine = await _get_engine(session_id)
 
     try:
         if isinstance(engine, PlotPlayEngine):
@@ -228,9 +482,50 @@ async def process_action(session_id: str, action: GameAction) -> GameResponse:
 
 
 @router.post("/action/{session_id}/stream")
-async def process_action_stream(session_id: str, action: GameAction):
-    """Process a game action with streaming narrative response."""
-    engine = _get_engine(session_id)
+async def process_action_stream(
+    session_id: str,
+    action: GameAction,
+    request: Request,
+    idempotency_key: str | None = Header(default=None),
+):
+    """
+    Process a game action with streaming narrative response.
+    A repeat of a streamed request still in flight (same Idempotency-Key) answers 409.
+    """
+    queue = _turn_queue(session_id)
+    if idempotency_key is not None:
+        if idempotency_key in queue.streaming:
+            raise HTTPException(status_code=409, detail="Duplicate request is already in progress")
+        queue.streaming.add(idempotency_key)
+
+    def _end_stream() -> None:
+        if idempotency_key is not None:
+            queue.streaming.discard(idempotency_key)
+            _prune_turn_queue(session_id)
+
+    try:
+        owner = await _acquire_session(session_id)
+    except BaseException:
+        _end_stream()
+        raise
+    released = False
+
+    async def _finish() -> None:
+        # Runs from the body's finally or, if the body never started, from the response.
+        nonlocal released
+        if released:
+            return
+        released = True
+        try:
+            await _release_session(session_id, owner)
+        finally:
+            _end_stream()
+
+    try:
+        engine = await _get_engine(session_id)
+    except BaseException:
+        await _finish()
+        raise
 
     async def generate():
         try:
@@ -246,15 +541,16 @@ async def process_action_stream(session_id: str, action: GameAction):
                     with_characters=action.with_characters,
                     skip_ai=action.skip_ai,
                 )
-                async for chunk in engine.process_action_stream(player_action):
-                    yield f"data: {json.dumps(chunk)}\n\n"
+                async with aclosing(engine.process_action_stream(player_action)) as stream:
+                    async for chunk in stream:
+                        yield chunk
             else:
                 # First, send the action summary immediately for legacy engine
                 action_summary_event = {
                     "type": "action_summary",
                     "content": f"Processing action..."
                 }
-                yield f"data: {json.dumps(action_summary_event)}\n\n"
+                yield action_summary_event
 
                 async for chunk in engine.process_action_stream(
                     action_type=action.action_type,
@@ -264,7 +560,7 @@ async def process_action_stream(session_id: str, action: GameAction):
                     item_id=action.item_id,
                     skip_ai=action.skip_ai,
                 ):
-                    yield f"data: {json.dumps(chunk)}\n\n"
+                    yield chunk
 
             yield "data: [DONE]\n\n"
 
@@ -277,9 +573,13 @@ async def process_action_stream(session_id: str, action: GameAction):
                 "type": "error",
                 "message": f"{str(e)}\n{error_details}"
             }
-            yield f"data: {json.dumps(error_event)}\n\n"
+            yield error_event
+        finally:
+            await _finish()
 
-    return StreamingResponse(generate(), media_type="text/event-stream")
+    return ClosingStreamingResponse(
+        sse_stream(generate(), request=request), media_type="text/event-stream", on_close=_finish,
+    )
 
 
 # Helper endpoint response models
@@ -308,7 +608,7 @@ class StoryEventsResponse(BaseModel):
 @router.get("/session/{session_id}/characters")
 async def get_characters_list(session_id: str) -> CharactersListResponse:
     """Get list of all characters with basic info for Character Notebook sidebar."""
-    engine = _get_engine(session_id)
+    engine = await _get_engine(session_id)
     state = engine.runtime.state_manager.state
     game = engine.runtime.game
 
@@ -337,7 +637,7 @@ async def get_characters_list(session_id: str) -> CharactersListResponse:
 @router.get("/session/{session_id}/character/{character_id}")
 async def get_character_details(session_id: str, character_id: str) -> dict[str, Any]:
     """Get detailed character profile for Character Notebook."""
-    engine = _get_engine(session_id)
+    engine = await _get_engine(session_id)
     state = engine.runtime.state_manager.state
     game = engine.runtime.game
 
@@ -426,7 +726,7 @@ async def get_character_details(session_id: str, character_id: str) -> dict[str,
 @router.get("/session/{session_id}/story-events")
 async def get_story_events(session_id: str) -> StoryEventsResponse:
     """Get aggregated story events (character memories) for Story Events panel."""
-    engine = _get_engine(session_id)
+    engine = await _get_engine(session_id)
     state = engine.runtime.state_manager.state
 
     # Aggregate memories from all characters
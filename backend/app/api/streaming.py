@@ -0,0 +1,153 @@
+"""
+Server-sent events transport for streamed turns.
+
+Writers emit one event per model token; sending each as its own frame costs a
+JSON encode, a write and a syscall per token. `sse_stream` coalesces
+consecutive narrative chunks into one frame on a time or size budget, encodes
+those fixed-shape frames without building a dict, and sends keep-alive comments
+while the turn is busy elsewhere (e.g. waiting on the checker). When the client
+disconnects, the producer is cancelled instead of being run to completion.
+"""
+
+import asyncio
+import contextlib
+import json
+import time
+from json.encoder import encode_basestring_ascii
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from app.core.settings import GameSettings
+
+KEEPALIVE_FRAME = ": keep-alive\n\n"
+
+_NARRATIVE_PREFIX = 'data: {"type": "narrative_chunk", "content": '
+
+
+def sse_frame(event: dict[str, Any]) -> str:
+    """Encode one event as an SSE data frame."""
+    if event.get("type") == "narrative_chunk" and len(event) == 2:
+        return f"{_NARRATIVE_PREFIX}{encode_basestring_ascii(event['content'])}}}\n\n"
+    return f"data: {json.dumps(event)}\n\n"
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that closes its body and runs `on_close` however sending
+    ends: completed, failed, or the client gone before the body was iterated.
+    `on_close` may also run from the body itself, so it must be idempotent.
+    """
+
+    def __init__(self, content: AsyncIterator[str], *, on_close: Callable[[], Awaitable[None]], **kwargs: Any):
+        super().__init__(content, **kwargs)
+        self.on_close = on_close
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            try:
+                aclose = getattr(self.body_iterator, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            finally:
+                await self.on_close()
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    while (await request.receive())["type"] != "http.disconnect":
+        pass
+
+
+async def sse_stream(
+    events: AsyncIterator[dict[str, Any] | str],
+    *,
+    request: Request | None = None,
+    flush_interval: float | None = None,
+    flush_bytes: int | None = None,
+    keepalive: float | None = None,
+) -> AsyncIterator[str]:
+    """
+    Encode an event stream as SSE frames.
+
+    Dict events are encoded with `sse_frame`; strings are passed through as
+    preformatted frames. Narrative chunks are buffered until `flush_interval`
+    seconds passed since the first buffered token, `flush_bytes` characters
+    accumulated, or any other event arrives, whichever comes first.
+
+    With a `request`, a client disconnect cancels the producer where it is
+    waiting (model stream, checker call) and closes it, so the turn is rolled
+    back rather than finished for nobody.
+    """
+    settings = GameSettings()
+    if flush_interval is None:
+        flush_interval = settings.stream_flush_interval_ms / 1000
+    if flush_bytes is None:
+        flush_bytes = settings.stream_flush_bytes
+    if keepalive is None:
+        keepalive = settings.stream_keepalive_s
+
+    iterator = aiter(events)
+    buffer: list[str] = []
+    buffered = 0
+    deadline = 0.0
+    pending: asyncio.Future | None = None
+    watcher = asyncio.ensure_future(_wait_for_disconnect(request)) if request is not None else None
+
+    def flush() -> str:
+        nonlocal buffered
+        frame = sse_frame({"type": "narrative_chunk", "content": "".join(buffer)})
+        buffer.clear()
+        buffered = 0
+        return frame
+
+    try:
+        while True:
+            if pending is None:
+                # Pulled in a task so a flush or keep-alive never cancels the producer mid-step.
+                pending = asyncio.ensure_future(anext(iterator))
+            if buffer:
+                timeout = max(0.0, deadline - time.monotonic())
+            else:
+                timeout = keepalive if keepalive > 0 else None
+            waiting = {pending} if watcher is None else {pending, watcher}
+            done, _ = await asyncio.wait(waiting, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if watcher is not None and watcher in done:
+                return
+            if not done:
+                yield flush() if buffer else KEEPALIVE_FRAME
+                continue
+
+            step, pending = pending, None
+            try:
+                event = step.result()
+            except StopAsyncIteration:
+                break
+
+            if isinstance(event, dict) and event.get("type") == "narrative_chunk" and len(event) == 2:
+                if not buffer:
+                    deadline = time.monotonic() + flush_interval
+                buffer.append(event["content"])
+                buffered += len(event["content"])
+                if buffered >= flush_bytes or flush_interval <= 0:
+                    yield flush()
+                continue
+
+            if buffer:
+                yield flush()
+            yield event if isinstance(event, str) else sse_frame(event)
+
+        if buffer:
+            yield flush()
+    finally:
+        for task in (pending, watcher):
+            if task is not None and not task.done():
+                task.cancel()
+                with contextlib.suppress(BaseException):
+                    await task
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -2,8 +2,8 @@
 
 from .env import DEFAULT_GAMES_PATH, BACKEND_DIR, ENV_FILE_PATH
 from .conditions import ConditionEvaluator
-from .loader import GameLoader
+from .loader import GameCache, GameLoader
 from .validator import GameValidator
 from .settings import GameSettings
 from .state import StateManager
-from .logger import setup_session_logger
+from .logger import setup_session_logger, start_session_log, close_session_logger, shutdown_session_logging
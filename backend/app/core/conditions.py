@@ -5,8 +5,12 @@ A safe evaluator for the PlotPlay Expression DSL using Python's AST.
 from __future__ import annotations
 
 import ast
+import copy
 import operator
 import random
+import re
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -14,6 +18,160 @@ if TYPE_CHECKING:
     from app.models.game import GameIndex
 
 
+# Identifier substituted for the `{character}` placeholder in templated conditions.
+CHARACTER_PLACEHOLDER = "__character__"
+
+# Names that resolve to constants in every evaluation context.
+_CONSTANT_NAMES = frozenset({"true", "True", "false", "False", "null", "None"})
+
+_MAX_EXPRESSION_LENGTH = 512
+
+
+@lru_cache(maxsize=4096)
+def parse_expression(expression: str) -> ast.AST | None:
+    """
+    Parse a trimmed DSL expression into its AST body.
+    Results are cached process-wide; returns None for expressions the evaluator rejects.
+    """
+    if "'" in expression or len(expression) > _MAX_EXPRESSION_LENGTH:
+        return None
+    try:
+        return ast.parse(expression, mode="eval").body
+    except (SyntaxError, ValueError):
+        return None
+
+
+_TEXT_PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+
+
+@lru_cache(maxsize=1024)
+def parse_text_template(text: str) -> tuple[str | tuple[str, ast.AST | None], ...]:
+    """
+    Split narrative text into literal parts and `{expression}` placeholders.
+    Placeholders are kept as (source, parsed expression) pairs; cached process-wide.
+    """
+    parts: list[str | tuple[str, ast.AST | None]] = []
+    position = 0
+    for match in _TEXT_PLACEHOLDER.finditer(text):
+        if match.start() > position:
+            parts.append(text[position:match.start()])
+        parts.append((match.group(0), parse_expression(match.group(1).strip())))
+        position = match.end()
+    if position < len(text):
+        parts.append(text[position:])
+    return tuple(parts)
+
+
+class _CharacterBinder(ast.NodeTransformer):
+    """Turns `"__character__"` string literals into a lookup of the bound character."""
+
+    def __init__(self) -> None:
+        self.textual = False
+
+    def visit_Constant(self, node: ast.Constant) -> ast.AST:
+        if isinstance(node.value, str) and CHARACTER_PLACEHOLDER in node.value:
+            if node.value == CHARACTER_PLACEHOLDER:
+                return ast.copy_location(ast.Name(id=CHARACTER_PLACEHOLDER, ctx=ast.Load()), node)
+            # Placeholder embedded in a longer string can only be handled textually.
+            self.textual = True
+        return node
+
+
+@dataclass(frozen=True, slots=True)
+class ConditionTemplate:
+    """
+    Pre-parsed (when, when_all, when_any) trio whose `{character}` placeholder is
+    bound at evaluation time instead of being substituted into the text.
+
+    Attributes:
+        when/when_all/when_any: compiled expression trees (invalid ones compile to False)
+        meter_refs: (owner, meter) pairs read by the template when it depends on
+            nothing but meters and literals; None when results cannot be cached
+        textual: placeholder appears inside a longer string literal, so callers
+            must fall back to text substitution
+    """
+
+    when: ast.AST | None
+    when_all: tuple[ast.AST, ...]
+    when_any: tuple[ast.AST, ...]
+    meter_refs: tuple[tuple[str, str], ...] | None
+    textual: bool = False
+
+    @classmethod
+    def compile(
+        cls,
+        when: str | None,
+        when_all: list[str | None] | None = None,
+        when_any: list[str | None] | None = None,
+    ) -> "ConditionTemplate":
+        binder = _CharacterBinder()
+        refs: set[tuple[str, str]] | None = set()
+
+        def _compile(expression: str) -> ast.AST:
+            nonlocal refs
+            trimmed = expression.strip()
+            lowered = trimmed.lower()
+            if lowered in {"always", "true"}:
+                return ast.Constant(True)
+            if lowered in {"false", "never"}:
+                return ast.Constant(False)
+            tree = parse_expression(trimmed.replace("{character}", CHARACTER_PLACEHOLDER))
+            if tree is None:
+                return ast.Constant(False)
+            # Cached trees are shared, so bind on a private copy
+            tree = ast.fix_missing_locations(binder.visit(copy.deepcopy(tree)))
+            if refs is not None:
+                found = _collect_meter_refs(tree)
+                refs = None if found is None else refs | found
+            return tree
+
+        compiled_when = _compile(when) if when and when.strip() else None
+        compiled_all = tuple(_compile(expr) for expr in (when_all or []) if expr and expr.strip())
+        compiled_any = tuple(_compile(expr) for expr in (when_any or []) if expr and expr.strip())
+        return cls(
+            when=compiled_when,
+            when_all=compiled_all,
+            when_any=compiled_any,
+            meter_refs=tuple(sorted(refs)) if refs is not None else None,
+            textual=binder.textual,
+        )
+
+
+def _collect_meter_refs(tree: ast.AST) -> set[tuple[str, str]] | None:
+    """
+    Return the `meters.<owner>.<meter>` paths read by an expression, or None when
+    it reads anything besides meters, literals and the bound character.
+    """
+    refs: set[tuple[str, str]] = set()
+
+    def _walk(node: ast.AST) -> bool:
+        if isinstance(node, ast.Constant):
+            return True
+        if isinstance(node, ast.Name):
+            return node.id == CHARACTER_PLACEHOLDER or node.id in _CONSTANT_NAMES
+        if isinstance(node, ast.Attribute):
+            owner = node.value
+            if (
+                isinstance(owner, ast.Attribute)
+                and isinstance(owner.value, ast.Name)
+                and owner.value.id == "meters"
+            ):
+                refs.add((owner.attr, node.attr))
+                return True
+            return False
+        if isinstance(node, ast.Compare):
+            return _walk(node.left) and all(_walk(c) for c in node.comparators)
+        if isinstance(node, ast.BoolOp):
+            return all(_walk(v) for v in node.values)
+        if isinstance(node, ast.BinOp):
+            return _walk(node.left) and _walk(node.right)
+        if isinstance(node, ast.UnaryOp):
+            return _walk(node.operand)
+        return False
+
+    return refs if _walk(tree) else None
+
+
 class ConditionEvaluator:
     """
     Safely evaluates PlotPlay DSL expressions against the current game state.
@@ -63,6 +221,10 @@ class ConditionEvaluator:
     # --------------------------------------------------------------------- #
     # Public API
     # --------------------------------------------------------------------- #
+    def refresh(self) -> None:
+        """Drop the cached evaluation context so the next check sees current state."""
+        self._eval_context = None
+
     def evaluate(self, expression: str | None) -> bool:
         """
         Evaluate a single DSL expression.
@@ -153,6 +315,24 @@ class ConditionEvaluator:
             return self.evaluate_any(when_any)
         return True
 
+    def evaluate_template(self, template: ConditionTemplate, *, character: str | None = None) -> bool:
+        """
+        Evaluate a compiled condition template with `{character}` bound to `character`.
+        Mirrors evaluate_object_conditions() without re-parsing any expression text.
+        """
+        if self._eval_context is None:
+            self._eval_context = self._build_evaluation_context()
+        self._eval_context[CHARACTER_PLACEHOLDER] = character
+
+        if template.when is not None and not self._eval_tree(template.when):
+            return False
+        for tree in template.when_all:
+            if not self._eval_tree(tree):
+                return False
+        if template.when_any:
+            return any(self._eval_tree(tree) for tree in template.when_any)
+        return True
+
     def evaluate_value(
         self,
         expression: str | None,
@@ -180,7 +360,7 @@ class ConditionEvaluator:
             return default
 
         # Guard extremely long expressions to avoid pathological parsing
-        if len(trimmed) > 512:
+        if len(trimmed) > _MAX_EXPRESSION_LENGTH:
             if self.logger:
                 self.logger.debug("Condition too long; returning default for safety.")
             return default
@@ -189,14 +369,56 @@ class ConditionEvaluator:
         if self._eval_context is None:
             self._eval_context = self._build_evaluation_context()
 
+        tree = parse_expression(trimmed)
+        if tree is None:
+            if self.logger:
+                self.logger.debug("Condition evaluation failed; expression=%s", trimmed)
+            return default
         try:
-            tree = ast.parse(trimmed, mode="eval")
-            return self._eval_node(tree.body)
+            return self._eval_node(tree)
         except Exception:
             if self.logger:
                 self.logger.debug("Condition evaluation failed; expression=%s", trimmed)
             return default
 
+    def render_text(self, text: str) -> str:
+        """
+        Interpolate `{expression}` placeholders in authored text with their values
+        (e.g. "Trust: {meters.emma.trust}"). Placeholders that fail to evaluate are
+        left as written.
+        """
+        parts = parse_text_template(text)
+        if len(parts) == 1 and isinstance(parts[0], str):
+            return text
+        if self._eval_context is None:
+            self._eval_context = self._build_evaluation_context()
+        rendered = []
+        for part in parts:
+            if isinstance(part, str):
+                rendered.append(part)
+                continue
+            source, tree = part
+            try:
+                if tree is None:
+                    raise ValueError(source)
+                value = self._eval_node(tree)
+            except Exception:
+                if self.logger:
+                    self.logger.debug("Text placeholder evaluation failed; placeholder=%s", source)
+                rendered.append(source)
+                continue
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
+            rendered.append("" if value is None else str(value))
+        return "".join(rendered)
+
+    def _eval_tree(self, tree: ast.AST) -> bool:
+        """Evaluate a pre-parsed expression tree, treating failures as False."""
+        try:
+            return bool(self._eval_node(tree))
+        except Exception:
+            return False
+
     # --------------------------------------------------------------------- #
     # Context construction
     # --------------------------------------------------------------------- #
@@ -384,9 +606,14 @@ class ConditionEvaluator:
             value = self._eval_node(node.value)
             if value is None:
                 return None
+            attr = node.attr
+            if attr == CHARACTER_PLACEHOLDER:
+                attr = self._eval_context.get(CHARACTER_PLACEHOLDER)
+                if attr is None:
+                    return None
             if isinstance(value, dict):
-                return value.get(node.attr)
-            return getattr(value, node.attr, None)
+                return value.get(attr)
+            return getattr(value, attr, None)
 
         if isinstance(node, ast.Subscript):
             value = self._eval_node(node.value)
@@ -0,0 +1,194 @@
+"""
+Graph analysis for game content validation.
+
+Transition graphs (node gotos, zone connections) are flattened into an
+integer-indexed adjacency array so reachability and strongly connected
+components run iteratively in linear time, regardless of graph depth.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class GraphReport:
+    """Everything the validator needs from one analysis of a transition graph."""
+    ids: list[str]
+    reachable: bytearray
+    component_of: list[int]
+    components: list[list[int]]
+    # Cyclic components (size > 1, or a self-loop) mapped to the node ids their edges leave to
+    component_exits: dict[int, set[str]] = field(default_factory=dict)
+    dead_ends: list[str] = field(default_factory=list)
+    unreachable: list[str] = field(default_factory=list)
+    unreachable_terminals: list[str] = field(default_factory=list)
+    closed_cycles: list[list[str]] = field(default_factory=list)
+
+
+class IndexedGraph:
+    """
+    Directed graph over string ids stored as a CSR adjacency array.
+
+    The successors of vertex `v` are `targets[offsets[v]:offsets[v + 1]]`.
+    Edges pointing at unknown ids are dropped; dangling references are
+    reported by the validator's own reference checks.
+    """
+
+    __slots__ = ("ids", "index", "offsets", "targets")
+
+    def __init__(self, ids: Iterable[str], edges: Mapping[str, Iterable[str]]):
+        self.ids: list[str] = list(dict.fromkeys(ids))
+        self.index: dict[str, int] = {node_id: i for i, node_id in enumerate(self.ids)}
+        index = self.index
+        offsets = [0]
+        targets: list[int] = []
+        for node_id in self.ids:
+            seen = set()
+            for target in edges.get(node_id, ()):
+                t = index.get(target)
+                if t is not None and t not in seen:
+                    seen.add(t)
+                    targets.append(t)
+            offsets.append(len(targets))
+        self.offsets = offsets
+        self.targets = targets
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def successors(self, v: int) -> list[int]:
+        return self.targets[self.offsets[v]:self.offsets[v + 1]]
+
+    def reachable_from(self, sources: Iterable[str]) -> bytearray:
+        """Mark every vertex reachable from `sources` (iterative DFS)."""
+        offsets, targets = self.offsets, self.targets
+        seen = bytearray(len(self.ids))
+        stack = [self.index[s] for s in sources if s in self.index]
+        for v in stack:
+            seen[v] = 1
+        while stack:
+            v = stack.pop()
+            for pos in range(offsets[v], offsets[v + 1]):
+                w = targets[pos]
+                if not seen[w]:
+                    seen[w] = 1
+                    stack.append(w)
+        return seen
+
+    def strongly_connected_components(self) -> tuple[list[int], list[list[int]]]:
+        """
+        Iterative Tarjan. Returns (component id per vertex, members per component);
+        components come out in reverse topological order.
+        """
+        n = len(self.ids)
+        offsets, targets = self.offsets, self.targets
+        order = [-1] * n
+        low = [0] * n
+        on_stack = bytearray(n)
+        component_of = [-1] * n
+        components: list[list[int]] = []
+        stack: list[int] = []
+        counter = 0
+
+        for root in range(n):
+            if order[root] != -1:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            # Explicit call stack of (vertex, next edge position)
+            work = [(root, offsets[root])]
+            while work:
+                v, pos = work[-1]
+                end = offsets[v + 1]
+                descended = False
+                while pos < end:
+                    w = targets[pos]
+                    pos += 1
+                    if order[w] == -1:
+                        work[-1] = (v, pos)
+                        order[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = 1
+                        work.append((w, offsets[w]))
+                        descended = True
+                        break
+                    if on_stack[w] and order[w] < low[v]:
+                        low[v] = order[w]
+                if descended:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[v] < low[parent]:
+                        low[parent] = low[v]
+                if low[v] == order[v]:
+                    cid = len(components)
+                    members = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        component_of[w] = cid
+                        members.append(w)
+                        if w == v:
+                            break
+                    components.append(members)
+
+        return component_of, components
+
+    def analyze(self, start: Iterable[str], terminals: Iterable[str] = ()) -> GraphReport:
+        """
+        Reachability, SCCs and per-component exits in one sweep over the edges.
+
+        Dead ends are reachable, non-terminal vertices without outgoing edges;
+        unreachable terminals are terminal vertices the start cannot reach.
+        Closed cycles are cyclic components with no exit and no terminal.
+        """
+        ids, offsets, targets = self.ids, self.offsets, self.targets
+        reachable = self.reachable_from(start)
+        component_of, components = self.strongly_connected_components()
+        terminal = bytearray(len(ids))
+        for node_id in terminals:
+            v = self.index.get(node_id)
+            if v is not None:
+                terminal[v] = 1
+
+        report = GraphReport(
+            ids=ids,
+            reachable=reachable,
+            component_of=component_of,
+            components=components,
+        )
+        exits = report.component_exits
+        for cid, members in enumerate(components):
+            if len(members) > 1 or members[0] in self.successors(members[0]):
+                exits[cid] = set()
+
+        for v in range(len(ids)):
+            begin, end = offsets[v], offsets[v + 1]
+            if begin == end and reachable[v] and not terminal[v]:
+                report.dead_ends.append(ids[v])
+            if not reachable[v]:
+                if terminal[v]:
+                    report.unreachable_terminals.append(ids[v])
+                else:
+                    report.unreachable.append(ids[v])
+            cid = component_of[v]
+            component_exits = exits.get(cid)
+            if component_exits is None:
+                continue
+            for pos in range(begin, end):
+                w = targets[pos]
+                if component_of[w] != cid:
+                    component_exits.add(ids[w])
+
+        for cid, component_exits in exits.items():
+            members = components[cid]
+            if not component_exits and not any(terminal[v] for v in members):
+                report.closed_cycles.append(sorted(ids[v] for v in members))
+        return report
@@ -0,0 +1,100 @@
+"""
+Incremental parsing of streamed JSON objects.
+
+Model output arrives token by token and is not always clean: it may be wrapped
+in prose or code fences, and it may stop early. JSONObjectStream scans the
+text as it arrives and hands back each top-level member of the first JSON
+object as soon as its value closes, so callers can act on complete sections
+without waiting for (or depending on) the rest of the document.
+"""
+
+import json
+from typing import Any
+
+# A value that ends on one of these cannot have been cut short; a number can.
+_CLOSED_VALUE_ENDINGS = ("}", "]", '"', "true", "false", "null")
+
+
+class JSONObjectStream:
+    """
+    Feed text chunks; get back (key, value) pairs of the top-level object as they complete.
+
+    Text before the opening brace is ignored, a member that fails to parse is
+    skipped without affecting the others, and anything after the closing brace
+    is ignored. `finish()` salvages a last member that is complete but was never
+    followed by the closing brace; a trailing bare number is dropped, since the
+    stream may have been cut off partway through its digits.
+    """
+    __slots__ = ("_buffer", "_pos", "_depth", "_in_string", "_escape", "_member_start", "done")
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member_start: int | None = None
+        self.done = False
+
+    def feed(self, text: str) -> list[tuple[str, Any]]:
+        if self.done or not text:
+            return []
+        self._buffer += text
+        buffer = self._buffer
+        members: list[tuple[str, Any]] = []
+        i = self._pos
+        end = len(buffer)
+        while i < end:
+            ch = buffer[i]
+            if self._member_start is None:
+                # Skip prose and code fences up to the opening brace.
+                if ch == "{":
+                    self._depth = 1
+                    self._member_start = i + 1
+                i += 1
+                continue
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(buffer[self._member_start:i], members)
+                    self.done = True
+                    break
+            elif ch == "," and self._depth == 1:
+                self._emit(buffer[self._member_start:i], members)
+                self._member_start = i + 1
+            i += 1
+        self._pos = i
+        return members
+
+    def finish(self) -> list[tuple[str, Any]]:
+        """End of input: return the trailing member if it is complete on its own."""
+        if self.done or self._member_start is None:
+            return []
+        self.done = True
+        members: list[tuple[str, Any]] = []
+        text = self._buffer[self._member_start:].rstrip()
+        if text.endswith(_CLOSED_VALUE_ENDINGS):
+            self._emit(text, members)
+        return members
+
+    @staticmethod
+    def _emit(text: str, members: list[tuple[str, Any]]) -> None:
+        text = text.strip()
+        if not text:
+            return
+        try:
+            member = json.loads("{" + text + "}")
+        except ValueError:
+            return
+        members.extend(member.items())
@@ -3,12 +3,23 @@
 from pathlib import Path
 from typing import Any
 from copy import deepcopy
+import asyncio
+import hashlib
+import threading
 import yaml
 
 from app.models import GameDefinition
 from app.core.validator import GameValidator
 from app.core.settings import GameSettings
 
+# libyaml's C loader parses several times faster; PyYAML without it falls back to pure Python.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _parse_yaml(source: bytes | str) -> Any:
+    return yaml.load(source, Loader=_YAML_LOADER) or {}
+
+
 _ALLOWED_ROOT_KEYS: set[str] = {
     "meta",
     "narration",
@@ -45,6 +56,9 @@ class GameLoader:
             self.games_dir = games_dir
         else:
             self.games_dir = Path(self.settings.games_path)
+        # Parsed YAML per file, keyed by (mtime_ns, size), so reloading a game
+        # only re-parses the files that changed.
+        self._sources: dict[Path, tuple[tuple[int, int], Any, str]] = {}
 
     def load_game(self, game_id: str) -> GameDefinition:
         """
@@ -63,9 +77,14 @@ class GameLoader:
             raise ValueError(f"Game '{game_id}' not found or does not contain a game.yaml manifest.")
 
         # Load the main game manifest (game.yaml)
-        manifest_data = self._load_yaml(game_path / "game.yaml")
+        manifest_data, manifest_digest = self._read_source(game_path / "game.yaml")
         self._validate_root_keys(manifest_data, "game.yaml")
 
+        # Digest of every file contributing to each root key, in merge order; the
+        # validator uses them to skip sections whose inputs did not change.
+        contributions: dict[str, list[str]] = {}
+        self._record_contribution(contributions, manifest_data, "game.yaml", manifest_digest)
+
         # The manifest data itself becomes the base for the final game definition
         game_data = self._clone(manifest_data)
 
@@ -107,16 +126,18 @@ class GameLoader:
             except ValueError:
                 raise ValueError(f"Invalid include file path: '{include_file}'")
             if file_path.exists():
-                included_content = self._load_yaml(file_path)
+                included_content, digest = self._read_source(file_path)
                 self._validate_root_keys(included_content, include_file)
 
                 if "includes" in included_content:
                     raise ValueError(
                         f"Nested includes detected in '{include_file}'. Nested includes are not supported."
                     )
+                self._record_contribution(contributions, included_content, include_file, digest)
 
                 try:
-                    game_data = self._merge_dicts(game_data, included_content)
+                    # Merge a copy: the parsed content stays cached for the next reload.
+                    game_data = self._merge_dicts(game_data, self._clone(included_content))
                 except ValueError as e:
                     raise ValueError(f"Error merging included file '{include_file}': {e}")
             else:
@@ -133,7 +154,14 @@ class GameLoader:
         game_def = GameDefinition(**game_data)
 
         # Perform an integrity validation pass
-        GameValidator(game_def).validate()
+        content_digests = {
+            key: hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+            for key, parts in contributions.items()
+        }
+        empty = hashlib.blake2b(b"", digest_size=16).hexdigest()
+        for key in game_data:
+            content_digests.setdefault(key, empty)
+        GameValidator(game_def, content_digests=content_digests).validate()
 
         return game_def
 
@@ -167,14 +195,35 @@ class GameLoader:
                 print(f"Warning: Could not load manifest for game '{game_dir.name}': {exc}")
         return games
 
+    def _read_source(self, path: Path) -> tuple[Any, str]:
+        """Parse a game file, reusing the previous parse while the file is unchanged."""
+        if not path.exists():
+            raise FileNotFoundError(f"Required file not found: {path}")
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._sources.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1], cached[2]
+
+        raw = path.read_bytes()
+        data = _parse_yaml(raw)
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        self._sources[path] = (stamp, data, digest)
+        return data, digest
+
+    @staticmethod
+    def _record_contribution(contributions: dict[str, list[str]], data: dict[str, Any], source: str, digest: str) -> None:
+        """Note the file's content hash against every root key it defines."""
+        for key in data:
+            contributions.setdefault(key, []).append(f"{source}:{digest}")
+
     @staticmethod
     def _load_yaml(path: Path) -> Any:
         """Load a YAML file."""
         if not path.exists():
             raise FileNotFoundError(f"Required file not found: {path}")
 
-        with open(path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
+        return _parse_yaml(path.read_bytes())
 
     @classmethod
     def _merge_dicts(
@@ -299,3 +348,92 @@ class GameLoader:
                 "Allowed keys: "
                 + ", ".join(sorted(_ALLOWED_ROOT_KEYS))
             )
+
+
+class GameCache:
+    """
+    Per-process cache of loaded and validated game definitions.
+
+    Each worker loads a game once and shares the GameDefinition (and the lookup
+    index and compiled effect programs hanging off it) across all sessions it
+    serves. Entries are fingerprinted by the game's YAML files, so editing a
+    game on disk invalidates it without restarting the worker. Each game loads
+    under its own lock: concurrent requests for one game share a single load,
+    while other games load in parallel.
+    """
+
+    def __init__(self, loader: GameLoader | None = None):
+        self.loader = loader or GameLoader()
+        self._entries: dict[str, tuple[tuple, GameDefinition]] = {}
+        # Guards the two dicts; held only briefly, never during a load.
+        self._lock = threading.Lock()
+        self._game_locks: dict[str, threading.Lock] = {}
+
+    def get(self, game_id: str) -> GameDefinition:
+        fingerprint = self._fingerprint(game_id)
+        with self._game_lock(game_id):
+            with self._lock:
+                cached = self._entries.get(game_id)
+            if cached and cached[0] == fingerprint:
+                return cached[1]
+            game_def = self.loader.load_game(game_id)
+            with self._lock:
+                self._entries[game_id] = (fingerprint, game_def)
+            return game_def
+
+    async def aget(self, game_id: str) -> GameDefinition:
+        """get() on a worker thread, so loading a game never blocks the event loop."""
+        return await asyncio.to_thread(self.get, game_id)
+
+    def refresh(self) -> dict[str, GameDefinition]:
+        """
+        Reload every cached game whose files changed on disk.
+
+        Returns the new definitions by game id. A game that fails to load keeps
+        its previous definition (and is retried on the next refresh).
+        """
+        with self._lock:
+            game_ids = list(self._entries)
+        reloaded: dict[str, GameDefinition] = {}
+        for game_id in game_ids:
+            fingerprint = self._fingerprint(game_id)
+            with self._game_lock(game_id):
+                with self._lock:
+                    cached = self._entries.get(game_id)
+                if cached is None or cached[0] == fingerprint:
+                    continue
+                try:
+                    game_def = self.loader.load_game(game_id)
+                except (ValueError, OSError, yaml.YAMLError) as exc:
+                    print(f"Warning: Could not reload game '{game_id}': {exc}")
+                    continue
+                with self._lock:
+                    self._entries[game_id] = (fingerprint, game_def)
+            reloaded[game_id] = game_def
+        return reloaded
+
+    def invalidate(self, game_id: str | None = None) -> None:
+        with self._lock:
+            if game_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(game_id, None)
+
+    def _game_lock(self, game_id: str) -> threading.Lock:
+        with self._lock:
+            lock = self._game_locks.get(game_id)
+            if lock is None:
+                lock = self._game_locks[game_id] = threading.Lock()
+            return lock
+
+    def _fingerprint(self, game_id: str) -> tuple:
+        game_path = self.loader.games_dir / game_id
+        try:
+            files = sorted(game_path.rglob("*.yaml"))
+        except OSError:
+            return ()
+        entries = []
+        for path in files:
+            stat = path.stat()
+            entries.append((str(path.relative_to(game_path)), stat.st_mtime_ns, stat.st_size))
+        return tuple(entries)
@@ -1,51 +1,235 @@
 """
 Centralized logging configuration for PlotPlay.
+
+Session loggers never touch the filesystem themselves: they hand records to a
+shared QueueHandler, and a single QueueListener thread writes them to
+per-session segment files (<SESSION_LOG_DIR>/session_<id>.log, rotated into
+.log.1, .log.2 ... past a size limit). The writer keeps a bounded number of files open and
+closes a session's file as soon as the session is closed, so neither latency
+on the event loop nor file descriptors grow with the number of sessions.
+
+Log files are only ever appended to, so a session evicted and rehydrated later,
+or played by several workers, keeps its whole log. A log is truncated only when
+its session is created (`start_session_log`).
 """
 
+import atexit
 import logging
+import queue
+import sys
+import threading
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import TextIO
+
+from app.core.settings import GameSettings
+
+LOGS_DIR = Path(GameSettings().session_log_dir)
+
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
+def session_log_path(session_id: str) -> Path:
+    return LOGS_DIR / f"session_{session_id}.log"
+
+
+class _SessionLogWriter(logging.Handler):
+    """Runs on the listener thread: appends each record to its session's segment file."""
+
+    def __init__(self, max_bytes: int, backups: int, max_open: int):
+        super().__init__(logging.DEBUG)
+        self.setFormatter(_FORMATTER)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.max_open = max(1, max_open)
+        self._files: OrderedDict[str, TextIO] = OrderedDict()
+        self._failed: set[str] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        session_id = record.name
+        if getattr(record, "close_session", False):
+            self._close(session_id)
+            self._failed.discard(session_id)
+            return
+        if getattr(record, "start_session", False):
+            self._close(session_id)
+            self._failed.discard(session_id)
+            try:
+                self._open(session_id, "w")
+            except OSError as e:
+                print(f"⚠️  WARNING: Cannot start log file for session {session_id}: {e}")
+            return
+        message = self.format(record) + "\n"
+        if session_id in self._failed:
+            sys.stderr.write(message)
+            return
+        try:
+            stream = self._open(session_id)
+            if self.max_bytes and stream.tell() + len(message) > self.max_bytes:
+                stream = self._rotate(session_id)
+            stream.write(message)
+            stream.flush()
+        except (PermissionError, OSError) as e:
+            # Fall back to console output if file logging fails
+            print(f"⚠️  WARNING: Cannot write log file for session {session_id}: {e}")
+            print(f"⚠️  Falling back to console logging")
+            self._failed.add(session_id)
+            self._close(session_id)
+            sys.stderr.write(message)
+
+    def close(self) -> None:
+        for session_id in list(self._files):
+            self._close(session_id)
+        super().close()
+
+    def _open(self, session_id: str, mode: str = "a") -> TextIO:
+        stream = self._files.get(session_id)
+        if stream is not None:
+            self._files.move_to_end(session_id)
+            return stream
+        while len(self._files) >= self.max_open:
+            _, idle = self._files.popitem(last=False)
+            idle.close()
+        LOGS_DIR.mkdir(exist_ok=True)
+        stream = open(session_log_path(session_id), mode, encoding="utf-8")
+        self._files[session_id] = stream
+        return stream
+
+    def _rotate(self, session_id: str) -> TextIO:
+        self._close(session_id)
+        path = session_log_path(session_id)
+        if self.backups > 0:
+            for i in range(self.backups - 1, 0, -1):
+                older = path.with_name(f"{path.name}.{i}")
+                if older.exists():
+                    older.replace(path.with_name(f"{path.name}.{i + 1}"))
+            path.replace(path.with_name(f"{path.name}.1"))
+        return self._open(session_id, "w")
+
+    def _close(self, session_id: str) -> None:
+        stream = self._files.pop(session_id, None)
+        if stream is not None:
+            stream.close()
+
+
+class _DebugSampler(logging.Filter):
+    """Keeps one DEBUG record in every `interval`; other levels always pass."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.interval = max(1, round(1 / rate)) if rate > 0 else 0
+        self._seen = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno != logging.DEBUG:
+            return True
+        if not self.interval:
+            return False
+        self._seen += 1
+        return (self._seen - 1) % self.interval == 0
 
-def setup_session_logger(session_id: str) -> logging.Logger:
+
+_lock = threading.Lock()
+_queue: queue.SimpleQueue = queue.SimpleQueue()
+_handler = QueueHandler(_queue)
+_listener: QueueListener | None = None
+# Session loggers live here rather than in logging's global registry, so closing
+# a session can drop its logger.
+_session_loggers: dict[str, logging.Logger] = {}
+
+
+def _queue_handler() -> QueueHandler:
+    """The shared handler of every session logger; starts the writer thread on first use."""
+    global _listener
+    with _lock:
+        if _listener is None:
+            settings = GameSettings()
+            writer = _SessionLogWriter(
+                max_bytes=settings.session_log_max_bytes,
+                backups=settings.session_log_backups,
+                max_open=settings.session_log_max_open,
+            )
+            _listener = QueueListener(_queue, writer)
+            _listener.start()
+    return _handler
+
+
+def setup_session_logger(
+    session_id: str,
+    *,
+    level: str | int | None = None,
+    debug_sample_rate: float | None = None,
+) -> logging.Logger:
     """
     Creates and configures a logger for a specific game session.
 
     Args:
         session_id: The unique identifier for the game session.
+        level: Minimum level recorded for this session (defaults to SESSION_LOG_LEVEL).
+        debug_sample_rate: Fraction of DEBUG records kept (defaults to SESSION_LOG_DEBUG_SAMPLE_RATE).
 
     Returns:
-        A configured logger instance that writes to a session-specific file.
+        A configured logger instance whose records are written to a
+        session-specific file by the background log writer.
     """
-    # Create a logs directory if it doesn't exist
-    logs_dir = Path("logs")
-    logs_dir.mkdir(exist_ok=True)
-
-    # Create a specific logger for this session
-    logger = logging.getLogger(session_id)
-    logger.setLevel(logging.DEBUG)  # Capture all levels of messages
+    settings = GameSettings()
+    with _lock:
+        logger = _session_loggers.get(session_id)
+        if logger is None:
+            logger = _session_loggers[session_id] = logging.Logger(session_id)
+    logger.setLevel(level if level is not None else settings.session_log_level)
 
     # Prevent logs from propagating to the root logger
     logger.propagate = False
 
     # Avoid adding handlers if they already exist (e.g., on engine reload)
     if not logger.handlers:
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-
-        # Create a file handler to write logs to a session-specific file
-        try:
-            file_handler = logging.FileHandler(logs_dir / f"session_{session_id}.log", mode='w')
-            file_handler.setLevel(logging.DEBUG)
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
-        except (PermissionError, OSError) as e:
-            # Fall back to console output if file logging fails
-            print(f"⚠️  WARNING: Cannot write log file for session {session_id}: {e}")
-            print(f"⚠️  Falling back to console logging")
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.DEBUG)
-            console_handler.setFormatter(formatter)
-            logger.addHandler(console_handler)
+        logger.addHandler(_queue_handler())
+        rate = settings.session_log_debug_sample_rate if debug_sample_rate is None else debug_sample_rate
+        if rate < 1:
+            logger.addFilter(_DebugSampler(rate))
 
     return logger
+
+
+def start_session_log(session_id: str) -> None:
+    """Start a new session's log afresh, truncating any file left under its id. Call before logging to it."""
+    _queue_handler()
+    _queue.put_nowait(logging.makeLogRecord({"name": session_id, "start_session": True}))
+
+
+def close_session_logger(session_id: str) -> None:
+    """
+    Detach a session's logger and close its log file once queued records are written.
+
+    Dropping it from the registry lets an evicted session's logger be collected.
+    Anything still holding the old logger logs into a NullHandler.
+    """
+    with _lock:
+        logger = _session_loggers.pop(session_id, None)
+    if logger is None:
+        return
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    for log_filter in list(logger.filters):
+        logger.removeFilter(log_filter)
+    logger.addHandler(logging.NullHandler())
+    _queue.put_nowait(logging.makeLogRecord({"name": session_id, "close_session": True}))
+
+
+def shutdown_session_logging() -> None:
+    """Write out queued records and close every session log file (the writer restarts on next use)."""
+    global _listener
+    with _lock:
+        listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(shutdown_session_logging)
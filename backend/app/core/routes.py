@@ -0,0 +1,181 @@
+"""
+Travel planning between zones.
+
+The zone connection graph is compiled once per game definition into per-method
+edge weights in minutes. Shortest routes are found with Dijkstra from each
+origin the first time it is queried and then cached, so repeated travel-time
+queries are dictionary lookups.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.models.game import GameDefinition
+    from app.models.locations import TravelMethod
+    from app.models.time import Time
+
+
+def movement_minutes(time: Time, category: str | None) -> int:
+    """Minutes for a movement time category, falling back to the movement, then the default, category."""
+    categories = time.categories or {}
+    defaults = time.defaults
+    resolved = category or defaults.movement
+    if resolved in categories:
+        return int(categories[resolved])
+    return int(categories.get(defaults.movement, categories.get(defaults.default, 0)))
+
+
+@dataclass(frozen=True, slots=True)
+class Route:
+    """A travel route: the zones passed through (origin first) and its total time."""
+    zones: tuple[str, ...]
+    minutes: int
+    method: str
+
+
+class TravelPlanner:
+    """Shortest zone-to-zone routes for each travel method of a game."""
+
+    def __init__(self, game: GameDefinition):
+        self.methods: dict[str, TravelMethod] = {method.name: method for method in game.movement.methods}
+        self._time = game.time
+
+        zone_ids = [zone.id for zone in game.zones]
+        # edges[method][zone] -> [(neighbour, minutes)], keeping the cheapest connection per neighbour
+        self.edges: dict[str, dict[str, list[tuple[str, float]]]] = {}
+        for name, method in self.methods.items():
+            rate = self._minutes_per_unit(method)
+            by_zone: dict[str, list[tuple[str, float]]] = {}
+            for zone in game.zones:
+                best: dict[str, float] = {}
+                for conn in zone.connections or []:
+                    if conn.methods and name not in conn.methods:
+                        continue
+                    targets = zone_ids if "all" in (conn.to or []) else (conn.to or [])
+                    distance = conn.distance if conn.distance is not None else 1.0
+                    for target in targets:
+                        if target == zone.id or (conn.exceptions and target in conn.exceptions):
+                            continue
+                        minutes = distance * rate
+                        if minutes < best.get(target, math.inf):
+                            best[target] = minutes
+                by_zone[zone.id] = list(best.items())
+            self.edges[name] = by_zone
+
+        # (method, origin) -> (minutes to each zone, predecessor of each zone)
+        self._tables: dict[tuple[str, str], tuple[dict[str, float], dict[str, str]]] = {}
+        self._routes: dict[tuple[str, str, str], Route | None] = {}
+
+    @classmethod
+    def for_game(cls, game: GameDefinition) -> TravelPlanner:
+        """The planner compiled for a game definition, shared by all its sessions."""
+        index = game.index
+        if index.travel_planner is None:
+            index.travel_planner = cls(game)
+        return index.travel_planner
+
+    # ------------------------------------------------------------------ #
+    # Queries
+    # ------------------------------------------------------------------ #
+    def resolve_method(self, name: str | None) -> TravelMethod | None:
+        """The method used for `name` (walk, then the first method, by default); None if inactive."""
+        chosen = self.methods.get(name or "walk") or next(iter(self.methods.values()), None)
+        if not chosen or chosen.active is False:
+            return None
+        return chosen
+
+    def route(
+        self,
+        origin: str,
+        destination: str,
+        method: str | None = None,
+        *,
+        blocked: Callable[[str], bool] | None = None,
+    ) -> Route | None:
+        """
+        Cheapest route between two zones, or None when unreachable.
+
+        `blocked` marks zones that cannot be passed through right now (locks,
+        access conditions); a cached route crossing one is re-planned around it.
+        """
+        chosen = self.resolve_method(method)
+        if not chosen:
+            return None
+        if origin == destination:
+            # Travelling within a zone costs one distance unit
+            return Route(zones=(origin,), minutes=self._round(self._minutes_per_unit(chosen)), method=chosen.name)
+
+        key = (chosen.name, origin, destination)
+        if key not in self._routes:
+            self._routes[key] = self._build_route(chosen.name, origin, destination, self._table(chosen.name, origin))
+        route = self._routes[key]
+        if route and blocked and any(blocked(zone_id) for zone_id in route.zones[1:-1]):
+            table = self._dijkstra(chosen.name, origin, blocked)
+            route = self._build_route(chosen.name, origin, destination, table)
+        return route
+
+    def travel_minutes(self, origin: str, destination: str, method: str | None = None) -> int | None:
+        route = self.route(origin, destination, method)
+        return route.minutes if route else None
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+    def _table(self, method: str, origin: str) -> tuple[dict[str, float], dict[str, str]]:
+        key = (method, origin)
+        table = self._tables.get(key)
+        if table is None:
+            table = self._tables[key] = self._dijkstra(method, origin)
+        return table
+
+    def _dijkstra(
+        self, method: str, origin: str, blocked: Callable[[str], bool] | None = None
+    ) -> tuple[dict[str, float], dict[str, str]]:
+        edges = self.edges.get(method, {})
+        dist: dict[str, float] = {origin: 0.0}
+        prev: dict[str, str] = {}
+        heap = [(0.0, origin)]
+        while heap:
+            minutes, zone_id = heapq.heappop(heap)
+            if minutes > dist[zone_id]:
+                continue
+            if zone_id != origin and blocked and blocked(zone_id):
+                continue  # may be a destination, but not a waypoint
+            for target, cost in edges.get(zone_id, ()):
+                total = minutes + cost
+                if total < dist.get(target, math.inf):
+                    dist[target] = total
+                    prev[target] = zone_id
+                    heapq.heappush(heap, (total, target))
+        return dist, prev
+
+    def _build_route(
+        self, method: str, origin: str, destination: str, table: tuple[dict[str, float], dict[str, str]]
+    ) -> Route | None:
+        dist, prev = table
+        if destination not in dist:
+            return None
+        zones = [destination]
+        while zones[-1] != origin:
+            zones.append(prev[zones[-1]])
+        zones.reverse()
+        return Route(zones=tuple(zones), minutes=self._round(dist[destination]), method=method)
+
+    def _minutes_per_unit(self, method: TravelMethod) -> float:
+        if method.time_cost is not None:
+            return float(method.time_cost)
+        if method.speed is not None:
+            return 60.0 / method.speed
+        if method.category:
+            return float(movement_minutes(self._time, method.category))
+        return 0.0
+
+    @staticmethod
+    def _round(minutes: float) -> int:
+        return max(0, int(math.floor(minutes + 0.5)))
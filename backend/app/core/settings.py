@@ -3,6 +3,7 @@ PlotPlay game settings
 """
 
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -12,10 +13,89 @@ from app.core.env import BACKEND_DIR, DEFAULT_GAMES_PATH, ENV_FILE_PATH
 
 class GameSettings(BaseSettings):
     games_path: Path = Field(default=DEFAULT_GAMES_PATH)
+    games_hot_reload: bool = Field(
+        default=False,
+        description="Dev mode: watch game files and swap edited definitions into live sessions"
+    )
+    games_reload_interval_ms: int = Field(default=500, description="How often hot reload checks game files")
     memory_summary_interval: int = Field(
         default=3,
         description="Number of AI-powered turns between narrative summary updates"
     )
+    summary_queue_size: int = Field(
+        default=32,
+        description="Background summary jobs that may wait; past this, refreshes are skipped until a later turn"
+    )
+    summary_workers: int = Field(default=2, description="Background summary jobs run concurrently")
+    memory_recall_k: int = Field(
+        default=4,
+        description="Long-term memories retrieved into the writer prompt each turn (0 disables retrieval)"
+    )
+    memory_entry_chars: int = Field(default=280, description="Longest memory quoted in the writer prompt")
+    memory_chunk_chars: int = Field(default=600, description="Longest digest when a day or arc is folded into one memory")
+    memory_history_limit: int = Field(
+        default=50,
+        description="Narratives kept verbatim in narrative_history; older scenes live on in the memory store"
+    )
+    memory_log_limit: int = Field(
+        default=20,
+        description="Recent memories kept per character in memory_log; older ones live on in the memory store"
+    )
+    session_store: Literal["memory", "sqlite"] = Field(
+        default="sqlite",
+        description="Where session state is persisted between requests and restarts"
+    )
+    session_db_path: Path = Field(default=BACKEND_DIR / "data" / "sessions.sqlite3")
+    session_fsync: Literal["off", "normal", "full"] = Field(
+        default="normal",
+        description="SQLite synchronous policy for session writes"
+    )
+    session_flush_interval_ms: int = Field(
+        default=50,
+        description="Group-commit window for write-behind session persistence"
+    )
+    session_flush_batch: int = Field(default=64, description="Sessions per group commit before flushing early")
+    session_lease_ttl_s: float = Field(
+        default=120.0,
+        description="How long a worker may hold a session before another worker can take it over"
+    )
+    session_lease_wait_s: float = Field(
+        default=10.0,
+        description="How long a request waits for a busy session before answering 409"
+    )
+    session_turn_queue: int = Field(
+        default=4,
+        description="Requests that may wait behind a session's running turn in one worker before answering 429"
+    )
+    max_live_sessions: int = Field(
+        default=1000,
+        description="Engines kept in memory per worker; older sessions are evicted and rehydrated on demand"
+    )
+    session_log_dir: str = Field(default="logs", description="Directory session log files are written to")
+    session_log_level: str = Field(default="DEBUG", description="Minimum level written to session log files")
+    session_log_debug_sample_rate: float = Field(
+        default=1.0,
+        description="Fraction of DEBUG records kept in session logs (e.g. 0.1 keeps one in ten)"
+    )
+    session_log_max_bytes: int = Field(
+        default=5_000_000,
+        description="Size at which a session log rolls over into a new segment (0 disables rotation)"
+    )
+    session_log_backups: int = Field(default=2, description="Rotated segments kept per session log")
+    session_log_max_open: int = Field(default=64, description="Session log files the log writer keeps open")
+    stream_flush_interval_ms: int = Field(
+        default=30,
+        description="How long streamed narrative tokens are coalesced before a frame is sent"
+    )
+    stream_flush_bytes: int = Field(default=256, description="Buffered narrative size that sends a frame early")
+    stream_keepalive_s: float = Field(
+        default=15.0,
+        description="Idle time after which a keep-alive comment is sent on event streams (0 disables)"
+    )
+    checker_timeout_s: float = Field(
+        default=20.0,
+        description="Time allowed for the checker reply; sections completed before the deadline are kept"
+    )
 
     model_config = SettingsConfigDict(env_file=str(ENV_FILE_PATH), extra="ignore")
 
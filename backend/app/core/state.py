@@ -3,12 +3,203 @@
 from __future__ import annotations
 
 import copy
+import dataclasses
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Callable
 
 from app.models import (GameDefinition, GameState, ZoneState, LocationState,
                         TimeState, ArcState, CharacterState, InventoryState, ClothingState)
 
+_MISSING = object()
+
+
+class StateJournal:
+    """
+    Undo log for GameState mutations.
+
+    Services record the previous value of whatever they are about to write
+    (a dict key, an attribute, a set member, a list length or a whole small
+    container) while a transaction is open. Rolling back replays the log in reverse, so the cost
+    is proportional to the number of recorded mutations rather than to the
+    size of the state. Outside a transaction every record call is a no-op.
+    """
+
+    def __init__(self) -> None:
+        self._undo: list[Callable[[], None]] = []
+        self._touched: set[int] = set()
+        self._refs: list[Any] = []
+        self.active = False
+        self.transaction = 0
+
+    # ------------------------------------------------------------------ #
+    # Transaction control
+    # ------------------------------------------------------------------ #
+    def begin(self, state: GameState) -> int:
+        """
+        Open a transaction and return its id.
+        Nothing is copied up front: writers record what they overwrite as they go.
+        """
+        self._reset()
+        self.active = True
+        self.transaction += 1
+        return self.transaction
+
+    def savepoint(self) -> int:
+        """Return a marker that rollback() can unwind to without closing the transaction."""
+        # Containers captured before the savepoint must be recorded again if touched after it.
+        self._touched.clear()
+        return len(self._undo)
+
+    def rollback(self, savepoint: int | None = None) -> int:
+        """Undo mutations recorded after `savepoint` (or the whole transaction). Returns the undo count."""
+        target = savepoint or 0
+        undone = 0
+        while len(self._undo) > target:
+            self._undo.pop()()
+            undone += 1
+        if savepoint is None:
+            self._reset()
+        else:
+            self._touched.clear()
+        return undone
+
+    def commit(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        self._undo.clear()
+        self._touched.clear()
+        self._refs.clear()
+        self.active = False
+
+    # ------------------------------------------------------------------ #
+    # Recording
+    # ------------------------------------------------------------------ #
+    def record_item(self, container: dict, key: Any) -> None:
+        """Record the current value of `container[key]` (or its absence)."""
+        if not self.active or id(container) in self._touched:
+            return
+        old = container.get(key, _MISSING)
+
+        def undo() -> None:
+            if old is _MISSING:
+                container.pop(key, None)
+            else:
+                container[key] = old
+
+        self._undo.append(undo)
+
+    def record_attr(self, obj: Any, name: str) -> None:
+        """Record the current value of `obj.<name>`."""
+        if not self.active or id(obj) in self._touched:
+            return
+        old = getattr(obj, name, _MISSING)
+
+        def undo() -> None:
+            if old is _MISSING:
+                if hasattr(obj, name):
+                    delattr(obj, name)
+            else:
+                setattr(obj, name, old)
+
+        self._undo.append(undo)
+
+    def record_append(self, items: list) -> None:
+        """Record the length of a list that is about to be appended to."""
+        if not self.active or id(items) in self._touched:
+            return
+        length = len(items)
+        self._undo.append(lambda: items.__delitem__(slice(length, None)))
+
+    def record_add(self, items: set, value: Any) -> None:
+        """Record that `value` is about to be added to a set."""
+        if not self.active or id(items) in self._touched or value in items:
+            return
+        self._undo.append(lambda: items.discard(value))
+
+    def record_discard(self, items: set, value: Any) -> None:
+        """Record that `value` is about to be removed from a set."""
+        if not self.active or id(items) in self._touched or value not in items:
+            return
+        self._undo.append(lambda: items.add(value))
+
+    def record_remove(self, items: list, value: Any) -> None:
+        """Record the position of the first `value` in a list it is about to be removed from."""
+        if not self.active or id(items) in self._touched or value not in items:
+            return
+        position = items.index(value)
+        self._undo.append(lambda: items.insert(position, value))
+
+    def touch(self, obj: Any) -> None:
+        """Capture a container or state dataclass (and everything mutable inside it) once per transaction."""
+        if not self.active or obj is None or id(obj) in self._touched:
+            return
+        self._capture(obj)
+
+    def _capture(self, obj: Any) -> None:
+        if id(obj) in self._touched:
+            return
+        if isinstance(obj, dict):
+            saved = dict(obj)
+            children = list(saved.values())
+            self._undo.append(lambda: (obj.clear(), obj.update(saved)))
+        elif isinstance(obj, list):
+            saved_list = list(obj)
+            children = saved_list
+            self._undo.append(lambda: obj.__setitem__(slice(None), saved_list))
+        elif isinstance(obj, set):
+            saved_set = set(obj)
+            children = []
+            self._undo.append(lambda: (obj.clear(), obj.update(saved_set)))
+        elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            if hasattr(obj, "__dict__"):
+                attrs = dict(obj.__dict__)
+                self._undo.append(lambda: obj.__dict__.update(attrs))
+            else:
+                # Slotted state dataclass
+                attrs = {name: getattr(obj, name) for name in type(obj).__slots__}
+                self._undo.append(lambda: [object.__setattr__(obj, name, value) for name, value in attrs.items()])
+            children = list(attrs.values())
+        else:
+            return
+        self._touched.add(id(obj))
+        # Keep captured objects alive so their ids stay unique for the transaction.
+        self._refs.append(obj)
+        for child in children:
+            self._capture(child)
+
+    # ------------------------------------------------------------------ #
+    # Journaled writes
+    # ------------------------------------------------------------------ #
+    def set_item(self, container: dict, key: Any, value: Any) -> None:
+        self.record_item(container, key)
+        container[key] = value
+
+    def pop_item(self, container: dict, key: Any) -> Any:
+        self.record_item(container, key)
+        return container.pop(key, None)
+
+    def set_attr(self, obj: Any, name: str, value: Any) -> None:
+        self.record_attr(obj, name)
+        setattr(obj, name, value)
+
+    def append(self, items: list, value: Any) -> None:
+        self.record_append(items)
+        items.append(value)
+
+    def remove(self, items: list, value: Any) -> None:
+        self.record_remove(items, value)
+        items.remove(value)
+
+    def add(self, items: set, value: Any) -> None:
+        self.record_add(items, value)
+        items.add(value)
+
+    def discard(self, items: set, value: Any) -> None:
+        self.record_discard(items, value)
+        items.discard(value)
+
+
 class StateManager:
     """Manages game state initialization and high-level modifications."""
 
@@ -16,6 +207,7 @@ class StateManager:
         self.game_def = game_def
         self.index = game_def.index
         self.state = GameState()
+        self.journal = StateJournal()
         self._init_state()
 
     # ------------------------------------------------------------------ #
@@ -0,0 +1,81 @@
+"""
+Local lexical retrieval.
+
+BM25Index ranks short documents against a query with Okapi BM25 over
+lower-cased word tokens. It is built incrementally, lives in memory only and
+needs no network or model: it is derived data, rebuilt from whatever it was fed.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Callable, Iterable
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by do for from had has have he her hers him his i if in into is it its me my "
+    "no not of on or our she so than that the their them then there they this to up us was we were what when "
+    "which who will with you your".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased word tokens without stopwords, possessive 's or one-letter words."""
+    return [
+        token for token in _TOKEN.findall(text.lower().replace("'s", ""))
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+class BM25Index:
+    """Okapi BM25 over documents identified by integer ids."""
+    __slots__ = ("k1", "b", "_postings", "_lengths", "_total")
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        # term -> {doc_id: term frequency}
+        self._postings: dict[str, dict[int, int]] = {}
+        self._lengths: dict[int, int] = {}
+        self._total = 0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(self, doc_id: int, text: str) -> None:
+        if doc_id in self._lengths:
+            raise ValueError(f"Document {doc_id} is already indexed")
+        tokens = tokenize(text)
+        self._lengths[doc_id] = len(tokens)
+        self._total += len(tokens)
+        for term, tf in Counter(tokens).items():
+            self._postings.setdefault(term, {})[doc_id] = tf
+
+    def search(
+        self,
+        query: str | Iterable[str],
+        k: int,
+        *,
+        accept: Callable[[int], bool] | None = None,
+    ) -> list[tuple[int, float]]:
+        """The `k` best (doc_id, score) pairs for `query`, best first; documents matching no term are left out."""
+        if k <= 0 or not self._lengths:
+            return []
+        terms = set(tokenize(query) if isinstance(query, str) else query)
+        count = len(self._lengths)
+        avgdl = self._total / count or 1.0
+        scores: dict[int, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+            for doc_id, tf in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[doc_id] / avgdl)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], -item[0]))
+        if accept is not None:
+            ranked = [item for item in ranked if accept(item[0])]
+        return ranked[:k]
@@ -2,20 +2,58 @@
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
+import hashlib
+import threading
+from collections import Counter, OrderedDict, defaultdict
 from collections.abc import Mapping
 from typing import Any, Iterable, Sequence
 
+from app.core.conditions import parse_text_template
+from app.core.graph import GraphReport, IndexedGraph
 from app.models import GameDefinition, NodeType
 
 
+# Validation sections in report order: (name, method, GameDefinition fields it reads,
+# attributes it produces). Cross references go through the symbol tables built in
+# __init__, which are folded into every section's cache key.
+_SECTIONS: tuple[tuple[str, str, tuple[str, ...], tuple[str, ...]], ...] = (
+    ("start", "_validate_start_config", ("start",), ()),
+    ("time", "_validate_time", ("time", "movement"), ()),
+    ("uniqueness", "_validate_uniqueness", ("nodes", "events", "actions", "arcs", "characters", "items", "zones"), ()),
+    ("zones", "_validate_zones_and_locations", ("zones",), ()),
+    ("characters", "_validate_characters", ("characters",), ()),
+    ("items", "_validate_items_and_wardrobe", ("items", "wardrobe", "characters"), ()),
+    ("nodes", "_validate_nodes", ("nodes",), ()),
+    ("events", "_validate_events", ("events",), ()),
+    ("actions", "_validate_actions", ("actions",), ()),
+    ("modifiers", "_validate_modifiers", ("modifiers",), ()),
+    ("arcs", "_validate_arcs", ("arcs",), ()),
+    # Logical consistency checks
+    ("reachability", "_validate_node_reachability", ("start", "nodes", "events", "actions", "arcs"), ("node_graph",)),
+    ("zone_connectivity", "_validate_zone_connectivity", ("start", "zones"), ()),
+    ("outfits", "_validate_outfit_consistency", ("wardrobe", "characters"), ()),
+)
+
+# Section results keyed by content digest, shared by every validator in the process.
+_SECTION_CACHE: OrderedDict[str, tuple[tuple[str, ...], tuple[str, ...], dict[str, Any]]] = OrderedDict()
+_SECTION_CACHE_SIZE = 512
+_SECTION_CACHE_LOCK = threading.Lock()
+
+
 class GameValidator:
     """Performs a comprehensive integrity validation on a fully loaded GameDefinition."""
 
-    def __init__(self, game_def: GameDefinition):
+    def __init__(self, game_def: GameDefinition, content_digests: Mapping[str, str] | None = None):
+        """
+        :param content_digests: Optional digest of the source content behind each
+            top-level GameDefinition field (see GameLoader). When given, sections
+            whose inputs are unchanged since an earlier validation reuse its results.
+        """
         self.game = game_def
+        self.content_digests = content_digests
         self.errors: list[str] = []
         self.warnings: list[str] = []
+        self.cached_sections: list[str] = []
 
         # --- Collected IDs for cross-referencing ---
 
@@ -91,6 +129,9 @@ class GameValidator:
         # Time categories
         self.time_categories: set[str] = set(self.game.time.categories.keys()) if self.game.time.categories else set()
 
+        # Node transition graph analysis, filled in by validate()
+        self.node_graph: GraphReport | None = None
+
     # --------------------------------------------------------------------- #
     # Public API
     # --------------------------------------------------------------------- #
@@ -100,22 +141,35 @@ class GameValidator:
         Runs all validation checks.
         Raises a ValueError if any critical errors are found.
         """
-        self._validate_start_config()
-        self._validate_time()
-        self._validate_uniqueness()
-        self._validate_zones_and_locations()
-        self._validate_characters()
-        self._validate_items_and_wardrobe()
-        self._validate_nodes()
-        self._validate_events()
-        self._validate_actions()
-        self._validate_modifiers()
-        self._validate_arcs()
-
-        # Logical consistency checks
-        self._validate_node_reachability()
-        self._validate_zone_connectivity()
-        self._validate_outfit_consistency()
+        symbols = self._symbols_digest() if self.content_digests is not None else None
+        for name, method, fields, outputs in _SECTIONS:
+            key = self._section_key(name, fields, symbols) if symbols else None
+            if key is not None:
+                with _SECTION_CACHE_LOCK:
+                    cached = _SECTION_CACHE.get(key)
+                    if cached is not None:
+                        _SECTION_CACHE.move_to_end(key)
+                if cached is not None:
+                    errors, warnings, produced = cached
+                    self.errors.extend(errors)
+                    self.warnings.extend(warnings)
+                    for attr, value in produced.items():
+                        setattr(self, attr, value)
+                    self.cached_sections.append(name)
+                    continue
+
+            errors_before, warnings_before = len(self.errors), len(self.warnings)
+            getattr(self, method)()
+            if key is not None:
+                result = (
+                    tuple(self.errors[errors_before:]),
+                    tuple(self.warnings[warnings_before:]),
+                    {attr: getattr(self, attr) for attr in outputs},
+                )
+                with _SECTION_CACHE_LOCK:
+                    _SECTION_CACHE[key] = result
+                    if len(_SECTION_CACHE) > _SECTION_CACHE_SIZE:
+                        _SECTION_CACHE.popitem(last=False)
 
         if self.errors:
             error_summary = "\n - ".join(self.errors)
@@ -129,6 +183,40 @@ class GameValidator:
                 f"Game validation passed with {len(self.warnings)} warnings:\n - {warning_summary}"
             )
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget cached section results."""
+        with _SECTION_CACHE_LOCK:
+            _SECTION_CACHE.clear()
+
+    # --------------------------------------------------------------------- #
+    # Incremental validation helpers
+    # --------------------------------------------------------------------- #
+
+    def _section_key(self, name: str, fields: tuple[str, ...], symbols: str) -> str | None:
+        """Cache key for a section, or None when one of its inputs has no digest."""
+        digests = [self.content_digests.get(field) for field in fields]
+        if any(digest is None for digest in digests):
+            return None
+        return "|".join((name, symbols, *digests))
+
+    def _symbols_digest(self) -> str:
+        """Digest of the id tables every section resolves cross references against."""
+        tables = (
+            self.node_ids, self.ending_node_ids, self.event_ids, self.action_ids, self.arc_ids,
+            self.character_ids, self.behavior_gate_ids, self.item_ids, self.flag_ids,
+            self.zone_ids, self.location_ids, self.movement_methods, self.global_slots,
+            self.clothing_ids, self.outfit_ids, self.all_meter_ids, self.modifier_ids,
+            self.time_categories,
+        )
+        mappings = (self.location_to_zone, self.zone_locations, self.character_slots, self.character_meter_map)
+        payload = repr((
+            [sorted(table) for table in tables],
+            [sorted((key, sorted(value) if isinstance(value, set) else value) for key, value in mapping.items())
+             for mapping in mappings],
+        ))
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
     # --------------------------------------------------------------------- #
     # Index helpers
     # --------------------------------------------------------------------- #
@@ -534,6 +622,7 @@ class GameValidator:
     def _validate_nodes(self) -> None:
         """Validates all references within the node list."""
         ending_ids: set[str] = set()
+        scripted_ends = self._scripted_end_nodes()
         for node in self.game.nodes:
             # Validate present characters
             for char_id in node.characters_present or []:
@@ -574,6 +663,12 @@ class GameValidator:
                 else:
                     ending_ids.add(node.ending_id)
 
+            # Beats are Writer bullets unless a scripted choice ends its turn here
+            # without beats of its own; only then are they rendered.
+            self._validate_text_placeholders(
+                node.beats, f"Node: {node.id}", "beats", warn=node.id not in scripted_ends
+            )
+
             self._validate_node_triggers(node, f"Node: {node.id}")
 
     def _validate_events(self) -> None:
@@ -642,116 +737,88 @@ class GameValidator:
     # --------------------------------------------------------------------- #
 
     def _validate_node_reachability(self) -> None:
-        """Check that all non-ending nodes can be reached from the start node."""
-        # Build adjacency graph from nodes
-        reachable = {self.game.start.node}
-        to_visit = [self.game.start.node]
-
-        # Extract goto effects from all nodes
-        node_edges = self._build_node_graph()
-
-        # BFS to find all reachable nodes
-        while to_visit:
-            current = to_visit.pop(0)
-            for target in node_edges.get(current, set()):
-                if target not in reachable:
-                    reachable.add(target)
-                    to_visit.append(target)
-
-        # Check for unreachable nodes (excluding endings)
-        for node in self.game.nodes:
-            if node.id not in reachable and node.type != NodeType.ENDING:
+        """Check reachability, dead ends and closed cycles in the node transition graph."""
+        start_node = self.game.start.node
+        graph = IndexedGraph((node.id for node in self.game.nodes), self._build_node_graph())
+        roots = [start_node, *sorted(self._global_goto_targets())]
+        report = graph.analyze(roots, terminals=self.ending_node_ids)
+        self.node_graph = report
+
+        for node_id in report.unreachable:
+            self.warnings.append(
+                f"[Node: {node_id}] > Node is unreachable from start node '{start_node}'."
+            )
+        for node_id in report.unreachable_terminals:
+            self.warnings.append(
+                f"[Node: {node_id}] > Ending is unreachable from start node '{start_node}'."
+            )
+        if len(graph) > 1:  # a single-node game is one open-ended scene by design
+            for node_id in report.dead_ends:
                 self.warnings.append(
-                    f"[Node: {node.id}] > Node is unreachable from start node '{self.game.start.node}'."
+                    f"[Node: {node_id}] > Node has no goto transitions and is not an ending."
                 )
-
-        self._detect_node_cycles(node_edges)
+        for component in report.closed_cycles:
+            self.warnings.append(
+                f"[Nodes] > Circular transitions detected with no exit: {component}."
+            )
 
     def _build_node_graph(self) -> dict[str, set[str]]:
         """Collect goto edges between nodes for reachability and cycle checks."""
-        node_edges: dict[str, set[str]] = defaultdict(set)
-        for node in self.game.nodes:
-            targets = self._extract_goto_targets(node.on_enter)
-            targets.update(self._extract_goto_targets(node.on_exit))
-
-            for choice in node.choices or []:
-                targets.update(self._extract_goto_targets(choice.on_select))
-            for choice in node.dynamic_choices or []:
-                targets.update(self._extract_goto_targets(choice.on_select))
-            for trigger in node.triggers or []:
-                targets.update(self._extract_goto_targets(trigger.on_select))
-
-            node_edges[node.id].update(targets)
-        return node_edges
-
-    def _detect_node_cycles(self, node_edges: dict[str, set[str]]) -> None:
-        """Warn when a strongly connected component has no exit to other nodes."""
-        index = 0
-        indices: dict[str, int] = {}
-        low_links: dict[str, int] = {}
-        stack: list[str] = []
-        on_stack: set[str] = set()
-        cycles: list[set[str]] = []
-
-        def strong_connect(node_id: str) -> None:
-            nonlocal index
-            indices[node_id] = index
-            low_links[node_id] = index
-            index += 1
-            stack.append(node_id)
-            on_stack.add(node_id)
-
-            for target in node_edges.get(node_id, set()):
-                if target not in indices:
-                    strong_connect(target)
-                    low_links[node_id] = min(low_links[node_id], low_links[target])
-                elif target in on_stack:
-                    low_links[node_id] = min(low_links[node_id], indices[target])
-
-            if low_links[node_id] == indices[node_id]:
-                _component: set[str] = set()
-                while True:
-                    popped = stack.pop()
-                    on_stack.remove(popped)
-                    _component.add(popped)
-                    if popped == node_id:
-                        break
-                if len(_component) > 1 or (len(_component) == 1 and node_id in node_edges.get(node_id, set())):
-                    cycles.append(_component)
-
-        for node in self.node_ids:
-            if node not in indices:
-                strong_connect(node)
-
-        for component in cycles:
-            outgoing = set()
-            for node in component:
-                outgoing.update(node_edges.get(node, set()))
-            outgoing -= component
-            if not outgoing and not (component & self.ending_node_ids):
-                self.warnings.append(
-                    f"[Nodes] > Circular transitions detected with no exit: {sorted(component)}."
-                )
+        return {node.id: self._node_goto_targets(node) for node in self.game.nodes}
+
+    def _node_goto_targets(self, node) -> set[str]:
+        targets = self._extract_goto_targets(node.on_enter)
+        targets.update(self._extract_goto_targets(node.on_exit))
+        for choice in node.choices or []:
+            targets.update(self._extract_goto_targets(choice.on_select))
+        for choice in node.dynamic_choices or []:
+            targets.update(self._extract_goto_targets(choice.on_select))
+        for trigger in node.triggers or []:
+            targets.update(self._extract_goto_targets(trigger.on_select))
+        return targets
+
+    def _global_goto_targets(self) -> set[str]:
+        """Nodes that events, actions and arc stages can jump to from anywhere."""
+        targets: set[str] = set()
+        for event in self.game.events:
+            targets.update(self._node_goto_targets(event))
+        for action in self.game.actions:
+            targets.update(self._extract_goto_targets(action.effects))
+        for arc in self.game.arcs:
+            for stage in arc.stages:
+                targets.update(self._extract_goto_targets(stage.on_enter))
+                targets.update(self._extract_goto_targets(stage.on_exit))
+        return targets
+
     def _validate_zone_connectivity(self) -> None:
-        """Warn if zones are completely isolated (no connections)."""
+        """Warn if zones are isolated or cannot be travelled to from the start zone."""
         if len(self.zone_ids) <= 1:
             return  # Single zone games are fine
 
-        connected_zones: set[str] = set()
+        zone_order = [zone.id for zone in self.game.zones]
+        zone_edges: dict[str, set[str]] = defaultdict(set)
         for zone in self.game.zones:
-            if zone.connections:
-                connected_zones.add(zone.id)
-                for conn in zone.connections:
-                    if "all" in (conn.to or []):
-                        connected_zones.update(self.zone_ids)
-                    else:
-                        connected_zones.update(conn.to or [])
-
-        for zone_id in self.zone_ids:
-            if zone_id not in connected_zones:
+            for conn in zone.connections or []:
+                targets = set(self.zone_ids) if "all" in (conn.to or []) else set(conn.to or [])
+                targets.difference_update(conn.exceptions or [])
+                zone_edges[zone.id].update(targets - {zone.id})
+
+        graph = IndexedGraph(zone_order, zone_edges)
+        has_incoming = bytearray(len(graph))
+        for target in graph.targets:
+            has_incoming[target] = 1
+
+        start_zone = self.location_to_zone.get(self.game.start.location)
+        reachable = graph.reachable_from([start_zone] if start_zone else [])
+        for v, zone_id in enumerate(graph.ids):
+            if graph.offsets[v] == graph.offsets[v + 1] and not has_incoming[v]:
                 self.warnings.append(
                     f"[Zone: {zone_id}] > Zone has no connections and may be isolated."
                 )
+            elif start_zone and not reachable[v]:
+                self.warnings.append(
+                    f"[Zone: {zone_id}] > Zone cannot be reached from start zone '{start_zone}'."
+                )
 
     def _validate_outfit_consistency(self) -> None:
         """Check that outfits reference valid clothing items and slots are consistent."""
@@ -840,6 +907,43 @@ class GameValidator:
                 self.errors.append(
                     f"[{context}] > Choice '{choice.id}' time_cost must be non-negative."
                 )
+            self._validate_text_placeholders(choice.beats, context, f"Choice '{choice.id}' beats")
+
+    def _validate_text_placeholders(
+        self, texts: Sequence[str], context: str, field: str, *, warn: bool = False
+    ) -> None:
+        """Scripted narrative may interpolate {expression}s; each must be a valid DSL expression."""
+        for text in texts or []:
+            for part in parse_text_template(text):
+                if isinstance(part, tuple) and part[1] is None:
+                    message = f"[{context}] > {field} placeholder {part[0]} is not a valid expression."
+                    if warn:
+                        self.warnings.append(f"{message} It is shown as written if ever rendered.")
+                    else:
+                        self.errors.append(message)
+
+    def _scripted_end_nodes(self) -> set[str]:
+        """
+        Nodes whose beats a scripted choice without beats of its own may narrate:
+        the choice's node, its goto targets, and wherever their triggers lead.
+        """
+        nodes = {node.id: node for node in self.game.nodes}
+        pending: list[str] = []
+        for node in self.game.nodes:
+            for choice in list(node.choices or []) + list(node.dynamic_choices or []):
+                scripted = node.scripted if choice.scripted is None else choice.scripted
+                if scripted and not choice.beats:
+                    pending.append(node.id)
+                    pending.extend(self._extract_goto_targets(choice.on_select))
+        ends: set[str] = set()
+        while pending:
+            node_id = pending.pop()
+            if node_id in ends or node_id not in nodes:
+                continue
+            ends.add(node_id)
+            for trigger in nodes[node_id].triggers or []:
+                pending.extend(self._extract_goto_targets(trigger.on_select))
+        return ends
 
     def _validate_triggers(self, triggers, context: str) -> None:
         if not triggers:
@@ -1,9 +1,15 @@
 """
 PlotPlay Game Engine - Main application file.
 """
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import game, health, debug
+from app.core.logger import shutdown_session_logging
+from app.core.settings import GameSettings
+from app.services.summarizer import get_summary_queue
 
 # import pydevd_pycharm
 # pydevd_pycharm.settrace(
@@ -14,10 +20,28 @@ from app.api import game, health, debug
 #     suspend=False            # set True to pause immediately on connect
 # )
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    settings = GameSettings()
+    watcher = None
+    if settings.games_hot_reload:
+        watcher = asyncio.create_task(game.watch_games(settings.games_reload_interval_ms / 1000))
+    yield
+    if watcher:
+        watcher.cancel()
+        with suppress(asyncio.CancelledError):
+            await watcher
+    await get_summary_queue().shutdown()
+    # Flush write-behind session snapshots before the process exits.
+    game.close_session_repository()
+    shutdown_session_logging()
+
+
 app = FastAPI(
     title="PlotPlay API",
     description="AI-driven text adventure engine",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS configuration
@@ -42,12 +42,14 @@ from .effects import (
 from .events import Event
 from .flags import Flag, Flags, FlagValue, BoolFlag, NumberFlag, StringFlag, FlagsState
 from .game import Meta, GameStart, GameIndex, GameDefinition, GameState
+from .indexed import IndexedList
 from .inventory import InventoryItem, Inventory, InventoryState
 from .items import Item
 from .locations import (LocalDirection, LocationPrivacy, LocationConnection, LocationAccess, Location,
                         TravelMethod, Movement, Zone, ZoneConnection,
                         ZoneMovementWillingness, LocationMovementWillingness, MovementWillingness,
                         ZoneState, LocationState)
+from .memory import MemoryEntry
 from .meters import Meter, Meters, MeterFormat, MeterThreshold, MetersTemplate, MetersState
 from .model import SimpleModel, DescriptiveModel, DSLExpression
 from .modifiers import MeterClamp, ModifierStacking, Modifier, Modifiers
@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 from pydantic import Field, model_validator
 
-from .model import DescriptiveModel, DSLExpression, RequiredConditionalMixin
+from .model import DescriptiveModel, DSLExpression, RequiredConditionalMixin, SlottedState
 
 if TYPE_CHECKING:
     from .effects import EffectsList
@@ -40,8 +40,8 @@ class Arc(DescriptiveModel):
     stages: list[ArcStage] = Field(default_factory=list)
 
 
-@dataclass
-class ArcState:
+@dataclass(slots=True)
+class ArcState(SlottedState):
     """Tracks arc stage and history."""
     id: str
     stage: str | None = None
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 
 from pydantic import Field, model_validator
 
-from .model import SimpleModel, DescriptiveModel, DSLExpression, RequiredConditionalMixin
+from .model import SimpleModel, DescriptiveModel, DSLExpression, RequiredConditionalMixin, SlottedState
 from .meters import Meters, MetersState
 from .inventory import Inventory, InventoryState
 from .clothing import Wardrobe, Clothing, ClothingState
@@ -82,8 +82,8 @@ class Character(DescriptiveModel):
     shop: Shop | None = None
 
 
-@dataclass
-class CharacterState:
+@dataclass(slots=True)
+class CharacterState(SlottedState):
     """Holds per-character runtime data."""
     #Locking
     locked: bool = False
@@ -105,6 +105,8 @@ class CharacterState:
 
     # Active gates (gate_id -> (acceptance, refusal))
     gates: dict[str, tuple[str, str]] = field(default_factory=dict)
+    # Every evaluated gate this turn (gate_id -> allowed), including refused ones
+    gates_full: dict[str, bool] | None = None
 
     # Memory log (append-only history of significant interactions)
     memory_log: list[str] = field(default_factory=list)
@@ -11,7 +11,7 @@ from enum import StrEnum
 
 from pydantic import Field, model_validator
 
-from .model import SimpleModel, DescriptiveModel, DSLExpression
+from .model import SimpleModel, DescriptiveModel, DSLExpression, SlottedState
 
 if TYPE_CHECKING:
     from .effects import EffectsList
@@ -101,8 +101,8 @@ class Clothing(SimpleModel):
     items: dict[str, ClothingCondition] = Field(default_factory=dict)
 
 
-@dataclass
-class ClothingState():
+@dataclass(slots=True)
+class ClothingState(SlottedState):
     outfit: str | None = None
     items: dict[str, ClothingCondition] = field(default_factory=dict)
 
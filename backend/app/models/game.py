@@ -3,6 +3,7 @@ PlotPlay Game Models
 Game Definition
 """
 from dataclasses import dataclass, field, asdict
+from typing import Any
 from datetime import datetime
 
 from pydantic import Field, model_validator, PrivateAttr
@@ -15,13 +16,15 @@ from .events import Event
 from .flags import Flags, FlagsState
 from .items import Item
 from .locations import Zone, Location, Movement, LocationPrivacy, ZoneState, LocationState
+from .memory import MemoryEntry
 from .meters import MetersTemplate, Meter
 from .model import SimpleModel, DescriptiveModel
 from .modifiers import Modifiers, Modifier
 from .narration import Narration
 from .nodes import Node
-from .time import Time, TimeHHMM, TimeState
+from .time import Time, TimeHHMM, TimeState, SlotTable
 from .clothing import Wardrobe, ClothingItem, Outfit
+from .indexed import IndexedList
 
 
 class Meta(DescriptiveModel):
@@ -61,6 +64,15 @@ class GameIndex:
     location_to_zone: dict[str, str] = field(default_factory=dict)
     player_meters: dict[str, Meter] = field(default_factory=dict)
     template_meters: dict[str, Meter] = field(default_factory=dict)
+    # Minute-of-day -> slot lookup compiled from the time slot windows
+    slot_table: SlotTable | None = None
+    # Runtime-compiled effect programs, keyed by id() of the definition list/dict
+    # they were built from (value is a (source, compiled) pair to guard id reuse).
+    effect_programs: dict[int, tuple[Any, Any]] = field(default_factory=dict)
+    # Runtime-compiled zone travel planner (app.core.routes.TravelPlanner)
+    travel_planner: Any = None
+    # Runtime-compiled checker reply schema (app.runtime.services.checker_deltas.CheckerDeltaSchema)
+    checker_schema: Any = None
 
     @classmethod
     def from_game(cls, game: "GameDefinition") -> "GameIndex":
@@ -103,8 +115,18 @@ class GameIndex:
                 index.locations[location.id] = location
                 index.location_to_zone[location.id] = zone.id
 
+        index.slot_table = SlotTable.compile(game.time.slot_windows)
+
         return index
 
+    def meter_def(self, char_id: str, meter_id: str) -> Meter | None:
+        """A character's own meter definition, else the game's player or template one."""
+        character = self.characters.get(char_id)
+        own = character.meters if character else None
+        if own and meter_id in own:
+            return own[meter_id]
+        return (self.player_meters if char_id == "player" else self.template_meters).get(meter_id)
+
 
 class GameDefinition(SimpleModel):
     """
@@ -176,6 +198,13 @@ class GameDefinition(SimpleModel):
         return self._index
 
 
+# GameState lists checked for membership every turn
+_INDEXED_LISTS = (
+    "nodes_history", "events_history",
+    "unlocked_endings", "unlocked_actions", "unlocked_items", "unlocked_clothing",
+)
+
+
 @dataclass
 class GameState:
     """Complete game state at a point in time."""
@@ -205,25 +234,27 @@ class GameState:
 
     # --- Narrative progression ---
     current_node: str | None = None
-    nodes_history: list[str] = field(default_factory=list)
+    nodes_history: IndexedList[str] = field(default_factory=IndexedList)
     current_visit_node: str | None = None
     current_visit_minutes: int = 0
-    unlocked_endings: list[str] = field(default_factory=list)
-    unlocked_actions: list[str] = field(default_factory=list)
-    unlocked_items: list[str] = field(default_factory=list)
-    unlocked_clothing: list[str] = field(default_factory=list)
+    unlocked_endings: IndexedList[str] = field(default_factory=IndexedList)
+    unlocked_actions: IndexedList[str] = field(default_factory=IndexedList)
+    unlocked_items: IndexedList[str] = field(default_factory=IndexedList)
+    unlocked_clothing: IndexedList[str] = field(default_factory=IndexedList)
     unlocked_outfits: dict[str, list[str]] = field(default_factory=dict)  # char_id -> [outfit_ids]
 
     narrative_history: list[str] = field(default_factory=list)
     narrative_summary: str = ""  # Rolling narrative summary (updated every N AI turns)
     ai_turns_since_summary: int = 0  # Counter for summary update interval
+    narratives_since_summary: int = 0  # Latest narrative_history entries the summary does not cover yet
+    memories: list[MemoryEntry] = field(default_factory=list)  # Long-term memory store (scenes, day/arc chunks)
     turn_count: int = 0
     actions_this_slot: int = 0
     rng_seed: int = 0  # Deterministic random seed (derived from turn_count + state hash)
 
     # --- Events & timers ---
     cooldowns: dict[str, int] = field(default_factory=dict) # event_id -> cooldown
-    events_history: list[str] = field(default_factory=list)
+    events_history: IndexedList[str] = field(default_factory=IndexedList)
 
     # --- Shops & merchants (optional helpers) ---
     shops: list[str] = field(default_factory=list)      # location_id with shop
@@ -277,6 +308,16 @@ class GameState:
     def time_slot(self, value: str):
         self.time.slot = value
 
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.__dict__.setdefault("memories", [])
+        self.__dict__.setdefault("narratives_since_summary", self.__dict__.get("ai_turns_since_summary", 0))
+        # Snapshots taken before these lists were indexed hold plain lists
+        for name in _INDEXED_LISTS:
+            value = self.__dict__.get(name)
+            if value is not None and not isinstance(value, IndexedList):
+                self.__dict__[name] = IndexedList(value)
+
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
         return asdict(self)
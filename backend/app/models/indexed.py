@@ -0,0 +1,98 @@
+"""
+PlotPlay Game Models.
+Indexed list for state histories and unlock lists.
+"""
+from collections import Counter
+from typing import Any, Iterable
+
+
+class IndexedList(list):
+    """
+    A list that also counts its elements, so membership tests are O(1).
+
+    Used for the GameState histories and unlock lists that are checked with
+    `in` every turn. It is still a plain list to everything else (ordered,
+    indexable, JSON- and asdict-friendly, pickled as just its values); every
+    mutator keeps the counts in sync. Elements must be hashable.
+    """
+    __slots__ = ("_counts",)
+
+    def __init__(self, iterable: Iterable[Any] = ()):
+        super().__init__(iterable)
+        self._counts = Counter(self)
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def __contains__(self, value: Any) -> bool:
+        return self._counts.get(value, 0) > 0
+
+    def count(self, value: Any) -> int:
+        return self._counts.get(value, 0)
+
+    def copy(self) -> "IndexedList":
+        return self.__class__(self)
+
+    # ------------------------------------------------------------------ #
+    # Mutators
+    # ------------------------------------------------------------------ #
+    def append(self, value: Any) -> None:
+        super().append(value)
+        self._counts[value] += 1
+
+    def extend(self, values: Iterable[Any]) -> None:
+        values = list(values)
+        super().extend(values)
+        self._counts.update(values)
+
+    def __iadd__(self, values: Iterable[Any]) -> "IndexedList":
+        self.extend(values)
+        return self
+
+    def __imul__(self, times: int) -> "IndexedList":
+        super().__imul__(times)
+        self._counts = Counter(self)
+        return self
+
+    def insert(self, index: int, value: Any) -> None:
+        super().insert(index, value)
+        self._counts[value] += 1
+
+    def remove(self, value: Any) -> None:
+        super().remove(value)
+        self._discount(value)
+
+    def pop(self, index: int = -1) -> Any:
+        value = super().pop(index)
+        self._discount(value)
+        return value
+
+    def clear(self) -> None:
+        super().clear()
+        self._counts.clear()
+
+    def __setitem__(self, index, value) -> None:
+        removed = self[index]
+        if isinstance(index, slice):
+            value = list(value)
+            super().__setitem__(index, value)
+            for item in removed:
+                self._discount(item)
+            self._counts.update(value)
+        else:
+            super().__setitem__(index, value)
+            self._discount(removed)
+            self._counts[value] += 1
+
+    def __delitem__(self, index) -> None:
+        removed = self[index]
+        super().__delitem__(index)
+        for item in (removed if isinstance(index, slice) else (removed,)):
+            self._discount(item)
+
+    def _discount(self, value: Any) -> None:
+        remaining = self._counts[value] - 1
+        if remaining > 0:
+            self._counts[value] = remaining
+        else:
+            del self._counts[value]
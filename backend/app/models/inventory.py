@@ -5,7 +5,7 @@ Inventory
 from dataclasses import dataclass, field
 
 from pydantic import Field
-from .model import SimpleModel, DSLExpression
+from .model import SimpleModel, DSLExpression, SlottedState
 
 
 class InventoryItem(SimpleModel):
@@ -24,8 +24,8 @@ class Inventory(SimpleModel):
     clothing: dict[str, int] = Field(default_factory=dict)
     outfits: dict[str, int] = Field(default_factory=dict)
 
-@dataclass
-class InventoryState:
+@dataclass(slots=True)
+class InventoryState(SlottedState):
     """Inventory state - runtime inventory representation."""
     items: dict[str, int] = field(default_factory=dict)
     clothing: dict[str, int] = field(default_factory=dict)
@@ -12,6 +12,7 @@ from .model import (
     DescriptiveModel,
     OptionalConditionalMixin,
     SimpleModel,
+    SlottedState,
 )
 from .economy import Shop
 from .inventory import Inventory, InventoryState
@@ -235,16 +236,16 @@ class MovementWillingness(SimpleModel):
     willing_locations: list[LocationMovementWillingness] = Field(default_factory=list)
 
 
-@dataclass()
-class ZoneState:
+@dataclass(slots=True)
+class ZoneState(SlottedState):
     """Current zone snapshot."""
     id: str
     discovered: bool = True
     locked: bool = False
 
 
-@dataclass
-class LocationState:
+@dataclass(slots=True)
+class LocationState(SlottedState):
     """Current player location snapshot."""
     id: str
     zone_id: str
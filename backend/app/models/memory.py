@@ -0,0 +1,19 @@
+"""
+PlotPlay Game Models.
+Long-term memory.
+"""
+
+from dataclasses import dataclass, field
+
+from .model import SlottedState
+
+
+@dataclass(slots=True)
+class MemoryEntry(SlottedState):
+    """One retrievable memory: a scene, a character memory, or a day/arc chunk summarizing several scenes."""
+    kind: str  # scene | memory | day | arc
+    text: str
+    characters: list[str] = field(default_factory=list)  # NPCs involved
+    day: int = 1
+    turn: int = 0
+    arc: str | None = None
@@ -3,6 +3,8 @@ PlotPlay Game Models.
 Base models
 """
 
+from dataclasses import MISSING, fields
+
 from pydantic import BaseModel, model_validator
 
 class SimpleModel(BaseModel):
@@ -17,6 +19,32 @@ class DescriptiveModel(BaseModel):
 DSLExpression = str
 
 
+class SlottedState:
+    """
+    Base for runtime state dataclasses declared with `slots=True`.
+
+    Slots drop the per-instance __dict__, which adds up across the many zone,
+    location, inventory and character states every session holds. Snapshots
+    pickled before a class had slots carry a plain dict; both forms restore,
+    and fields missing from older snapshots take their defaults.
+    """
+    __slots__ = ()
+
+    def __setstate__(self, state):
+        if isinstance(state, tuple):
+            state = {**(state[0] or {}), **(state[1] or {})}
+        for f in fields(self):
+            if f.name in state:
+                value = state[f.name]
+            elif f.default is not MISSING:
+                value = f.default
+            elif f.default_factory is not MISSING:
+                value = f.default_factory()
+            else:
+                continue
+            object.__setattr__(self, f.name, value)
+
+
 class OptionalConditionalMixin(SimpleModel):
     """Ensure no more than one condition is defined."""
 
@@ -46,6 +46,11 @@ class NodeChoice(NodeTrigger):
     time_category: str | None = None
     time_cost: int | None = None
 
+    # Scripted resolution: overrides the node's `scripted` flag for this choice
+    scripted: bool | None = None
+    # Narrative shown when the choice resolves scripted ({expression} placeholders allowed)
+    beats: list[str] = Field(default_factory=list)
+
 class Node(DescriptiveModel):
     """Story node definition."""
     id: str
@@ -57,6 +62,9 @@ class Node(DescriptiveModel):
     narration: Narration | None = None
     beats: list[str] = Field(default_factory=list)
 
+    # Choices resolve from authored beats without Writer/Checker calls
+    scripted: bool = False
+
     # Effects
     on_enter: EffectsList = Field(default_factory=list)
     on_exit: EffectsList = Field(default_factory=list)
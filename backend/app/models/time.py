@@ -106,6 +106,65 @@ def calculate_time_slot(value: TimeHHMM, slots: list[str], slot_windows: TimeSlo
     return None
 
 
+MINUTES_PER_DAY = 24 * 60
+
+
+def hhmm_to_minutes(value: str) -> int:
+    hh, mm = map(int, value.split(":"))
+    return (hh % 24) * 60 + mm
+
+
+@dataclass(frozen=True, slots=True)
+class SlotTable:
+    """
+    The slot of every minute of the day, compiled once from the slot windows.
+
+    Windows include their end minute and the first matching window (in
+    definition order) wins; minutes outside every window keep the previous
+    slot. `changes[m]` counts slot changes between minute 0 and minute `m`,
+    and `changes_per_day` those over a whole day including the wrap at
+    midnight, so the slots crossed by any span take constant time to count.
+    """
+    by_minute: tuple[str | None, ...]
+    changes: tuple[int, ...]
+    changes_per_day: int
+
+    @classmethod
+    def compile(cls, slot_windows: TimeSlotWindows | None) -> "SlotTable":
+        by_minute: list[str | None] = [None] * MINUTES_PER_DAY
+        for slot, window in (slot_windows or {}).items():
+            start, end = hhmm_to_minutes(window.start), hhmm_to_minutes(window.end)
+            minutes = range(start, end + 1) if start <= end else [*range(start, MINUTES_PER_DAY), *range(end + 1)]
+            for minute in minutes:
+                if by_minute[minute] is None:
+                    by_minute[minute] = slot
+
+        # Carry the last slot across gaps, starting from the one in effect before midnight
+        current = next((slot for slot in reversed(by_minute) if slot is not None), None)
+        midnight_slot = current
+        changes = [0] * MINUTES_PER_DAY
+        count = 0
+        for minute, slot in enumerate(by_minute):
+            if slot is not None and slot != current:
+                if minute:
+                    count += 1
+                current = slot
+            changes[minute] = count
+        wrap = 1 if by_minute[0] is not None and by_minute[0] != midnight_slot else 0
+        return cls(by_minute=tuple(by_minute), changes=tuple(changes), changes_per_day=count + wrap)
+
+    def slot_at(self, minute: int) -> str | None:
+        """The slot whose window contains `minute` of the day, if any."""
+        return self.by_minute[minute % MINUTES_PER_DAY]
+
+    def changes_between(self, start: int, end: int) -> int:
+        """Slot changes in the absolute minute span (start, end]."""
+        def changes_until(minute: int) -> int:
+            days, of_day = divmod(minute, MINUTES_PER_DAY)
+            return days * self.changes_per_day + self.changes[of_day]
+        return changes_until(end) - changes_until(start)
+
+
 def calculate_weekday(value: int, start_day: str, week_days: list[str]) -> str | None:
     """Calculate the current weekday based on time configuration."""
     if not week_days:
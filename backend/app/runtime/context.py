@@ -33,6 +33,9 @@ class TurnContext:
     events_fired: list[str] = field(default_factory=list)
     milestones_reached: list[str] = field(default_factory=list)
 
+    # Scripted choice being resolved without AI (see Node.scripted / NodeChoice.scripted)
+    scripted_choice: Any = None
+
     # AI result tracking
     ai_narrative: str = ""
     checker_deltas: dict[str, Any] = field(default_factory=dict)
@@ -13,8 +13,12 @@ details to the FastAPI layer or tests.
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from contextlib import AbstractAsyncContextManager, aclosing
+from typing import Any, Callable
 
+from app.core.logger import close_session_logger
+from app.core.settings import GameSettings
 from app.runtime.session import SessionRuntime
 from app.runtime.turn_manager import TurnManager
 from app.runtime.types import PlayerAction, TurnResult
@@ -28,7 +32,11 @@ from app.runtime.services.effects import EffectResolver
 from app.runtime.services.choices import ChoiceBuilder
 from app.runtime.services.state_summary import StateSummaryService
 from app.runtime.services.discovery import DiscoveryService
+from app.runtime.services.checker_deltas import CheckerDeltaService
+from app.runtime.services.memory import MemoryService
 from app.runtime.services.prompt_builder import PromptBuilder
+from app.services.summarizer import SummaryJob, get_summary_queue
+from app.storage.sessions import SessionRecord, SessionRepository
 
 
 class PlotPlayEngine:
@@ -41,8 +49,31 @@ class PlotPlayEngine:
     - Provide simple async methods for start/process/stream operations
     """
 
-    def __init__(self, game_def, session_id: str, ai_service: Any | None = None):
+    def __init__(
+        self,
+        game_def,
+        session_id: str,
+        ai_service: Any | None = None,
+        repository: SessionRepository | None = None,
+        lease: Callable[[str], AbstractAsyncContextManager[bool]] | None = None,
+    ):
         self.runtime = SessionRuntime(game_def, session_id, ai_service=ai_service)
+        self.repository = repository
+        # Non-blocking session lease for background work (the API's try_session_lease):
+        # yields whether the session was free and is now held
+        self.lease = lease
+        # Revision of the last snapshot this engine saved or was restored from
+        self.revision = 0
+        # Edited game definition waiting for the current turn to finish
+        self._pending_game = None
+        # Background summary (summary, previous, covered, narratives) waiting for the current turn to finish
+        self._pending_summary: tuple[str, str, int, int] | None = None
+        self._turn_active = False
+        self._closed = False
+        self._build_services()
+
+    def _build_services(self) -> None:
+        """(Re)create every service against the runtime's current game definition."""
         # Initialize shared services
         self.inventory_service = InventoryService(self.runtime)
         self.time_service = TimeService(self.runtime)
@@ -63,6 +94,8 @@ class PlotPlayEngine:
         self.choice_builder = ChoiceBuilder(self.runtime)
         self.state_summary = StateSummaryService(self.runtime)
         self.discovery_service = DiscoveryService(self.runtime)
+        self.checker_delta_service = CheckerDeltaService(self.runtime)
+        self.memory_service = MemoryService(self.runtime)
         self.prompt_builder = PromptBuilder(self.runtime)
 
         # expose for other services
@@ -72,6 +105,8 @@ class PlotPlayEngine:
         self.runtime.choice_builder = self.choice_builder
         self.runtime.state_summary_service = self.state_summary
         self.runtime.discovery_service = self.discovery_service
+        self.runtime.checker_delta_service = self.checker_delta_service
+        self.runtime.memory_service = self.memory_service
         self.runtime.time_service = self.time_service
         self.runtime.modifier_service = self.modifier_service
         self.runtime.trade_service = self.trade_service
@@ -80,10 +115,57 @@ class PlotPlayEngine:
 
         self.turn_manager = TurnManager(self.runtime)
 
+    @classmethod
+    def restore(
+        cls,
+        game_def,
+        record: SessionRecord,
+        ai_service: Any | None = None,
+        repository: SessionRepository | None = None,
+        lease: Callable[[str], AbstractAsyncContextManager[bool]] | None = None,
+    ) -> "PlotPlayEngine":
+        """Rebuild an engine around a persisted session snapshot."""
+        engine = cls(game_def, record.session_id, ai_service=ai_service, repository=repository, lease=lease)
+        engine.runtime.state_manager.state = record.state
+        engine.runtime.base_seed = record.base_seed
+        engine.runtime.generated_seed = record.generated_seed
+        engine.revision = record.revision
+        return engine
+
     @property
     def session_id(self) -> str:
         return self.runtime.session_id
 
+    def snapshot(self) -> SessionRecord:
+        return SessionRecord(
+            session_id=self.session_id,
+            game_id=self.runtime.game.meta.id,
+            state=self.runtime.state_manager.state,
+            base_seed=self.runtime.base_seed,
+            generated_seed=self.runtime.generated_seed,
+            revision=self.revision,
+        )
+
+    async def persist(self) -> None:
+        """
+        Snapshot the session into the repository (written behind the caller).
+        The state is encoded on a worker thread; callers hold the session, so
+        nothing mutates it until this returns.
+        """
+        if self.repository is None:
+            return
+        self.revision += 1
+        try:
+            await asyncio.to_thread(self.repository.save, self.snapshot())
+        except Exception:
+            # The turn already committed; a storage hiccup must not fail or replay it.
+            self.runtime.logger.exception("Failed to persist session snapshot")
+
+    def close(self) -> None:
+        """Release per-session resources (the session log file) when the engine is evicted."""
+        self._closed = True
+        close_session_logger(self.session_id)
+
     async def start(self) -> TurnResult:
         """
         Optional helper invoked by /start to run the initial scripted action.
@@ -92,19 +174,149 @@ class PlotPlayEngine:
         default_action = PlayerAction(action_type="do", action_text="Look around and take in the scene.")
         return await self.process_action(default_action)
 
-    async def process_action(self, action: PlayerAction) -> TurnResult:
-        """Run a single turn using the unified pipeline (non-streaming)."""
-        async for event in self.process_action_stream(action):
-            if event["type"] == "complete":
-                payload = event.copy()
-                payload.pop("type", None)
-                return TurnResult(**payload)
-        raise RuntimeError("process_action_stream did not emit a complete event")
+    async def process_action(self, action: PlayerAction, *, retries: int = 0) -> TurnResult:
+        """
+        Run a single turn using the unified pipeline (non-streaming).
+        A failed turn is rolled back by the state journal, so it can be retried
+        up to `retries` times against the restored state.
+        """
+        attempt = 0
+        while True:
+            try:
+                result = None
+                # Drain the stream so post-turn work (persistence) runs before returning.
+                async for event in self.process_action_stream(action):
+                    if event["type"] == "complete":
+                        payload = event.copy()
+                        payload.pop("type", None)
+                        result = TurnResult(**payload)
+                if result is None:
+                    raise RuntimeError("process_action_stream did not emit a complete event")
+                return result
+            except Exception as exc:
+                if attempt >= retries:
+                    raise
+                attempt += 1
+                self.runtime.logger.warning("Retrying turn (attempt %d/%d) after error: %s", attempt, retries, exc)
 
     async def process_action_stream(self, action: PlayerAction):
         """
         Streaming variant that yields action summary, writer chunks, checker status,
         and the final completion payload. Used by SSE endpoints.
         """
-        async for event in self.turn_manager.run_turn(action):
-            yield event
+        self._turn_active = True
+        completed = False
+        try:
+            async with aclosing(self.turn_manager.run_turn(action)) as events:
+                async for event in events:
+                    completed = completed or event["type"] == "complete"
+                    yield event
+        finally:
+            self._turn_active = False
+            swapped = self._pending_summary is not None and self._swap_summary(*self._pending_summary)
+            self._pending_summary = None
+            if completed or swapped:
+                # After the final payload is out, so snapshotting never delays the stream.
+                # Runs even if the client went away after it: the turn is committed.
+                await self.persist()
+            if completed:
+                self._queue_summary()
+            if self._pending_game is not None:
+                self._apply_pending_game()
+
+    async def apply_summary(self, summary: str, *, previous: str, covered: int, narratives: int = 0) -> str:
+        """
+        Swap in a narrative summary written in the background.
+
+        It only replaces the summary it was written from: if another one landed
+        in the meantime, it is dropped. While a turn holds or waits for the
+        session, the swap is deferred until the turn ends. Otherwise it happens
+        under the session lease, and is dropped if the stored session moved past
+        this engine (another worker played a turn, or this engine was replaced).
+
+        Returns "applied", "deferred" or "stale".
+        """
+        if self._closed:
+            return "stale"
+        if self._turn_active:
+            self._pending_summary = (summary, previous, covered, narratives)
+            return "deferred"
+        if self.lease is None:
+            return await self._apply_summary(summary, previous, covered, narratives)
+        async with self.lease(self.session_id) as held:
+            if not held:
+                self._pending_summary = (summary, previous, covered, narratives)
+                return "deferred"
+            return await self._apply_summary(summary, previous, covered, narratives)
+
+    async def _apply_summary(self, summary: str, previous: str, covered: int, narratives: int) -> str:
+        if self._closed:
+            return "stale"
+        if self._turn_active:
+            self._pending_summary = (summary, previous, covered, narratives)
+            return "deferred"
+        if self.repository is not None:
+            stored = self.repository.revision(self.session_id)
+            if stored is not None and stored != self.revision:
+                return "stale"
+        if not self._swap_summary(summary, previous, covered, narratives):
+            return "stale"
+        await self.persist()
+        return "applied"
+
+    def _swap_summary(self, summary: str, previous: str, covered: int, narratives: int) -> bool:
+        state = self.runtime.state_manager.state
+        if state.narrative_summary != previous:
+            return False
+        state.narrative_summary = summary
+        # Turns played while the summary was being written count towards the next one.
+        state.ai_turns_since_summary = max(0, state.ai_turns_since_summary - covered)
+        state.narratives_since_summary = max(0, state.narratives_since_summary - narratives)
+        return True
+
+    def _queue_summary(self) -> None:
+        """Hand the narrative summary to the background queue once enough AI turns piled up."""
+        state = self.runtime.state_manager.state
+        covered = state.ai_turns_since_summary
+        if covered < GameSettings().memory_summary_interval or self.runtime.ai_service is None:
+            return
+        narratives = state.narratives_since_summary
+        get_summary_queue().submit(SummaryJob(
+            engine=self,
+            prompt=self.prompt_builder.build_summary_prompt(narratives),
+            previous=state.narrative_summary,
+            covered=covered,
+            narratives=narratives,
+        ))
+
+    def reload_game(self, game_def) -> None:
+        """
+        Swap in an edited game definition while keeping the session's GameState.
+        A turn in progress finishes on the old definition; the swap happens as
+        soon as it ends.
+        """
+        self._pending_game = game_def
+        if not self._turn_active:
+            self._apply_pending_game()
+
+    def _apply_pending_game(self) -> None:
+        game_def, self._pending_game = self._pending_game, None
+        state = self.runtime.state_manager.state
+        if state.current_node not in game_def.index.nodes:
+            self.runtime.logger.error(
+                "Ignoring reload of '%s': current node '%s' no longer exists",
+                game_def.meta.id, state.current_node,
+            )
+            return
+        if state.current_location not in game_def.index.locations:
+            self.runtime.logger.error(
+                "Ignoring reload of '%s': current location '%s' no longer exists",
+                game_def.meta.id, state.current_location,
+            )
+            return
+        self.runtime.game = game_def
+        self.runtime.index = game_def.index
+        self.runtime.state_manager.game_def = game_def
+        self.runtime.state_manager.index = game_def.index
+        self._build_services()
+        self.runtime.logger.info("Reloaded game definition '%s'", game_def.meta.id)
@@ -71,7 +71,7 @@ class ActionService:
             if effects:
                 self.effect_resolver.apply_effects(effects)
             if getattr(choice, "goto", None):
-                state.current_node = choice.goto
+                self.runtime.state_manager.journal.set_attr(state, "current_node", choice.goto)
 
         # Event choices take priority
         for choice in ctx.event_choices:
@@ -0,0 +1,601 @@
+"""
+Checker delta validation and application for the new runtime engine.
+
+The checker's reply is model output: loosely shaped and free to name things
+the game does not have. CheckerDeltaSchema lists what a reply may refer to
+(meters per character, flags and their values, items, locations, modifiers,
+...); it is built once per game and cached on the GameIndex. Each reply is
+checked against it in one pass and turned into ready-made effects, which run
+as a single effect program. Entries that do not fit the schema, including ids
+that are not strings, are rejected one by one and counted, instead of failing
+later inside the effect resolver.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from app.models.clothing import ClothingCondition
+from app.models.effects import (
+    ApplyModifierEffect,
+    ClothingPutOnEffect,
+    ClothingSlotStateEffect,
+    ClothingStateEffect,
+    ClothingTakeOffEffect,
+    FlagSetEffect,
+    InventoryAddEffect,
+    InventoryDropEffect,
+    InventoryGiveEffect,
+    InventoryPurchaseEffect,
+    InventoryRemoveEffect,
+    InventorySellEffect,
+    InventoryTakeEffect,
+    MeterChangeEffect,
+    MoveEffect,
+    MoveToEffect,
+    RemoveModifierEffect,
+    TravelToEffect,
+)
+from app.models.locations import LocalDirection
+from app.models.nodes import NodeType
+from app.runtime.session import SessionRuntime
+
+# Process-wide counts of checker deltas applied and rejected
+# ("rejected.<section>.<reason>" per cause).
+checker_metrics: Counter[str] = Counter()
+
+_METER_OPS = frozenset({"add", "subtract", "set", "multiply", "divide"})
+_CONDITIONS = frozenset(condition.value for condition in ClothingCondition)
+_DIRECTIONS = frozenset(direction.value for direction in LocalDirection)
+_FLAG_TYPES: dict[str, Callable[[Any], bool]] = {
+    "bool": lambda value: isinstance(value, bool),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "string": lambda value: isinstance(value, str),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class CheckerDeltaSchema:
+    """The ids and values a checker reply may use for one game."""
+    characters: frozenset[str]
+    # Character id -> its meters: the game's player or template meters plus its own
+    meters: dict[str, frozenset[str]]
+    flags: dict[str, Any]
+    item_types: dict[str, str]
+    clothing: frozenset[str]
+    locations: frozenset[str]
+    zones: frozenset[str]
+    actions: frozenset[str]
+    endings: frozenset[str]
+    modifiers: frozenset[str]
+
+    @classmethod
+    def from_game(cls, game: Any) -> "CheckerDeltaSchema":
+        index = game.index
+        item_types = {item_id: "item" for item_id in index.items}
+        item_types.update((clothing_id, "clothing") for clothing_id in index.clothing)
+        item_types.update((outfit_id, "outfit") for outfit_id in index.outfits)
+        meters = {"player": frozenset(index.player_meters)}
+        for char_id, character in index.characters.items():
+            shared = index.player_meters if char_id == "player" else index.template_meters
+            meters[char_id] = frozenset(shared) | frozenset(character.meters or ())
+        return cls(
+            characters=frozenset(meters),
+            meters=meters,
+            flags=dict(game.flags or {}),
+            item_types=item_types,
+            clothing=frozenset(index.clothing),
+            locations=frozenset(index.locations),
+            zones=frozenset(index.zones),
+            actions=frozenset(index.actions),
+            endings=frozenset(
+                node.ending_id for node in index.nodes.values() if node.type == NodeType.ENDING and node.ending_id
+            ),
+            modifiers=frozenset(index.modifiers),
+        )
+
+
+@dataclass(slots=True)
+class CompiledDeltas:
+    """Effects and discoveries accepted from a checker reply, plus what was rejected."""
+    effects: list = field(default_factory=list)
+    discoveries: dict[str, list[str]] = field(default_factory=dict)
+    rejected: list[tuple[str, str, Any]] = field(default_factory=list)
+
+    def reject(self, section: str, reason: str, entry: Any) -> None:
+        self.rejected.append((section, reason, entry))
+
+    @property
+    def size(self) -> int:
+        return len(self.effects) + sum(len(ids) for ids in self.discoveries.values())
+
+
+def _number(value: Any) -> int | float | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _meter_change(value: Any) -> tuple[str, int | float] | None:
+    """Read a meter delta: a number, or "+N" / "-N" / "=N" as the checker prompt asks for."""
+    if not isinstance(value, str):
+        number = _number(value)
+        return None if number is None else ("add", number)
+    text = value.strip()
+    op = "add"
+    if text.startswith("="):
+        op, text = "set", text[1:]
+    try:
+        number = float(text)
+    except ValueError:
+        return None
+    if not math.isfinite(number):
+        return None
+    return op, int(number) if number.is_integer() else number
+
+
+def _count(value: Any) -> int | None:
+    try:
+        count = abs(int(value))
+    except (TypeError, ValueError):
+        return None
+    return count or None
+
+
+class CheckerDeltaService:
+    """Validates checker replies against the game's schema and applies them in one batch."""
+
+    def __init__(self, runtime: SessionRuntime) -> None:
+        self.runtime = runtime
+        self.logger = runtime.logger
+
+    @property
+    def schema(self) -> CheckerDeltaSchema:
+        index = self.runtime.index
+        if index.checker_schema is None:
+            index.checker_schema = CheckerDeltaSchema.from_game(self.runtime.game)
+        return index.checker_schema
+
+    @staticmethod
+    def is_legacy(section: str) -> bool:
+        """Whether `section` belongs to the older reply format (see `compile`)."""
+        return section in _LEGACY_SECTIONS
+
+    def apply(self, deltas: dict, *, applied: int = 0) -> int:
+        """
+        Apply a checker reply (or some sections of it); returns how many changes were accepted.
+        `applied` counts the changes already taken from other sections of the same reply.
+        """
+        compiled = self.compile(deltas, applied=applied)
+        for section, reason, entry in compiled.rejected:
+            checker_metrics["deltas_rejected"] += 1
+            checker_metrics[f"rejected.{section}.{reason}"] += 1
+            self.logger.debug("Rejected checker delta in '%s' (%s): %r", section, reason, entry)
+        if compiled.effects:
+            self.runtime.effect_resolver.apply_effects(compiled.effects)
+        if compiled.discoveries:
+            self._apply_discoveries(compiled.discoveries)
+        checker_metrics["deltas_applied"] += compiled.size
+        return compiled.size
+
+    def compile(self, deltas: dict, *, applied: int = 0) -> CompiledDeltas:
+        """
+        Check every section against the schema and build its effects. Legacy
+        sections only count when nothing from the current format was accepted,
+        here or in the `applied` changes from earlier parts of the reply.
+        """
+        compiled = CompiledDeltas()
+        if not isinstance(deltas, dict):
+            return compiled
+        schema = self.schema
+        for section, compile_section in _SECTIONS.items():
+            payload = deltas.get(section)
+            if payload is not None:
+                compile_section(self, schema, payload, compiled)
+        if not applied and not compiled.size:
+            for section, compile_section in _LEGACY_SECTIONS.items():
+                payload = deltas.get(section)
+                if payload:
+                    compile_section(self, schema, payload, compiled)
+        return compiled
+
+    # ------------------------------------------------------------------ #
+    # Sections
+    # ------------------------------------------------------------------ #
+    def _meter(self, schema: CheckerDeltaSchema, compiled: CompiledDeltas, section: str,
+               char_id: Any, meter_id: Any, op: str, value: Any, entry: Any) -> None:
+        if not isinstance(char_id, str) or not isinstance(meter_id, str):
+            compiled.reject(section, "malformed", entry)
+        elif char_id not in schema.meters:
+            compiled.reject(section, "unknown_character", entry)
+        elif meter_id not in schema.meters[char_id]:
+            compiled.reject(section, "unknown_meter", entry)
+        else:
+            compiled.effects.append(MeterChangeEffect.model_construct(target=char_id, meter=meter_id, op=op, value=value))
+
+    def _compile_meters(self, schema: CheckerDeltaSchema, payload: Any, compiled: CompiledDeltas) -> None:
+        if not isinstance(payload, dict):
+            compiled.reject("meters", "malformed", payload)
+            return
+        for key, changes in payload.items():
+            if isinstance(changes, dict):
+                # {"<char>": {"<meter>": delta}}
+                for meter_id, raw in changes.items():
+                    change = _meter_change(raw)
+                    if change is None:
+                        compiled.reject("meters", "bad_value", {key: {meter_id: raw}})
+                    else:
+                        self._meter(schema, compiled, "meters", key, meter_id, *change, {key: {meter_id: raw}})
+            elif isinstance(changes, list):
+                # {"<char>": [{"meter": ..., "value": ..., "operation": ...}]}
+                for change in changes:
+                    if not isinstance(change, dict) or change.get("meter") is None:
+                        compiled.reject("meters", "malformed", change)
+                        continue
+                    value = _number(change.get("value"))
+                    if value is None:
+                        compiled.reject("meters", "bad_value", change)
+                        continue
+                    op = change.get("operation") or "add"
+                    if not isinstance(op, str) or op not in _METER_OPS:
+                        op = "add"
+                    self._meter(schema, compiled, "meters", key, change["meter"], op, value, change)
+            elif isinstance(key, str) and "." in key:
+                # {"<char>.<meter>": "+5"}
+                char_id, meter_id = key.split(".", 1)
+                change = _meter_change(changes)
+                if change is None:
+                    compiled.reject("meters", "bad_value", {key: changes})
+                else:
+                    self._meter(schema, compiled, "meters", char_id, meter_id, *change, {key: changes})
+            else:
+                compiled.reject("meters", "malformed", {key: changes})
+
+    def _flag(self, schema: CheckerDeltaSchema, compiled: CompiledDeltas, section: str, key: Any, value: Any) -> None:
+        if not isinstance(key, str):
+            compiled.reject(section, "malformed", {"key": key, "value": value})
+            return
+        flag_def = schema.flags.get(key)
+        if flag_def is None:
+            compiled.reject(section, "unknown_flag", {key: value})
+            return
+        check = _FLAG_TYPES.get(flag_def.type)
+        if check is not None and not check(value):
+            compiled.reject(section, "bad_value", {key: value})
+            return
+        if flag_def.allowed_values and value not in flag_def.allowed_values:
+            compiled.reject(section, "disallowed_value", {key: value})
+            return
+        compiled.effects.append(FlagSetEffect.model_construct(key=key, value=value))
+
+    def _compile_flags(self, schema: CheckerDeltaSchema, payload: Any, compiled: CompiledDeltas) -> None:
+        if isinstance(payload, dict):
+            for key, value in payload.items():
+                self._flag(schema, compiled, "flags", key, value)
+        elif isinstance(payload, list):
+            for change in payload:
+                if not isinstance(change, dict) or change.get("key") is None:
+                    compiled.reject("flags", "malformed", change)
+                else:
+                    self._flag(schema, compiled, "flags", change["key"], change.get("value"))
+        else:
+            compiled.reject("flags", "malformed", payload)
+
+    def _compile_inventory(self, schema: CheckerDeltaSchema, payload: Any, compiled: CompiledDeltas) -> None:
+        if not isinstance(payload, list):
+            compiled.reject("inventory", "malformed", payload)
+            return
+        location = self.runtime.state_manager.state.current_location
+        owners = schema.characters | schema.locations
+        for change in payload:
+            if not isinstance(change, dict):
+                compiled.reject("inventory", "malformed", change)
+                continue
+            op = str(change.get("op") or "").lower()
+            item_id = change.get("item")
+            count = _count(change.get("count", 1))
+            if not op or not item_id or not isinstance(item_id, str) or count is None:
+                compiled.reject("inventory", "malformed", change)
+                continue
+            item_type = schema.item_types.get(item_id)
+            if item_type is None:
+                compiled.reject("inventory", "unknown_item", change)
+                continue
+            item = {"item_type": item_type, "item": item_id, "count": count}
+            source = target = None
+
+            if op in ("add", "take"):
+                owner = change.get("owner") or change.get("to") or ("player" if op == "take" else None)
+            elif op in ("remove", "drop"):
+                owner = change.get("owner") or change.get("from") or ("player" if op == "drop" else None)
+            elif op == "give":
+                owner = change.get("from") or change.get("owner")
+                target = change.get("to")
+            elif op == "purchase":
+                owner = change.get("buyer") or "player"
+                source = change.get("seller") or location
+            elif op == "sell":
+                owner = change.get("seller") or "player"
+                target = change.get("buyer") or location
+            else:
+                compiled.reject("inventory", "unknown_op", change)
+                continue
+
+            if not all(isinstance(party, (str, type(None))) for party in (owner, source, target)):
+                compiled.reject("inventory", "malformed", change)
+                continue
+            if not owner or owner not in owners:
+                compiled.reject("inventory", "unknown_owner", change)
+                continue
+            if op == "add":
+                compiled.effects.append(InventoryAddEffect.model_construct(target=owner, **item))
+            elif op == "remove":
+                compiled.effects.append(InventoryRemoveEffect.model_construct(target=owner, **item))
+            elif op == "take":
+                compiled.effects.append(InventoryTakeEffect.model_construct(target=owner, **item))
+            elif op == "drop":
+                compiled.effects.append(InventoryDropEffect.model_construct(target=owner, **item))
+            elif op == "purchase":
+                price = change.get("price")
+                if source not in owners:
+                    compiled.reject("inventory", "unknown_owner", change)
+                    continue
+                if price is not None and _number(price) is None:
+                    compiled.reject("inventory", "bad_value", change)
+                    continue
+                compiled.effects.append(
+                    InventoryPurchaseEffect.model_construct(target=owner, source=source, price=price, **item)
+                )
+            elif not target or target not in owners:
+                compiled.reject("inventory", "unknown_owner", change)
+            elif op == "give":
+                compiled.effects.append(InventoryGiveEffect.model_construct(source=owner, target=target, **item))
+            else:
+                price = change.get("price")
+                if price is not None and _number(price) is None:
+                    compiled.reject("inventory", "bad_value", change)
+                    continue
+                compiled.effects.append(
+                    InventorySellEffect.model_construct(source=owner, target=target, price=price, **item)
+                )
+
+    def _compile_clothing(self, schema: CheckerDeltaSchema, payload: Any, compiled: CompiledDeltas) -> None:
+        if not isinstance(payload, list):
+            compiled.reject("clothing", "malformed", payload)
+            return
+        for change in payload:
+            if not isinstance(change, dict):
+                compiled.reject("clothing", "malformed", change)
+                continue
+            target = change.get("character") or change.get("target")
+            action_type = str(change.get("type") or "").lower()
+            slot = change.get("slot")
+            item = change.get("item")
+            condition = change.get("state")
+            if not all(isinstance(value, (str, type(None))) for value in (target, slot, item, condition)):
+                compiled.reject("clothing", "malformed", change)
+            elif target not in schema.characters:
+                compiled.reject("clothing", "unknown_character", change)
+            elif item is not None and item not in schema.clothing:
+                compiled.reject("clothing", "unknown_item", change)
+            elif condition is not None and condition not in _CONDITIONS:
+                compiled.reject("clothing", "bad_value", change)
+            elif action_type == "put_on" and item:
+                compiled.effects.append(ClothingPutOnEffect.model_construct(
+                    target=target, item=item, condition=ClothingCondition(condition) if condition else None,
+                ))
+            elif action_type == "take_off" and item:
+                compiled.effects.append(ClothingTakeOffEffect.model_construct(target=target, item=item))
+            elif action_type == "item_state" and item and condition:
+                compiled.effects.append(
+                    ClothingStateEffect.model_construct(target=target, item=item, condition=ClothingCondition(condition))
+                )
+            elif slot and condition:
+                compiled.effects.append(
+                    ClothingSlotStateEffect.model_construct(target=target, slot=slot, condition=ClothingCondition(condition))
+                )
+            else:
+                compiled.reject("clothing", "malformed", change)
+
+    def _compile_movement(self, schema: CheckerDeltaSchema, payload: Any, compiled: CompiledDeltas) -> None:
+        if not isinstance(payload, list):
+            compiled.reject("movement", "malformed", payload)
+            return
+        for change in payload:
+            if not isinstance(change, dict):
+                compiled.reject("movement", "malformed", change)
+                continue
+            move_type = str(change.get("type") or "").lower()
+            companions = change.get("with") or []
+            location = change.get("location")
+            method = change.get("method") or "walk"
+            if (
+                not isinstance(companions, list)
+                or not all(isinstance(char_id, str) for char_id in companions)
+                or not isinstance(location, (str, type(None)))
+                or not isinstance(method, str)
+            ):
+                compiled.reject("movement", "malformed", change)
+            elif not all(char_id in schema.characters for char_id in companions):
+                compiled.reject("movement", "unknown_character", change)
+            elif move_type == "move":
+                direction = str(change.get("direction") or "").lower()
+                if direction not in _DIRECTIONS:
+                    compiled.reject("movement", "bad_value", change)
+                else:
+                    compiled.effects.append(
+                        MoveEffect.model_construct(direction=LocalDirection(direction), with_characters=companions)
+                    )
+            elif move_type not in ("move_to", "travel_to"):
+                compiled.reject("movement", "malformed", change)
+            elif location not in schema.locations:
+                compiled.reject("movement", "unknown_location", change)
+            elif move_type == "move_to":
+                compiled.effects.append(MoveToEffect.model_construct(location=location, with_characters=companions))
+            else:
+                compiled.effects.append(TravelToEffect.model_construct(
+                    location=location, method=method, with_characters=companions,
+                ))
+
+    def _compile_discoveries(self, schema: CheckerDeltaSchema, payload: Any, compiled: CompiledDeltas) -> None:
+        if not isinstance(payload, dict):
+            compiled.reject("discoveries", "malformed", payload)
+            return
+        known = {
+            "locations": schema.locations,
+            "zones": schema.zones,
+            "actions": schema.actions,
+            "endings": schema.endings,
+        }
+        for kind, ids in known.items():
+            entries = payload.get(kind) or []
+            if not isinstance(entries, list):
+                compiled.reject("discoveries", "malformed", {kind: entries})
+                continue
+            for entry_id in entries:
+                if not isinstance(entry_id, str):
+                    compiled.reject("discoveries", "malformed", {kind: entry_id})
+                elif entry_id in ids:
+                    compiled.discoveries.setdefault(kind, []).append(entry_id)
+                else:
+                    compiled.reject("discoveries", f"unknown_{kind[:-1]}", entry_id)
+
+    def _compile_modifiers(self, schema: CheckerDeltaSchema, payload: Any, compiled: CompiledDeltas) -> None:
+        if not isinstance(payload, dict):
+            compiled.reject("modifiers", "malformed", payload)
+            return
+        for kind in ("add", "remove"):
+            changes = payload.get(kind) or []
+            if not isinstance(changes, list):
+                compiled.reject("modifiers", "malformed", {kind: changes})
+                continue
+            for change in changes:
+                if (
+                    not isinstance(change, dict)
+                    or not isinstance(change.get("modifier"), str) or not change["modifier"]
+                    or not isinstance(change.get("target"), str) or not change["target"]
+                ):
+                    compiled.reject("modifiers", "malformed", change)
+                elif change["modifier"] not in schema.modifiers:
+                    compiled.reject("modifiers", "unknown_modifier", change)
+                elif change["target"] not in schema.characters:
+                    compiled.reject("modifiers", "unknown_character", change)
+                elif kind == "remove":
+                    compiled.effects.append(
+                        RemoveModifierEffect.model_construct(target=change["target"], modifier_id=change["modifier"])
+                    )
+                else:
+                    duration = change.get("duration")
+                    if duration is not None and (_number(duration) is None or duration != int(duration)):
+                        compiled.reject("modifiers", "bad_value", change)
+                        continue
+                    compiled.effects.append(ApplyModifierEffect.model_construct(
+                        target=change["target"], modifier_id=change["modifier"],
+                        duration=None if duration is None else int(duration),
+                    ))
+
+    def _compile_legacy_meters(self, schema: CheckerDeltaSchema, payload: Any, compiled: CompiledDeltas) -> None:
+        if not isinstance(payload, dict):
+            compiled.reject("meter_changes", "malformed", payload)
+            return
+        for char_id, meters in payload.items():
+            if not isinstance(meters, dict):
+                compiled.reject("meter_changes", "malformed", {char_id: meters})
+                continue
+            for meter_id, raw in meters.items():
+                value = _number(raw)
+                if value is None:
+                    compiled.reject("meter_changes", "bad_value", {char_id: {meter_id: raw}})
+                else:
+                    self._meter(schema, compiled, "meter_changes", char_id, meter_id, "add", value, {char_id: {meter_id: raw}})
+
+    def _compile_legacy_flags(self, schema: CheckerDeltaSchema, payload: Any, compiled: CompiledDeltas) -> None:
+        if not isinstance(payload, dict):
+            compiled.reject("flag_changes", "malformed", payload)
+            return
+        for key, value in payload.items():
+            self._flag(schema, compiled, "flag_changes", key, value)
+
+    def _compile_legacy_inventory(self, schema: CheckerDeltaSchema, payload: Any, compiled: CompiledDeltas) -> None:
+        if not isinstance(payload, dict):
+            compiled.reject("inventory_changes", "malformed", payload)
+            return
+        owners = schema.characters | schema.locations
+        for owner_id, items in payload.items():
+            if not isinstance(items, dict):
+                compiled.reject("inventory_changes", "malformed", {owner_id: items})
+                continue
+            for item_id, raw in items.items():
+                entry = {owner_id: {item_id: raw}}
+                count = _number(raw)
+                item_type = schema.item_types.get(item_id)
+                if owner_id not in owners:
+                    compiled.reject("inventory_changes", "unknown_owner", entry)
+                elif item_type is None:
+                    compiled.reject("inventory_changes", "unknown_item", entry)
+                elif not count or count != int(count):
+                    compiled.reject("inventory_changes", "bad_value", entry)
+                else:
+                    effect = InventoryAddEffect if count > 0 else InventoryRemoveEffect
+                    compiled.effects.append(
+                        effect.model_construct(target=owner_id, item_type=item_type, item=item_id, count=abs(int(count)))
+                    )
+
+    def _compile_legacy_clothing(self, schema: CheckerDeltaSchema, payload: Any, compiled: CompiledDeltas) -> None:
+        if not isinstance(payload, dict):
+            compiled.reject("clothing_changes", "malformed", payload)
+            return
+        for char_id, items in payload.items():
+            if not isinstance(items, dict):
+                compiled.reject("clothing_changes", "malformed", {char_id: items})
+                continue
+            for item_id, condition in items.items():
+                entry = {char_id: {item_id: condition}}
+                if char_id not in schema.characters:
+                    compiled.reject("clothing_changes", "unknown_character", entry)
+                elif item_id not in schema.clothing:
+                    compiled.reject("clothing_changes", "unknown_item", entry)
+                elif not isinstance(condition, str) or condition not in _CONDITIONS:
+                    compiled.reject("clothing_changes", "bad_value", entry)
+                else:
+                    compiled.effects.append(ClothingStateEffect.model_construct(
+                        target=char_id, item=item_id, condition=ClothingCondition(condition),
+                    ))
+
+    # ------------------------------------------------------------------ #
+    # Application
+    # ------------------------------------------------------------------ #
+    def _apply_discoveries(self, discoveries: dict[str, list[str]]) -> None:
+        state = self.runtime.state_manager.state
+        journal = self.runtime.state_manager.journal
+        for location_id in discoveries.get("locations", ()):
+            journal.add(state.discovered_locations, location_id)
+        for zone_id in discoveries.get("zones", ()):
+            journal.add(state.discovered_zones, zone_id)
+        for action_id in discoveries.get("actions", ()):
+            if action_id not in state.unlocked_actions:
+                journal.append(state.unlocked_actions, action_id)
+        for ending_id in discoveries.get("endings", ()):
+            if ending_id not in state.unlocked_endings:
+                journal.append(state.unlocked_endings, ending_id)
+
+
+_SECTIONS: dict[str, Callable[[CheckerDeltaService, CheckerDeltaSchema, Any, CompiledDeltas], None]] = {
+    "meters": CheckerDeltaService._compile_meters,
+    "flags": CheckerDeltaService._compile_flags,
+    "inventory": CheckerDeltaService._compile_inventory,
+    "clothing": CheckerDeltaService._compile_clothing,
+    "movement": CheckerDeltaService._compile_movement,
+    "discoveries": CheckerDeltaService._compile_discoveries,
+    "modifiers": CheckerDeltaService._compile_modifiers,
+}
+
+_LEGACY_SECTIONS: dict[str, Callable[[CheckerDeltaService, CheckerDeltaSchema, Any, CompiledDeltas], None]] = {
+    "meter_changes": CheckerDeltaService._compile_legacy_meters,
+    "flag_changes": CheckerDeltaService._compile_legacy_flags,
+    "inventory_changes": CheckerDeltaService._compile_legacy_inventory,
+    "clothing_changes": CheckerDeltaService._compile_legacy_clothing,
+}
@@ -44,6 +44,15 @@ class ClothingService:
     # ------------------------------------------------------------------ #
     # Internal helpers
     # ------------------------------------------------------------------ #
+    def _journal(self, char_id: str, char_state) -> None:
+        """Record the character's clothing state about to be changed in the turn journal."""
+        journal = self.runtime.state_manager.journal
+        clothing_states = self.runtime.state_manager.state.clothing_states
+        journal.record_item(clothing_states, char_id)
+        journal.touch(clothing_states.get(char_id))
+        if char_state is not None:
+            journal.touch(char_state.clothing)
+
     def _put_on(self, char_id: str, clothing_id: str, condition) -> None:
         state = self.runtime.state_manager.state
         char_state = state.characters.get(char_id)
@@ -58,6 +67,7 @@ class ClothingService:
         if char_state.inventory.clothing.get(clothing_id, 0) <= 0:
             raise ValueError(f"Cannot put on '{clothing_id}': not in inventory")
 
+        self._journal(char_id, char_state)
         char_state.clothing.items[clothing_id] = condition or clothing_def.condition
         slot_state = state.clothing_states.setdefault(char_id, {"slot_to_item": {}, "slot_state": {}})
         for slot in clothing_def.occupies:
@@ -77,6 +87,7 @@ class ClothingService:
         if not clothing_def:
             return
 
+        self._journal(char_id, char_state)
         if clothing_id in char_state.clothing.items:
             char_state.clothing.items[clothing_id] = "removed"
 
@@ -98,6 +109,7 @@ class ClothingService:
             return
         if clothing_id not in char_state.clothing.items:
             return
+        self._journal(char_id, char_state)
         char_state.clothing.items[clothing_id] = condition
         clothing_def = self.inventory and self.inventory.clothing_defs.get(clothing_id)
         if clothing_def:
@@ -108,6 +120,7 @@ class ClothingService:
 
     def _set_slot_state(self, char_id: str, slot: str, condition) -> None:
         state = self.runtime.state_manager.state
+        self._journal(char_id, None)
         slot_state = state.clothing_states.setdefault(char_id, {"slot_to_item": {}, "slot_state": {}})
         slot_state["slot_state"][slot] = condition.value if hasattr(condition, "value") else condition
 
@@ -133,6 +146,7 @@ class ClothingService:
                 f"Outfit is incomplete and cannot be worn until all items are acquired."
             )
 
+        self._journal(char_id, char_state)
         char_state.clothing.outfit = outfit_id
         char_state.clothing.items.update({item_id: state_val for item_id, state_val in outfit_def.items.items()})
 
@@ -155,6 +169,7 @@ class ClothingService:
             return
 
         outfit_def = self.inventory and self.inventory.outfit_defs.get(outfit_id)
+        self._journal(char_id, char_state)
         char_state.clothing.outfit = None
 
         if outfit_def:
@@ -16,16 +16,17 @@ class DiscoveryService:
     def refresh(self) -> None:
         state = self.runtime.state_manager.state
         evaluator = self.runtime.state_manager.create_evaluator()
+        journal = self.runtime.state_manager.journal
 
         # Always ensure the current zone/location are marked as discovered
         if state.current_zone:
-            state.discovered_zones.add(state.current_zone)
+            journal.add(state.discovered_zones, state.current_zone)
             if state.current_zone in state.zones:
-                state.zones[state.current_zone].discovered = True
+                journal.set_attr(state.zones[state.current_zone], "discovered", True)
         if state.current_location:
-            state.discovered_locations.add(state.current_location)
+            journal.add(state.discovered_locations, state.current_location)
             if state.current_location in state.locations:
-                state.locations[state.current_location].discovered = True
+                journal.set_attr(state.locations[state.current_location], "discovered", True)
 
         for zone in self.runtime.game.zones:
             access = getattr(zone, "access", None)
@@ -36,11 +37,11 @@ class DiscoveryService:
 
             if zone.id not in state.discovered_zones:
                 if auto_discovered or (condition and evaluator.evaluate(condition)):
-                    state.discovered_zones.add(zone.id)
+                    journal.add(state.discovered_zones, zone.id)
                     if zone_state:
-                        zone_state.discovered = True
+                        journal.set_attr(zone_state, "discovered", True)
                     for loc in zone.locations:
-                        state.discovered_locations.add(loc.id)
+                        journal.add(state.discovered_locations, loc.id)
                 elif hidden_until:
                     continue
 
@@ -54,8 +55,8 @@ class DiscoveryService:
                 if location.id in state.discovered_locations:
                     continue
                 if auto_loc or (loc_condition and evaluator.evaluate(loc_condition)):
-                    state.discovered_locations.add(location.id)
+                    journal.add(state.discovered_locations, location.id)
                     if loc_state:
-                        loc_state.discovered = True
+                        journal.set_attr(loc_state, "discovered", True)
                 elif hidden_loc:
                     continue
@@ -8,7 +8,11 @@ the turn pipeline without pulling every legacy detail at once.
 from __future__ import annotations
 
 import random
-from typing import Iterable
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+from pydantic import ValidationError
 
 from app.core.conditions import ConditionEvaluator
 from app.models.effects import (
@@ -39,152 +43,295 @@ from app.models.effects import (
     ClothingSlotStateEffect,
     OutfitPutOnEffect,
     OutfitTakeOffEffect,
+    parse_effect,
 )
 from app.runtime.session import SessionRuntime
 from app.runtime.services.inventory import InventoryService
 
 
+@dataclass(slots=True)
+class EffectOp:
+    """
+    One instruction of a compiled effect program.
+
+    kind is "exec" (run `handler`), "branch" (evaluate the conditional's guards and
+    jump to `target` when false) or "jump" (continue at `target`).
+    """
+    kind: str
+    effect: Any = None
+    handler: Callable[["EffectResolver", Any, "EffectOp"], None] | None = None
+    guarded: bool = False
+    target: int = 0
+    bound: Any = None
+
+
+@dataclass(slots=True, frozen=True)
+class EffectProgram:
+    """A flat, pre-parsed effect list with conditionals lowered to jumps."""
+    ops: tuple[EffectOp, ...]
+
+
+def _has_guards(effect: Any) -> bool:
+    when = getattr(effect, "when", None)
+    if when and when.strip().lower() not in {"always", "true"}:
+        return True
+    return bool(getattr(effect, "when_all", None) or getattr(effect, "when_any", None))
+
+
+def _definition_effect_lists(index: Any) -> Iterable[list]:
+    """Yield every effect list declared by the game definition."""
+    for node in list(index.nodes.values()) + list(index.events.values()):
+        yield node.on_enter
+        yield node.on_exit
+        for choice in list(node.choices) + list(node.dynamic_choices) + list(node.triggers):
+            yield choice.on_select
+    for arc in index.arcs.values():
+        for stage in arc.stages:
+            yield stage.on_enter
+            yield stage.on_exit
+    for modifier in index.modifiers.values():
+        yield modifier.on_enter
+        yield modifier.on_exit
+    for item in index.items.values():
+        yield item.on_get
+        yield item.on_lost
+        yield item.on_use
+        yield item.on_give
+    for wearable in list(index.clothing.values()) + list(index.outfits.values()):
+        yield wearable.on_get
+        yield wearable.on_lost
+        yield wearable.on_put_on
+        yield wearable.on_take_off
+    for action in index.actions.values():
+        yield action.effects
+
+
 class EffectResolver:
-    """Applies a limited subset of effects to the current state."""
+    """
+    Applies effects to the current state.
+
+    Effect lists are compiled into flat EffectPrograms (parsed once, dispatched by
+    type, conditionals lowered to jumps). Programs for lists owned by the game
+    definition are cached on the GameIndex and shared by every session of the game.
+    """
 
     def __init__(self, runtime: SessionRuntime, inventory: InventoryService, trade=None, **_unused) -> None:
         self.runtime = runtime
         self.inventory = inventory
         self.trade = trade
+        self.stats: Counter[str] = Counter()
+        self._active_evaluator: ConditionEvaluator | None = None
+        if not runtime.index.effect_programs:
+            self._precompile_definitions()
 
     def apply_effects(self, effects: Iterable[AnyEffect]) -> None:
-        from app.models.effects import parse_effect
+        self.run(self.compile(effects))
 
-        evaluator = self._evaluator()
-        for effect in effects:
-            if isinstance(effect, dict):
-                effect = parse_effect(effect)
+    # ------------------------------------------------------------------ #
+    # Compilation
+    # ------------------------------------------------------------------ #
 
-            if isinstance(effect, ConditionalEffect):
-                self._apply_conditional(effect)
+    def compile(self, effects: Iterable[AnyEffect]) -> EffectProgram:
+        """Return the compiled program for an effect list, reusing cached definition programs."""
+        entry = self.runtime.index.effect_programs.get(id(effects))
+        if entry is not None and entry[0] is effects:
+            return entry[1]
+        ops: list[EffectOp] = []
+        self._emit(effects or [], ops)
+        return EffectProgram(tuple(ops))
+
+    def _precompile_definitions(self) -> None:
+        cache = self.runtime.index.effect_programs
+        for effects in _definition_effect_lists(self.runtime.index):
+            if not effects or id(effects) in cache:
                 continue
+            try:
+                for raw in effects:
+                    if isinstance(raw, dict):
+                        cache[id(raw)] = (raw, parse_effect(raw))
+                cache[id(effects)] = (effects, self.compile(effects))
+            except (ValidationError, ValueError) as exc:
+                # Leave invalid lists uncompiled so they fail where they are applied.
+                self.runtime.logger.debug("Skipping effect list precompilation: %s", exc)
+
+    def _parse(self, raw: Any) -> AnyEffect:
+        if not isinstance(raw, dict):
+            return raw
+        entry = self.runtime.index.effect_programs.get(id(raw))
+        if entry is not None and entry[0] is raw:
+            return entry[1]
+        return parse_effect(raw)
+
+    def _emit(self, effects: Iterable[Any], ops: list[EffectOp]) -> None:
+        for raw in effects:
+            effect = self._parse(raw)
 
-            if not evaluator.evaluate_object_conditions(effect):
+            if isinstance(effect, ConditionalEffect):
+                branch = EffectOp("branch", effect)
+                ops.append(branch)
+                self._emit(effect.then or [], ops)
+                if effect.otherwise:
+                    jump = EffectOp("jump")
+                    ops.append(jump)
+                    branch.target = len(ops)
+                    self._emit(effect.otherwise, ops)
+                    jump.target = len(ops)
+                else:
+                    branch.target = len(ops)
                 continue
 
+            op = EffectOp(
+                "exec",
+                effect,
+                _DISPATCH.get(type(effect), EffectResolver._apply_unsupported),
+                guarded=_has_guards(effect),
+            )
             if isinstance(effect, RandomEffect):
-                self._apply_random(effect)
-            elif isinstance(effect, MeterChangeEffect):
-                self._apply_meter_change(effect)
-            elif isinstance(effect, FlagSetEffect):
-                self._apply_flag(effect)
-            elif isinstance(effect, GotoEffect):
-                self._apply_goto(effect)
-            elif isinstance(effect, InventoryAddEffect) or isinstance(effect, InventoryRemoveEffect):
-                hooks = self.inventory.apply_effect(effect)
-                if hooks:
-                    self.apply_effects(hooks)
-            elif isinstance(effect, InventoryTakeEffect):
-                trade = self.trade or getattr(self.runtime, "trade_service", None)
-                hooks = trade.take_from_location(effect) if trade else None
-                if hooks:
-                    self.apply_effects(hooks)
-            elif isinstance(effect, InventoryDropEffect):
-                trade = self.trade or getattr(self.runtime, "trade_service", None)
-                hooks = trade.drop_to_location(effect) if trade else None
-                if hooks:
-                    self.apply_effects(hooks)
-            elif isinstance(effect, InventoryPurchaseEffect):
-                trade = self.trade or getattr(self.runtime, "trade_service", None)
-                hooks = trade.purchase(effect) if trade else None
-                if hooks:
-                    self.apply_effects(hooks)
-            elif isinstance(effect, InventorySellEffect):
-                trade = self.trade or getattr(self.runtime, "trade_service", None)
-                hooks = trade.sell(effect) if trade else None
-                if hooks:
-                    self.apply_effects(hooks)
-            elif isinstance(effect, InventoryGiveEffect):
-                trade = self.trade or getattr(self.runtime, "trade_service", None)
-                hooks = trade.give(effect) if trade else None
-                if hooks:
-                    self.apply_effects(hooks)
-            elif isinstance(effect, MoveToEffect):
-                mover = getattr(self.runtime, "movement_service", None)
-                if mover:
-                    mover.move_to(effect)
-            elif isinstance(effect, MoveEffect):
-                mover = getattr(self.runtime, "movement_service", None)
-                if mover:
-                    mover.move_relative(effect)
-            elif isinstance(effect, TravelToEffect):
-                mover = getattr(self.runtime, "movement_service", None)
-                if mover:
-                    mover.travel(effect)
-            elif isinstance(effect, AdvanceTimeEffect):
-                time_service = getattr(self.runtime, "time_service", None)
-                if time_service:
-                    info = time_service.advance_minutes(effect.minutes)
-                    ctx = getattr(self.runtime, "current_context", None)
-                    if ctx:
-                        ctx.time_advanced_minutes += info.get("minutes", 0)
-                        ctx.day_advanced = ctx.day_advanced or info.get("day_advanced", False)
-                        ctx.slot_advanced = ctx.slot_advanced or info.get("slot_advanced", False)
-            elif isinstance(effect, ApplyModifierEffect) or isinstance(effect, RemoveModifierEffect):
-                modifiers = getattr(self.runtime, "modifier_service", None)
-                if modifiers:
-                    modifiers.apply_effect(effect, state=self.runtime.state_manager.state)
-            elif isinstance(effect, LockEffect):
-                mover = getattr(self.runtime, "movement_service", None)
-                if mover:
-                    mover.apply_lock(effect)
-            elif isinstance(effect, UnlockEffect):
-                mover = getattr(self.runtime, "movement_service", None)
-                if mover:
-                    mover.apply_unlock(effect)
-            elif isinstance(effect, ClothingPutOnEffect) or isinstance(effect, ClothingTakeOffEffect) or isinstance(effect, ClothingStateEffect) or isinstance(effect, ClothingSlotStateEffect):
-                clothing = getattr(self.runtime, "clothing_service", None)
-                if clothing:
-                    clothing.apply_effect(effect)
-            elif isinstance(effect, OutfitPutOnEffect) or isinstance(effect, OutfitTakeOffEffect):
-                clothing = getattr(self.runtime, "clothing_service", None)
-                if clothing:
-                    clothing.apply_outfit_effect(effect)
-            else:
-                self.runtime.logger.debug("Ignoring unsupported effect type: %s", getattr(effect, "type", type(effect)))
+                op.bound = tuple((choice.weight, self.compile(choice.effects)) for choice in effect.choices)
+            elif isinstance(effect, (InventoryAddEffect, InventoryRemoveEffect)):
+                op.bound = self.inventory.get_item_definition(effect.item)
+            ops.append(op)
+
+    # ------------------------------------------------------------------ #
+    # Execution
+    # ------------------------------------------------------------------ #
+
+    def run(self, program: EffectProgram, evaluator: ConditionEvaluator | None = None) -> None:
+        """Execute a compiled program with a single evaluator for the whole batch."""
+        evaluator = evaluator or self._evaluator()
+        previous, self._active_evaluator = self._active_evaluator, evaluator
+        ops = program.ops
+        end = len(ops)
+        stats = self.stats
+        pc = 0
+        try:
+            while pc < end:
+                op = ops[pc]
+                if op.kind == "exec":
+                    if not op.guarded or evaluator.evaluate_object_conditions(op.effect):
+                        stats[op.effect.type] += 1
+                        op.handler(self, op.effect, op)
+                    pc += 1
+                elif op.kind == "branch":
+                    # Branches observe the effects applied so far in this batch.
+                    evaluator.refresh()
+                    stats["conditional"] += 1
+                    pc = pc + 1 if evaluator.evaluate_object_conditions(op.effect) else op.target
+                else:
+                    pc = op.target
+        finally:
+            self._active_evaluator = previous
+
+    def _run_nested(self, effects: Iterable[AnyEffect] | EffectProgram) -> None:
+        program = effects if isinstance(effects, EffectProgram) else self.compile(effects)
+        evaluator = self._active_evaluator
+        if evaluator is not None:
+            evaluator.refresh()
+        self.run(program, evaluator)
 
     # ------------------------------------------------------------------ #
-    # Helpers
+    # Handlers
     # ------------------------------------------------------------------ #
 
     def _evaluator(self) -> ConditionEvaluator:
         return self.runtime.state_manager.create_evaluator()
 
-    def _apply_conditional(self, effect: ConditionalEffect) -> None:
-        if self._evaluator().evaluate_object_conditions(effect):
-            self.apply_effects(effect.then or [])
+    def _trade(self):
+        return self.trade or getattr(self.runtime, "trade_service", None)
+
+    def _exec_meter_change(self, effect: MeterChangeEffect, _op: EffectOp) -> None:
+        self._apply_meter_change(effect)
+
+    def _exec_flag(self, effect: FlagSetEffect, _op: EffectOp) -> None:
+        self._apply_flag(effect)
+
+    def _exec_goto(self, effect: GotoEffect, _op: EffectOp) -> None:
+        self._apply_goto(effect)
+
+    def _exec_inventory(self, effect: InventoryAddEffect | InventoryRemoveEffect, op: EffectOp) -> None:
+        hooks = self.inventory.apply_effect(effect, item_def=op.bound)
+        if hooks:
+            self._run_nested(hooks)
+
+    def _exec_trade(self, effect: Any, _op: EffectOp) -> None:
+        trade = self._trade()
+        if not trade:
+            return
+        handler = {
+            "inventory_take": trade.take_from_location,
+            "inventory_drop": trade.drop_to_location,
+            "inventory_purchase": trade.purchase,
+            "inventory_sell": trade.sell,
+            "inventory_give": trade.give,
+        }[effect.type]
+        hooks = handler(effect)
+        if hooks:
+            self._run_nested(hooks)
+
+    def _exec_movement(self, effect: Any, _op: EffectOp) -> None:
+        mover = getattr(self.runtime, "movement_service", None)
+        if not mover:
+            return
+        if isinstance(effect, MoveToEffect):
+            mover.move_to(effect)
+        elif isinstance(effect, MoveEffect):
+            mover.move_relative(effect)
+        elif isinstance(effect, TravelToEffect):
+            mover.travel(effect)
+        elif isinstance(effect, LockEffect):
+            mover.apply_lock(effect)
         else:
-            self.apply_effects(effect.otherwise or [])
+            mover.apply_unlock(effect)
 
-    def _apply_random(self, effect: RandomEffect) -> None:
-        total = sum(choice.weight for choice in effect.choices)
+    def _exec_advance_time(self, effect: AdvanceTimeEffect, _op: EffectOp) -> None:
+        time_service = getattr(self.runtime, "time_service", None)
+        if not time_service:
+            return
+        info = time_service.advance_minutes(effect.minutes)
+        ctx = getattr(self.runtime, "current_context", None)
+        if ctx:
+            ctx.time_advanced_minutes += info.get("minutes", 0)
+            ctx.day_advanced = ctx.day_advanced or info.get("day_advanced", False)
+            ctx.slot_advanced = ctx.slot_advanced or info.get("slot_advanced", False)
+
+    def _exec_modifier(self, effect: ApplyModifierEffect | RemoveModifierEffect, _op: EffectOp) -> None:
+        modifiers = getattr(self.runtime, "modifier_service", None)
+        if modifiers:
+            modifiers.apply_effect(effect, state=self.runtime.state_manager.state)
+
+    def _exec_clothing(self, effect: Any, _op: EffectOp) -> None:
+        clothing = getattr(self.runtime, "clothing_service", None)
+        if clothing:
+            clothing.apply_effect(effect)
+
+    def _exec_outfit(self, effect: OutfitPutOnEffect | OutfitTakeOffEffect, _op: EffectOp) -> None:
+        clothing = getattr(self.runtime, "clothing_service", None)
+        if clothing:
+            clothing.apply_outfit_effect(effect)
+
+    def _exec_random(self, effect: RandomEffect, op: EffectOp) -> None:
+        total = sum(weight for weight, _ in op.bound)
         if total <= 0:
             return
         rng = random.Random(self.runtime.turn_seed())
         roll = rng.uniform(0, total)
         current = 0
-        for choice in effect.choices:
-            current += choice.weight
+        for weight, program in op.bound:
+            current += weight
             if roll <= current:
-                self.apply_effects(choice.effects)
+                self._run_nested(program)
                 return
 
+    def _apply_unsupported(self, effect: Any, _op: EffectOp) -> None:
+        self.runtime.logger.debug("Ignoring unsupported effect type: %s", getattr(effect, "type", type(effect)))
+
     def _apply_meter_change(self, effect: MeterChangeEffect) -> None:
         state = self.runtime.state_manager.state
         target = state.meters.get(effect.target)
         if target is None:
             return
 
-        meter_def = (
-            self.runtime.index.player_meters.get(effect.meter)
-            if effect.target == "player"
-            else self.runtime.index.template_meters.get(effect.meter)
-        )
+        meter_def = self.runtime.index.meter_def(effect.target, effect.meter)
         if not meter_def:
             return
 
@@ -228,38 +375,41 @@ class EffectResolver:
         if effect.respect_caps:
             new_value = max(meter_def.min, min(meter_def.max, new_value))
 
-        target[effect.meter] = new_value
+        self.runtime.state_manager.journal.set_item(target, effect.meter, new_value)
 
     def _apply_modifier_clamps(self, char_id: str, meter_id: str, value: float) -> float:
         """Clamp meter value based on active modifiers."""
-        modifier_service = getattr(self.runtime, "modifier_service", None)
-        state = self.runtime.state_manager.state
-        if not modifier_service:
+        bounds = self.modifier_clamp_bounds(char_id).get(meter_id)
+        if bounds is None:
             return value
-
-        clamps_min = None
-        clamps_max = None
-        active_mods = state.modifiers.get(char_id, [])
-        for mod in active_mods:
-            mod_def = modifier_service.library.get(mod.get("id"))
-            if not mod_def:
-                continue
-            clamp_config = None
-            if getattr(mod_def, "clamp_meters", None):
-                clamp_config = mod_def.clamp_meters.get(meter_id)
-            if not clamp_config:
-                continue
-            if clamp_config.min is not None:
-                clamps_min = clamp_config.min if clamps_min is None else max(clamps_min, clamp_config.min)
-            if clamp_config.max is not None:
-                clamps_max = clamp_config.max if clamps_max is None else min(clamps_max, clamp_config.max)
-
+        clamps_min, clamps_max = bounds
         if clamps_min is not None:
             value = max(clamps_min, value)
         if clamps_max is not None:
             value = min(clamps_max, value)
         return value
 
+    def modifier_clamp_bounds(self, char_id: str) -> dict[str, tuple[float | None, float | None]]:
+        """The tightest (min, max) clamp active modifiers place on each of a character's meters."""
+        modifier_service = getattr(self.runtime, "modifier_service", None)
+        if not modifier_service:
+            return {}
+        bounds: dict[str, tuple[float | None, float | None]] = {}
+        for mod in self.runtime.state_manager.state.modifiers.get(char_id, []):
+            mod_def = modifier_service.library.get(mod.get("id"))
+            if not mod_def or not getattr(mod_def, "clamp_meters", None):
+                continue
+            for meter_id, clamp_config in mod_def.clamp_meters.items():
+                if not clamp_config:
+                    continue
+                clamps_min, clamps_max = bounds.get(meter_id, (None, None))
+                if clamp_config.min is not None:
+                    clamps_min = clamp_config.min if clamps_min is None else max(clamps_min, clamp_config.min)
+                if clamp_config.max is not None:
+                    clamps_max = clamp_config.max if clamps_max is None else min(clamps_max, clamp_config.max)
+                bounds[meter_id] = (clamps_min, clamps_max)
+        return bounds
+
     def _apply_flag(self, effect: FlagSetEffect) -> None:
         state = self.runtime.state_manager.state
         if effect.key not in state.flags:
@@ -272,8 +422,37 @@ class EffectResolver:
                 self.runtime.logger.debug("Flag '%s' value '%s' not in allowed_values; skipping", effect.key, effect.value)
                 return
 
-        state.flags[effect.key] = effect.value
+        self.runtime.state_manager.journal.set_item(state.flags, effect.key, effect.value)
 
     def _apply_goto(self, effect: GotoEffect) -> None:
         if effect.node in self.runtime.index.nodes:
-            self.runtime.state_manager.state.current_node = effect.node
+            self.runtime.state_manager.journal.set_attr(self.runtime.state_manager.state, "current_node", effect.node)
+
+
+_DISPATCH: dict[type, Callable[[EffectResolver, Any, EffectOp], None]] = {
+    MeterChangeEffect: EffectResolver._exec_meter_change,
+    FlagSetEffect: EffectResolver._exec_flag,
+    GotoEffect: EffectResolver._exec_goto,
+    RandomEffect: EffectResolver._exec_random,
+    InventoryAddEffect: EffectResolver._exec_inventory,
+    InventoryRemoveEffect: EffectResolver._exec_inventory,
+    InventoryTakeEffect: EffectResolver._exec_trade,
+    InventoryDropEffect: EffectResolver._exec_trade,
+    InventoryPurchaseEffect: EffectResolver._exec_trade,
+    InventorySellEffect: EffectResolver._exec_trade,
+    InventoryGiveEffect: EffectResolver._exec_trade,
+    MoveToEffect: EffectResolver._exec_movement,
+    MoveEffect: EffectResolver._exec_movement,
+    TravelToEffect: EffectResolver._exec_movement,
+    LockEffect: EffectResolver._exec_movement,
+    UnlockEffect: EffectResolver._exec_movement,
+    AdvanceTimeEffect: EffectResolver._exec_advance_time,
+    ApplyModifierEffect: EffectResolver._exec_modifier,
+    RemoveModifierEffect: EffectResolver._exec_modifier,
+    ClothingPutOnEffect: EffectResolver._exec_clothing,
+    ClothingTakeOffEffect: EffectResolver._exec_clothing,
+    ClothingStateEffect: EffectResolver._exec_clothing,
+    ClothingSlotStateEffect: EffectResolver._exec_clothing,
+    OutfitPutOnEffect: EffectResolver._exec_outfit,
+    OutfitTakeOffEffect: EffectResolver._exec_outfit,
+}
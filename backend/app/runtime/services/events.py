@@ -68,7 +68,7 @@ class EventPipeline:
         for event in triggered:
             result.events_fired.append(event.id)
             if event.id not in state.events_history:
-                state.events_history.append(event.id)
+                self.runtime.state_manager.journal.append(state.events_history, event.id)
             if event.beats:
                 result.narratives.extend(event.beats)
             if event.choices:
@@ -106,8 +106,11 @@ class EventPipeline:
                 if stage.on_enter:
                     self.runtime.effect_resolver.apply_effects(stage.on_enter)
 
+                journal = self.runtime.state_manager.journal
                 if not arc_state:
+                    journal.record_item(state.arcs, arc.id)
                     arc_state = state.arcs.setdefault(arc.id, ArcState(id=arc.id, stage=None))
+                journal.touch(arc_state)
                 arc_state.stage = stage.id
                 if not getattr(arc_state, "history", None):
                     arc_state.history = []
@@ -120,14 +123,15 @@ class EventPipeline:
     def decrement_cooldowns(self) -> None:
         """Reduce event cooldown timers each turn."""
         state = self.runtime.state_manager.state
+        journal = self.runtime.state_manager.journal
         expired = []
-        for event_id, remaining in state.cooldowns.items():
+        for event_id, remaining in list(state.cooldowns.items()):
             if remaining > 0:
-                state.cooldowns[event_id] = remaining - 1
-                if state.cooldowns[event_id] <= 0:
+                journal.set_item(state.cooldowns, event_id, remaining - 1)
+                if remaining - 1 <= 0:
                     expired.append(event_id)
         for event_id in expired:
-            state.cooldowns.pop(event_id, None)
+            journal.pop_item(state.cooldowns, event_id)
 
     # ------------------------------------------------------------------ #
     # Helpers
@@ -145,4 +149,4 @@ class EventPipeline:
 
     def _apply_cooldown(self, event: Event, state) -> None:
         if event.cooldown and event.cooldown > 0:
-            state.cooldowns[event.id] = event.cooldown
+            self.runtime.state_manager.journal.set_item(state.cooldowns, event.id, event.cooldown)
@@ -64,13 +64,19 @@ class InventoryService:
             )
         return effects
 
-    def apply_effect(self, effect: InventoryAddEffect | InventoryRemoveEffect) -> List[AnyEffect]:
+    def apply_effect(
+        self,
+        effect: InventoryAddEffect | InventoryRemoveEffect,
+        *,
+        item_def: Any | None = None,
+    ) -> List[AnyEffect]:
         """
         Apply a single inventory effect to state and trigger item hooks.
+        `item_def` may be passed by callers that already resolved the definition.
         """
         state = self.runtime.state_manager.state
 
-        item_def = self.get_item_definition(effect.item)
+        item_def = item_def or self.get_item_definition(effect.item)
         if not item_def:
             return []
 
@@ -83,6 +89,7 @@ class InventoryService:
         if bucket is None:
             return []
 
+        journal = self.runtime.state_manager.journal
         current_count = bucket.get(effect.item, 0)
         if effect.type == "inventory_add":
             new_count = current_count + effect.count
@@ -94,6 +101,7 @@ class InventoryService:
         if effect.item_type in (None, "item") and not self._is_stackable(item_def):
             new_count = max(0, min(1, new_count))
 
+        journal.record_item(bucket, effect.item)
         bucket[effect.item] = max(0, new_count)
         if bucket[effect.item] == 0:
             bucket.pop(effect.item, None)
@@ -182,6 +190,7 @@ class InventoryService:
         if bucket.get(item_id, 0) < count:
             return []
 
+        self.runtime.state_manager.journal.record_item(bucket, item_id)
         bucket[item_id] -= count
         if bucket[item_id] <= 0:
             bucket.pop(item_id, None)
@@ -211,7 +220,7 @@ class InventoryService:
         )
 
         bucket = location_state.inventory.items
-        bucket[item_id] = bucket.get(item_id, 0) + count
+        self.runtime.state_manager.journal.set_item(bucket, item_id, bucket.get(item_id, 0) + count)
         return triggered
 
     # Utility helpers -----------------------------------------------------------
@@ -255,6 +264,9 @@ class InventoryService:
         """
         granted_items = []
         outfit_items = getattr(outfit_def, "items", {})
+        journal = self.runtime.state_manager.journal
+        journal.touch(owner_state.inventory.clothing)
+        journal.touch(owner_state.outfit_granted_items)
 
         for clothing_id in outfit_items.keys():
             # Only grant if not already owned
@@ -278,6 +290,9 @@ class InventoryService:
         """
         removed_items = []
         granted = owner_state.outfit_granted_items.get(outfit_id, set())
+        journal = self.runtime.state_manager.journal
+        journal.touch(owner_state.inventory.clothing)
+        journal.touch(owner_state.outfit_granted_items)
 
         for clothing_id in granted:
             # Only remove if still owned
@@ -0,0 +1,257 @@
+"""
+Long-term memory store for the new runtime engine.
+
+The writer only sees the rolling summary and the last few scenes, while older
+scenes and character memories pile up. MemoryService keeps them retrievable in
+GameState.memories instead:
+
+- every turn adds a "scene" entry tagged with the NPCs present, and every
+  character memory from the checker a "memory" entry for that character;
+- once a day is over its scenes are folded into one "day" chunk and each
+  character's memories of that day into one "memory" entry, and an arc
+  milestone adds an "arc" chunk covering the arc character's scenes since the
+  arc's previous milestone;
+- narrative_history is trimmed to `memory_history_limit` narratives, and each
+  character's memory_log to its latest `memory_log_limit` memories.
+
+Chunks are extractive digests (leading sentences of each scene), so folding
+costs no model call. Retrieval ranks entries with a local BM25 index against
+the player's action and the present characters' names.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+from app.core.settings import GameSettings
+from app.core.text_index import BM25Index
+from app.models.arcs import Arc
+from app.models.game import GameState
+from app.models.memory import MemoryEntry
+from app.runtime.session import SessionRuntime
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def _clip(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    if limit <= 0 or len(text) <= limit:
+        return text
+    return text[:limit - 1].rstrip() + "…"
+
+
+def _sentence(text: str) -> str:
+    text = text.strip()
+    return text if not text or text[-1] in ".!?" else f"{text}."
+
+
+def digest(texts: Iterable[str], limit: int) -> str:
+    """Leading sentences of each text, sharing `limit` characters between them."""
+    texts = [" ".join(text.split()) for text in texts if text and text.strip()]
+    if not texts:
+        return ""
+    budget = max(1, limit // len(texts))
+    parts = []
+    for text in texts:
+        sentences = _SENTENCE_END.split(text)
+        part = sentences[0]
+        for sentence in sentences[1:]:
+            if len(part) + 1 + len(sentence) > budget:
+                break
+            part = f"{part} {sentence}"
+        parts.append(_clip(part, budget))
+    return _clip(" ".join(parts), limit)
+
+
+class MemoryService:
+    """Records scenes, memories and day/arc chunks, and retrieves the relevant ones for a prompt."""
+
+    def __init__(self, runtime: SessionRuntime) -> None:
+        self.runtime = runtime
+        self._arc_of_stage: dict[str, Arc] = {}
+        for arc in runtime.game.arcs:
+            for stage in arc.stages:
+                self._arc_of_stage.setdefault(stage.id, arc)
+        # BM25 over state.memories[:_indexed], keyed by position. Appends extend
+        # it; a fold, rollback or restore swaps or shrinks the list and rebuilds it.
+        self._bm25 = BM25Index()
+        self._source: list[MemoryEntry] | None = None
+        self._indexed = 0
+        self._last: MemoryEntry | None = None
+
+    # ------------------------------------------------------------------ #
+    # Recording
+    # ------------------------------------------------------------------ #
+    def record_turn(self, narrative: str, milestones: Iterable[str] = ()) -> None:
+        """Store the turn's narrative, fold finished days and add chunks for arc milestones."""
+        state = self.runtime.state_manager.state
+        journal = self.runtime.state_manager.journal
+        settings = GameSettings()
+
+        self._fold_days(state, settings)
+        if narrative:
+            journal.append(state.memories, MemoryEntry(
+                kind="scene",
+                text=narrative,
+                characters=self._npcs(state.present_characters),
+                day=state.time.day,
+                turn=state.turn_count,
+            ))
+        for stage_id in milestones:
+            arc = self._arc_of_stage.get(stage_id)
+            if arc is not None:
+                self._add_arc_chunk(state, arc, stage_id, settings)
+
+        limit = settings.memory_history_limit
+        if limit > 0 and len(state.narrative_history) > limit:
+            journal.set_attr(state, "narrative_history", state.narrative_history[-limit:])
+
+    def remember(self, char_id: str, text: str) -> None:
+        """Store a character memory reported by the checker, in the store and the character's memory_log."""
+        state = self.runtime.state_manager.state
+        journal = self.runtime.state_manager.journal
+        journal.append(state.memories, MemoryEntry(
+            kind="memory", text=text, characters=[char_id], day=state.time.day, turn=state.turn_count,
+        ))
+        char_state = state.characters.get(char_id)
+        if char_state is None:
+            return
+        journal.append(char_state.memory_log, text)
+        limit = GameSettings().memory_log_limit
+        if limit > 0 and len(char_state.memory_log) > limit:
+            journal.set_attr(char_state, "memory_log", char_state.memory_log[-limit:])
+
+    def _fold_days(self, state: GameState, settings: GameSettings) -> None:
+        today = state.time.day
+        days: dict[int, list[MemoryEntry]] = {}
+        memories: dict[tuple[int, str], list[MemoryEntry]] = {}
+        for entry in state.memories:
+            if entry.day >= today:
+                continue
+            if entry.kind == "scene":
+                days.setdefault(entry.day, []).append(entry)
+            elif entry.kind == "memory" and entry.characters:
+                memories.setdefault((entry.day, entry.characters[0]), []).append(entry)
+        # A character's memories of a day end up as one entry; lone ones already are.
+        memories = {key: group for key, group in memories.items() if len(group) > 1}
+        if not days and not memories:
+            return
+        folded = {id(entry) for group in (*days.values(), *memories.values()) for entry in group}
+        kept = [entry for entry in state.memories if id(entry) not in folded]
+        for (day, char_id), group in sorted(memories.items()):
+            kept.append(MemoryEntry(
+                kind="memory",
+                text=digest((_sentence(entry.text) for entry in group), settings.memory_chunk_chars),
+                characters=[char_id],
+                day=day,
+                turn=group[-1].turn,
+            ))
+        for day, scenes in sorted(days.items()):
+            kept.append(MemoryEntry(
+                kind="day",
+                text=f"Day {day}: {digest((scene.text for scene in scenes), settings.memory_chunk_chars)}",
+                characters=self._characters_of(scenes),
+                day=day,
+                turn=scenes[-1].turn,
+            ))
+        self.runtime.state_manager.journal.set_attr(state, "memories", kept)
+
+    def _add_arc_chunk(self, state: GameState, arc: Arc, stage_id: str, settings: GameSettings) -> None:
+        stage = next(stage for stage in arc.stages if stage.id == stage_id)
+        since = max((entry.turn for entry in state.memories if entry.kind == "arc" and entry.arc == arc.id), default=-1)
+        scenes = [
+            entry for entry in state.memories
+            if entry.kind == "scene" and entry.turn > since and arc.character in entry.characters
+        ]
+        text = f"{arc.title} - {stage.title}"
+        if scenes:
+            text += f": {digest((scene.text for scene in scenes), settings.memory_chunk_chars)}"
+        self.runtime.state_manager.journal.append(state.memories, MemoryEntry(
+            kind="arc",
+            text=text,
+            characters=self._npcs([arc.character]),
+            day=state.time.day,
+            turn=state.turn_count,
+            arc=arc.id,
+        ))
+
+    # ------------------------------------------------------------------ #
+    # Retrieval
+    # ------------------------------------------------------------------ #
+    def recall(
+        self,
+        query: str,
+        characters: Iterable[str],
+        k: int | None = None,
+        *,
+        skip_recent: int = 0,
+    ) -> list[MemoryEntry]:
+        """
+        The `k` memories most relevant to `query` that involve one of `characters`
+        (or nobody in particular). The last `skip_recent` scenes are left out, as
+        the prompt already quotes them in full.
+        """
+        if k is None:
+            k = GameSettings().memory_recall_k
+        entries = self.runtime.state_manager.state.memories
+        if k <= 0 or not entries:
+            return []
+        self._sync(entries)
+
+        npcs = set(self._npcs(characters))
+        recent: set[int] = set()
+        for position in range(len(entries) - 1, -1, -1):
+            if len(recent) >= skip_recent:
+                break
+            if entries[position].kind == "scene":
+                recent.add(position)
+
+        def accept(position: int) -> bool:
+            entry = entries[position]
+            return position not in recent and (not entry.characters or not npcs.isdisjoint(entry.characters))
+
+        names = [self.runtime.index.characters[char_id].name for char_id in npcs]
+        hits = self._bm25.search(" ".join([query, *names]), k, accept=accept)
+        return [entries[position] for position, _ in hits]
+
+    def describe(self, entry: MemoryEntry, limit: int | None = None) -> str:
+        """One prompt line for a memory."""
+        if limit is None:
+            limit = GameSettings().memory_entry_chars
+        text = _clip(entry.text, limit)
+        if entry.kind == "memory" and entry.characters:
+            character = self.runtime.index.characters.get(entry.characters[0])
+            name = character.name if character else entry.characters[0]
+            return f"- {name} remembers (day {entry.day}): {text}"
+        if entry.kind == "day":
+            return f"- {text}"
+        return f"- Day {entry.day}: {text}"
+
+    def _sync(self, entries: list[MemoryEntry]) -> None:
+        if (
+            entries is not self._source
+            or len(entries) < self._indexed
+            or (self._indexed and entries[self._indexed - 1] is not self._last)
+        ):
+            self._bm25 = BM25Index()
+            self._source = entries
+            self._indexed = 0
+        for position in range(self._indexed, len(entries)):
+            self._bm25.add(position, entries[position].text)
+        self._indexed = len(entries)
+        self._last = entries[-1] if entries else None
+
+    # ------------------------------------------------------------------ #
+    # Helpers
+    # ------------------------------------------------------------------ #
+    def _npcs(self, characters: Iterable[str]) -> list[str]:
+        known = self.runtime.index.characters
+        return [char_id for char_id in characters if char_id != "player" and char_id in known]
+
+    @staticmethod
+    def _characters_of(entries: Iterable[MemoryEntry]) -> list[str]:
+        seen: dict[str, None] = {}
+        for entry in entries:
+            seen.update(dict.fromkeys(entry.characters))
+        return list(seen)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any
 from types import SimpleNamespace
 
+from app.core.conditions import CHARACTER_PLACEHOLDER, ConditionTemplate
 from app.models.effects import ApplyModifierEffect, RemoveModifierEffect
 from app.models.modifiers import ModifierStacking
 from app.runtime.session import SessionRuntime
@@ -22,6 +23,15 @@ class ModifierService:
         self.library = {mod.id: mod for mod in modifiers_cfg.library} if modifiers_cfg and modifiers_cfg.library else {}
         self.stacking = modifiers_cfg.stacking if modifiers_cfg and modifiers_cfg.stacking else {}
 
+        # Auto-activation conditions compiled once, with {character} bound at eval time
+        self.templates: dict[str, ConditionTemplate] = {
+            modifier_id: ConditionTemplate.compile(mod.when, mod.when_all, mod.when_any)
+            for modifier_id, mod in self.library.items()
+            if self._has_conditions(mod)
+        }
+        # (modifier_id, char_id) -> (relevant meter values, condition result)
+        self._condition_cache: dict[tuple[str, str], tuple[tuple, bool]] = {}
+
     # ------------------------------------------------------------------ #
     # Public API
     # ------------------------------------------------------------------ #
@@ -44,17 +54,14 @@ class ModifierService:
         evaluator = self.runtime.state_manager.create_evaluator()
         character_ids = list(state.characters.keys())
 
-        for char_id in character_ids:
-            active_mods = state.modifiers.setdefault(char_id, [])
-            active_map = {m["id"]: m for m in active_mods if m.get("id")}
-
-            for modifier_id, modifier_def in self.library.items():
-                if not self._has_conditions(modifier_def):
-                    continue
-
-                conditioned_def = self._conditioned_definition(modifier_def, char_id)
-                is_active_now = evaluator.evaluate_object_conditions(conditioned_def)
-                active_entry = active_map.get(modifier_id)
+        # Evaluate each modifier across the whole cast before moving to the next one
+        for modifier_id, template in self.templates.items():
+            for char_id in character_ids:
+                is_active_now = self._evaluate_for_character(evaluator, state, modifier_id, template, char_id)
+                active_entry = next(
+                    (m for m in state.modifiers.get(char_id, ()) if m.get("id") == modifier_id),
+                    None,
+                )
                 source = active_entry.get("source") if active_entry else None
 
                 if is_active_now and not active_entry:
@@ -62,7 +69,8 @@ class ModifierService:
                 elif not is_active_now and active_entry and source == "auto":
                     self._remove_modifier(char_id, modifier_id, state)
 
-            # Keep CharacterState modifiers in sync
+        # Keep CharacterState modifiers in sync
+        for char_id in character_ids:
             self._sync_character_modifiers(state, char_id)
 
     def tick_durations(self, state, minutes: int) -> None:
@@ -71,6 +79,9 @@ class ModifierService:
             return
 
         for char_id, active_mods in list(state.modifiers.items()):
+            if all(mod.get("duration") is None for mod in active_mods):
+                continue
+            self._journal(state, char_id)
             expired: list[str] = []
             for mod in active_mods:
                 if mod.get("duration") is None:
@@ -99,6 +110,7 @@ class ModifierService:
         if not modifier_def:
             return
 
+        self._journal(state, char_id)
         active_mods = state.modifiers.setdefault(char_id, [])
         existing = next((mod for mod in active_mods if mod.get("id") == modifier_id), None)
         if existing:
@@ -146,6 +158,7 @@ class ModifierService:
 
     def _remove_modifier(self, char_id: str, modifier_id: str, state) -> None:
         """Deactivate a modifier and run exit effects."""
+        self._journal(state, char_id)
         active_mods = state.modifiers.setdefault(char_id, [])
         existing = next((mod for mod in active_mods if mod.get("id") == modifier_id), None)
         if not existing:
@@ -162,6 +175,12 @@ class ModifierService:
         # Keep CharacterState modifiers keys in sync for DSL context
         self._sync_character_modifiers(state, char_id)
 
+    def _journal(self, state, char_id: str) -> None:
+        """Record the character's active modifiers about to be changed in the turn journal."""
+        journal = self.runtime.state_manager.journal
+        journal.record_item(state.modifiers, char_id)
+        journal.touch(state.modifiers.get(char_id))
+
     @staticmethod
     def _has_conditions(modifier_def) -> bool:
         """Auto-activation only applies when a modifier declares conditions."""
@@ -171,6 +190,32 @@ class ModifierService:
             or (modifier_def.when_any and any(modifier_def.when_any))
         )
 
+    def _evaluate_for_character(self, evaluator, state, modifier_id: str, template: ConditionTemplate, char_id: str) -> bool:
+        """Evaluate a compiled condition, reusing the last result when its meters are unchanged."""
+        if template.textual:
+            conditioned_def = self._conditioned_definition(self.library[modifier_id], char_id)
+            return evaluator.evaluate_object_conditions(conditioned_def)
+
+        if template.meter_refs is None:
+            return evaluator.evaluate_template(template, character=char_id)
+
+        key = self._meter_signature(state, template, char_id)
+        cached = self._condition_cache.get((modifier_id, char_id))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        result = evaluator.evaluate_template(template, character=char_id)
+        self._condition_cache[(modifier_id, char_id)] = (key, result)
+        return result
+
+    @staticmethod
+    def _meter_signature(state, template: ConditionTemplate, char_id: str) -> tuple:
+        values = []
+        for owner, meter_id in template.meter_refs:
+            owner_id = char_id if owner == CHARACTER_PLACEHOLDER else owner
+            owner_state = state.characters.get(owner_id)
+            values.append(owner_state.meters.get(meter_id) if owner_state else None)
+        return tuple(values)
+
     @staticmethod
     def _substitute_character(expr: str | None, char_id: str) -> str | None:
         if not expr or "{character}" not in expr:
@@ -193,4 +238,5 @@ class ModifierService:
         if not char_state:
             return
         active = state.modifiers.get(char_id, [])
+        self.runtime.state_manager.journal.record_attr(char_state, "modifiers")
         char_state.modifiers = {mod.get("id"): mod.get("duration") for mod in active if mod.get("id")}
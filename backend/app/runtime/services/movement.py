@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import math
-from typing import List, Optional
+from typing import Optional
 
+from app.core.routes import Route, TravelPlanner, movement_minutes
 from app.models.effects import (
     LockEffect,
     MoveEffect,
@@ -12,7 +12,7 @@ from app.models.effects import (
     TravelToEffect,
     UnlockEffect,
 )
-from app.models.locations import LocationConnection, LocalDirection, ZoneConnection
+from app.models.locations import LocationConnection, LocalDirection
 from app.runtime.session import SessionRuntime
 
 
@@ -24,6 +24,7 @@ class MovementService:
         self.logger = runtime.logger
         self.index = runtime.index
         self.evaluator = runtime.state_manager.create_evaluator
+        self.planner = TravelPlanner.for_game(runtime.game)
 
     # ------------------------------------------------------------------ #
     # Movement APIs
@@ -53,8 +54,24 @@ class MovementService:
                     return moved
         return False
 
+    def plan_route(self, target_location: str, method_name: str | None = None) -> Route | None:
+        """Cheapest route from the current zone to a location's zone, avoiding inaccessible zones."""
+        state = self.runtime.state_manager.state
+        from_zone = state.current_zone
+        to_zone = self.index.location_to_zone.get(target_location)
+        if not from_zone or not to_zone:
+            return None
+        evaluator = None
+
+        def blocked(zone_id: str) -> bool:
+            nonlocal evaluator
+            evaluator = evaluator or self.evaluator()
+            return not self._zone_access_allowed(zone_id, evaluator)
+
+        return self.planner.route(from_zone, to_zone, method_name, blocked=blocked)
+
     def travel(self, effect: TravelToEffect) -> bool:
-        """Travel to a location (typically across zones)."""
+        """Travel to a location, across as many zones as the cheapest route needs."""
         minutes = self._calculate_travel_minutes(effect.location, effect.method)
         if minutes is None:
             return False
@@ -68,59 +85,68 @@ class MovementService:
     # ------------------------------------------------------------------ #
     def apply_lock(self, effect: LockEffect) -> None:
         state = self.runtime.state_manager.state
+        journal = self.runtime.state_manager.journal
         for zone_id in effect.zones or []:
             if zone_id in state.zones:
-                state.zones[zone_id].locked = True
+                journal.set_attr(state.zones[zone_id], "locked", True)
         for loc_id in effect.locations or []:
             if loc_id in state.locations:
-                state.locations[loc_id].locked = True
-        for action_id in effect.actions or []:
-            if action_id in state.unlocked_actions:
-                state.unlocked_actions.remove(action_id)
-        for ending_id in effect.endings or []:
-            if ending_id in state.unlocked_endings:
-                state.unlocked_endings.remove(ending_id)
-        for item_id in effect.items or []:
-            if item_id in state.unlocked_items:
-                state.unlocked_items.remove(item_id)
-        for clothing_id in effect.clothing or []:
-            if clothing_id in state.unlocked_clothing:
-                state.unlocked_clothing.remove(clothing_id)
+                journal.set_attr(state.locations[loc_id], "locked", True)
+        for unlocked, ids in (
+            (state.unlocked_actions, effect.actions),
+            (state.unlocked_endings, effect.endings),
+            (state.unlocked_items, effect.items),
+            (state.unlocked_clothing, effect.clothing),
+        ):
+            for entry_id in ids or []:
+                if entry_id in unlocked:
+                    journal.remove(unlocked, entry_id)
 
     def apply_unlock(self, effect: UnlockEffect) -> None:
         state = self.runtime.state_manager.state
+        journal = self.runtime.state_manager.journal
         for zone_id in effect.zones or []:
-            state.discovered_zones.add(zone_id)
+            journal.add(state.discovered_zones, zone_id)
             if zone_id in state.zones:
-                state.zones[zone_id].locked = False
+                journal.set_attr(state.zones[zone_id], "locked", False)
         for loc_id in effect.locations or []:
-            state.discovered_locations.add(loc_id)
+            journal.add(state.discovered_locations, loc_id)
             if loc_id in state.locations:
-                state.locations[loc_id].locked = False
-        for action_id in (effect.actions or []):
-            if action_id not in state.unlocked_actions:
-                state.unlocked_actions.append(action_id)
-        for ending_id in (effect.endings or []):
-            if ending_id not in state.unlocked_endings:
-                state.unlocked_endings.append(ending_id)
-        for item_id in effect.items or []:
-            if item_id not in state.unlocked_items:
-                state.unlocked_items.append(item_id)
-        for clothing_id in effect.clothing or []:
-            if clothing_id not in state.unlocked_clothing:
-                state.unlocked_clothing.append(clothing_id)
-        if effect.outfit:
-            unlocked = state.unlocked_outfits.setdefault(effect.character or "player", [])
-            if effect.outfit not in unlocked:
-                unlocked.append(effect.outfit)
-        for outfit_id in effect.outfits or []:
-            unlocked = state.unlocked_outfits.setdefault(effect.character or "player", [])
-            if outfit_id not in unlocked:
-                unlocked.append(outfit_id)
+                journal.set_attr(state.locations[loc_id], "locked", False)
+        for unlocked, ids in (
+            (state.unlocked_actions, effect.actions),
+            (state.unlocked_endings, effect.endings),
+            (state.unlocked_items, effect.items),
+            (state.unlocked_clothing, effect.clothing),
+        ):
+            for entry_id in ids or []:
+                if entry_id not in unlocked:
+                    journal.append(unlocked, entry_id)
+        outfits = ([effect.outfit] if effect.outfit else []) + list(effect.outfits or [])
+        if outfits:
+            char_id = effect.character or "player"
+            if char_id not in state.unlocked_outfits:
+                journal.set_item(state.unlocked_outfits, char_id, [])
+            unlocked = state.unlocked_outfits[char_id]
+            for outfit_id in outfits:
+                if outfit_id not in unlocked:
+                    journal.append(unlocked, outfit_id)
 
     # ------------------------------------------------------------------ #
     # Helpers
     # ------------------------------------------------------------------ #
+    def _journal_location(self, location_state, zone_id: str | None) -> None:
+        """Record everything a location change writes in the turn journal."""
+        state = self.runtime.state_manager.state
+        journal = self.runtime.state_manager.journal
+        for name in ("current_location", "current_zone", "current_privacy"):
+            journal.record_attr(state, name)
+        if location_state:
+            journal.record_attr(location_state, "discovered")
+        zone_state = state.zones.get(zone_id or state.current_zone) if (zone_id or state.current_zone) else None
+        if zone_state:
+            journal.record_attr(zone_state, "discovered")
+
     def _set_location(self, location_id: str, companions: list[str] | None, *, is_travel: bool, update_zone: bool = False, method: str | None = None) -> bool:
         state = self.runtime.state_manager.state
         if location_id not in self.index.locations:
@@ -150,16 +176,18 @@ class MovementService:
             if dest_zone and dest_zone.entrances and location_def and location_def.id not in dest_zone.entrances:
                 return False
 
+        self._journal_location(location_state, zone_id)
         state.current_location = location_id
         state.current_zone = zone_id or state.current_zone
         if location_def:
             state.current_privacy = location_def.privacy
 
-        state.discovered_locations.add(location_id)
+        journal = self.runtime.state_manager.journal
+        journal.add(state.discovered_locations, location_id)
         if location_state:
             location_state.discovered = True
         if state.current_zone:
-            state.discovered_zones.add(state.current_zone)
+            journal.add(state.discovered_zones, state.current_zone)
             zone_state = state.zones.get(state.current_zone)
             if zone_state:
                 zone_state.discovered = True
@@ -167,7 +195,7 @@ class MovementService:
         if companions:
             for char_id in companions:
                 if char_id not in state.present_characters:
-                    state.present_characters.append(char_id)
+                    journal.append(state.present_characters, char_id)
 
         return True
 
@@ -188,8 +216,9 @@ class MovementService:
             access = getattr(location_def, "access", None)
             condition = getattr(access, "discovered_when", None) if access else None
             if condition and evaluator and evaluator.evaluate(condition):
-                state.discovered_locations.add(location_id)
-                location_state.discovered = True
+                journal = self.runtime.state_manager.journal
+                journal.set_attr(location_state, "discovered", True)
+                journal.add(state.discovered_locations, location_id)
             elif not getattr(access, "discovered", True):
                 return False
         zone_id = self.index.location_to_zone.get(location_id)
@@ -211,12 +240,7 @@ class MovementService:
         ctx.time_apply_visit_cap = ctx.time_apply_visit_cap and apply_cap
 
     def _minutes_for_category(self, category: str | None) -> int:
-        categories = self.runtime.game.time.categories or {}
-        defaults = self.runtime.game.time.defaults
-        resolved = category or defaults.movement
-        if resolved in categories:
-            return int(categories[resolved])
-        return int(categories.get(defaults.movement, categories.get(defaults.default, 0)))
+        return movement_minutes(self.runtime.game.time, category)
 
     def _calculate_local_minutes(self, target_location: str) -> int:
         """Resolve time for moving within the current zone."""
@@ -230,46 +254,9 @@ class MovementService:
         return max(0, self._minutes_for_category(None))
 
     def _calculate_travel_minutes(self, target_location: str, method_name: str | None) -> Optional[int]:
-        """Resolve zone-travel time using movement methods and zone distance."""
-        state = self.runtime.state_manager.state
-        from_zone = state.current_zone
-        to_zone = self.index.location_to_zone.get(target_location)
-        if not from_zone or not to_zone:
-            return None
-
-        connection = self._resolve_zone_connection(from_zone, to_zone)
-        if from_zone != to_zone and not connection:
-            return None
-        distance = connection.distance if connection and connection.distance is not None else 1.0
-
-        movement_cfg = getattr(self.runtime.game, "movement", None)
-        methods = {m.name: m for m in getattr(movement_cfg, "methods", [])} if movement_cfg else {}
-        chosen = methods.get(method_name or "walk") or next(iter(methods.values()), None)
-        if not chosen or getattr(chosen, "active", True) is False:
-            return None
-        if connection and connection.methods:
-            if chosen.name not in connection.methods:
-                return None
-
-        minutes: float = 0
-        if chosen.time_cost is not None:
-            minutes = distance * chosen.time_cost
-        elif chosen.speed is not None:
-            minutes = (distance / chosen.speed) * 60.0
-        elif chosen.category:
-            minutes = distance * self._minutes_for_category(chosen.category)
-        return max(0, int(math.floor(minutes + 0.5)))
-
-    def _resolve_zone_connection(self, from_zone: str, to_zone: str) -> Optional[ZoneConnection]:
-        zone_def = self.index.zones.get(from_zone)
-        if not zone_def:
-            return None
-        for conn in zone_def.connections or []:
-            if to_zone in (conn.to or []):
-                if conn.exceptions and to_zone in conn.exceptions:
-                    continue
-                return conn
-        return None
+        """Resolve zone-travel time using movement methods and zone distances along the route."""
+        route = self.plan_route(target_location, method_name)
+        return route.minutes if route else None
 
     def _zone_access_allowed(self, zone_id: str | None, evaluator) -> bool:
         if not zone_id:
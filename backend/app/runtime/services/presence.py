@@ -39,4 +39,4 @@ class PresenceService:
                     present.append(character.id)
                     break
 
-        state.present_characters = present
+        self.runtime.state_manager.journal.set_attr(state, "present_characters", present)
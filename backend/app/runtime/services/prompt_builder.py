@@ -108,34 +108,20 @@ Write the next narrative beat ({paragraphs} paragraphs max)."""
         - Current state (location, time, present characters only)
         - Character behaviors for consent checks
         - Delta format rules
-        - Memory system (character memories + optional narrative summary)
+        - Character memories (the narrative summary is written in the background,
+          see build_summary_prompt)
         """
-        from app.core.settings import GameSettings
-
         state = self.state_manager.state
-        settings = GameSettings()
 
         # Build mini character cards showing behavior guidance (same as Writer sees)
         behavior_cards = self._build_behavior_cards_for_checker(state, ctx)
 
-        # Determine if we should request narrative summary this turn
-        request_summary = state.ai_turns_since_summary >= settings.memory_summary_interval
-
         # Build memory instructions
         memory_instructions = """- character_memories: {{"<char_id>": "Brief interaction summary"}}
   → Only for present characters with significant interactions
   → Examples: "Discussed coffee preferences", "Shared personal story about family"
   → Skip for trivial/movement actions"""
 
-        if request_summary:
-            # Include narrative summary request
-            narratives_count = min(len(state.narrative_history), settings.memory_summary_interval)
-            memory_instructions += f"""
-- narrative_summary: "2-4 paragraph story summary"
-  → Synthesize previous summary + last {narratives_count} narratives into flowing story
-  → Focus on key events, character development, relationship changes
-  → Keep 200-400 words total"""
-
         # Compact template
         template = f"""PlotPlay Checker - extract justified state deltas from narrative.
 
@@ -163,6 +149,34 @@ Output strict JSON (no comments):"""
 
         return template
 
+    def build_summary_prompt(self, count: int) -> str:
+        """
+        Build the background narrative summary prompt.
+
+        Folds the last `count` narratives (state.narratives_since_summary, which
+        also counts scripted and skip_ai turns) into the previous summary; the
+        result replaces state.narrative_summary.
+        """
+        state = self.state_manager.state
+        narratives = state.narrative_history[-count:] if count > 0 else []
+        previous = state.narrative_summary or "(none yet - the story is just beginning)"
+        recent = "\n...\n".join(narratives) if narratives else "(no new scenes)"
+
+        return f"""PlotPlay Summarizer - keep the story so far up to date.
+
+Game: {self.game.meta.title}
+
+Previous summary:
+{previous}
+
+Latest scenes (oldest first):
+{recent}
+
+Write a 2-4 paragraph story summary that synthesizes the previous summary and the latest scenes into one flowing story.
+- Focus on key events, character development, relationship changes
+- Keep 200-400 words total
+- Output the summary text only (no headings, no JSON)"""
+
     def _build_turn_context_envelope(
         self,
         ctx: "TurnContext",
@@ -231,16 +245,22 @@ Output strict JSON (no comments):"""
         recent_count = settings.memory_summary_interval
         recent_narratives = state.narrative_history[-recent_count:] if state.narrative_history else []
 
+        # Long-term memories relevant to this action and the present characters
+        memory_ctx = ""
+        memory_service = self.runtime.memory_service
+        if memory_service is not None:
+            memories = memory_service.recall(action_summary, state.present_characters, skip_recent=recent_count)
+            if memories:
+                lines = "\n".join(memory_service.describe(memory) for memory in memories)
+                memory_ctx = f"Relevant memories:\n{lines}\n"
+
         if recent_narratives:
             recent_ctx = "Recent scene:\n" + "\n...\n".join(recent_narratives)
         else:
             recent_ctx = "Story is just beginning."
 
-        # Combine summary and recent narratives
-        if summary_ctx:
-            story_context = f"{summary_ctx}\n{recent_ctx}"
-        else:
-            story_context = recent_ctx
+        # Combine summary, retrieved memories and recent narratives
+        story_context = "\n".join([part for part in (summary_ctx, memory_ctx) if part] + [recent_ctx])
 
         envelope = f"""{game_meta}
 {time_ctx}
@@ -86,8 +86,8 @@ class StateSummaryService:
             "gates": gates_snapshot,
             "inventory": inventory_snapshot,
             "discovered": {
-                "zones": list(state.discovered_zones),
-                "locations": list(state.discovered_locations),
+                "zones": sorted(state.discovered_zones),
+                "locations": sorted(state.discovered_locations),
             },
         }
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from app.models.effects import MeterChangeEffect
+from app.models.time import MINUTES_PER_DAY, SlotTable, hhmm_to_minutes
 from app.runtime.session import SessionRuntime
 
 
@@ -11,95 +11,141 @@ class TimeService:
 
     def __init__(self, runtime: SessionRuntime) -> None:
         self.runtime = runtime
+        self._decay_plans = self._compile_decay_plans()
 
     def advance_minutes(self, minutes: int, *, apply_decay: bool = True) -> dict:
+        """
+        Advance the clock by any number of minutes.
+
+        Every midnight crossed increments the day and runs the day-end and
+        day-start effects once. Decay is batched into one change per meter and
+        lands where a day-by-day advance would put it: what accrued up to one
+        midnight is applied before the next midnight's effects run, and the
+        rest (the last day and the slots after it) once the clock has moved.
+        With `apply_decay=False` that rest is left to the caller, reported as
+        `decay_days`/`decay_slots`; `days`/`slots` count everything crossed.
+        """
         state = self.runtime.state_manager.state
         if minutes <= 0:
-            return {"minutes": 0, "slot_advanced": False, "day_advanced": False}
+            return {
+                "minutes": 0, "slot_advanced": False, "day_advanced": False,
+                "days": 0, "slots": 0, "decay_days": 0, "decay_slots": 0,
+            }
 
+        self.runtime.state_manager.journal.touch(state.time)
         previous_slot = state.time.slot
+        table = self._slot_table()
 
-        current_minutes = self._hhmm_to_minutes(state.time.time_hhmm or "00:00")
+        current_minutes = hhmm_to_minutes(state.time.time_hhmm or "00:00")
         total = current_minutes + minutes
+        days, of_day = divmod(total, MINUTES_PER_DAY)
 
-        if total >= 24 * 60:
+        if days:
             self._trigger_day_end_effects()
 
-        day_advanced = total >= 24 * 60
-        total %= 24 * 60
-        state.time.time_hhmm = self._minutes_to_hhmm(total)
-
-        new_slot = self._resolve_slot(total, previous_slot)
+        state.time.time_hhmm = self._minutes_to_hhmm(of_day)
+        new_slot = table.slot_at(of_day) or previous_slot
         if new_slot is not None:
             state.time.slot = new_slot
 
-        if day_advanced:
+        decayed_slots = 0
+        for crossed in range(days):
+            if crossed:
+                # The previous day's decay lands before this midnight's effects.
+                accrued = table.changes_between(current_minutes, crossed * MINUTES_PER_DAY)
+                self.apply_meter_dynamics(
+                    day_advanced=True, slot_advanced=accrued > decayed_slots, days=1, slots=accrued - decayed_slots,
+                )
+                decayed_slots = accrued
+                self._trigger_day_end_effects()
             state.time.day += 1
             self._trigger_day_start_effects()
 
-        slot_advanced = (new_slot is not None and new_slot != previous_slot)
+        slots = table.changes_between(current_minutes, total)
+        if not slots and new_slot != previous_slot:
+            slots = 1
+        decay_days = min(days, 1)
+        decay_slots = slots - decayed_slots
 
         if apply_decay:
-            self._apply_meter_decay("slot" if slot_advanced else None)
-            if day_advanced:
-                self._apply_meter_decay("day")
+            self.apply_meter_dynamics(
+                day_advanced=bool(decay_days), slot_advanced=bool(decay_slots), days=decay_days, slots=decay_slots,
+            )
 
         return {
             "minutes": minutes,
-            "slot_advanced": slot_advanced,
-            "day_advanced": day_advanced,
+            "slot_advanced": slots > 0,
+            "day_advanced": days > 0,
+            "days": days,
+            "slots": slots,
+            "decay_days": decay_days,
+            "decay_slots": decay_slots,
         }
 
-    def apply_meter_dynamics(self, *, day_advanced: bool, slot_advanced: bool) -> None:
-        """Apply time-based meter decay."""
+    def apply_meter_dynamics(self, *, day_advanced: bool, slot_advanced: bool, days: int = 1, slots: int = 1) -> None:
+        """Apply time-based meter decay, once per day and slot crossed."""
         if day_advanced:
-            self._apply_meter_decay("day")
+            self._apply_meter_decay("day", days)
         if slot_advanced:
-            self._apply_meter_decay("slot")
+            self._apply_meter_decay("slot", slots)
 
-    def _apply_meter_decay(self, decay_type: str | None) -> None:
-        state = self.runtime.state_manager.state
+    def _compile_decay_plans(self) -> dict[tuple[str, bool], tuple[tuple[str, float, float, float], ...]]:
+        """(decay type, is player) -> (meter id, decay per step, min, max) for every decaying meter."""
         index = self.runtime.index
-
-        if decay_type is None:
+        plans = {}
+        for is_player, meters in ((True, index.player_meters), (False, index.template_meters)):
+            for decay_type in ("day", "slot"):
+                plans[(decay_type, is_player)] = tuple(
+                    (meter_id, decay, meter_def.min, meter_def.max)
+                    for meter_id, meter_def in meters.items()
+                    if (decay := getattr(meter_def, f"decay_per_{decay_type}", 0))
+                )
+        return plans
+
+    def _apply_meter_decay(self, decay_type: str | None, times: int = 1) -> None:
+        """
+        Decay every character's meters in one pass.
+
+        Decay bypasses per-turn delta caps; modifier clamps are gathered once per
+        character, then each value is clamped to the meter's range. Decay has a
+        fixed sign, so one clamped change equals `times` clamped steps.
+        """
+        if decay_type is None or times <= 0:
             return
+        state = self.runtime.state_manager.state
+        journal = self.runtime.state_manager.journal
+        resolver = self.runtime.effect_resolver
 
         for char_id, char_state in state.characters.items():
-            for meter_id, value in list(char_state.meters.items()):
-                meter_def = index.player_meters.get(meter_id) if char_id == "player" else index.template_meters.get(meter_id)
-                if not meter_def:
+            plan = self._decay_plans.get((decay_type, char_id == "player"))
+            if not plan:
+                continue
+            meters = char_state.meters
+            clamps = resolver.modifier_clamp_bounds(char_id)
+            for meter_id, decay, low, high in plan:
+                current = meters.get(meter_id)
+                if current is None:
                     continue
-                decay_value = 0
-                if decay_type == "day" and getattr(meter_def, "decay_per_day", 0):
-                    decay_value = meter_def.decay_per_day
-                elif decay_type == "slot" and getattr(meter_def, "decay_per_slot", 0):
-                    decay_value = meter_def.decay_per_slot
-                if decay_value:
-                    self.runtime.effect_resolver.apply_effects(
-                        [MeterChangeEffect(target=char_id, meter=meter_id, op="add", value=decay_value, cap_per_turn=False)]
-                    )
-
-    def _resolve_slot(self, total_minutes: int, fallback: str | None) -> str | None:
-        windows = getattr(self.runtime.game.time, "slot_windows", None) or {}
-        for slot, window in windows.items():
-            start = self._hhmm_to_minutes(window.start)
-            end = self._hhmm_to_minutes(window.end)
-            if start <= end:
-                if start <= total_minutes <= end:
-                    return slot
-            else:  # wrap-around window
-                if total_minutes >= start or total_minutes <= end:
-                    return slot
-        return fallback
-
-    @staticmethod
-    def _hhmm_to_minutes(value: str) -> int:
-        hh, mm = map(int, value.split(":"))
-        return (hh % 24) * 60 + mm
+                value = current + decay * times
+                bounds = clamps.get(meter_id)
+                if bounds is not None:
+                    if bounds[0] is not None:
+                        value = max(bounds[0], value)
+                    if bounds[1] is not None:
+                        value = min(bounds[1], value)
+                value = max(low, min(high, value))
+                if value != current:
+                    journal.set_item(meters, meter_id, value)
+
+    def _slot_table(self) -> SlotTable:
+        index = self.runtime.index
+        if index.slot_table is None:
+            index.slot_table = SlotTable.compile(getattr(self.runtime.game.time, "slot_windows", None))
+        return index.slot_table
 
     @staticmethod
     def _minutes_to_hhmm(value: int) -> str:
-        value %= 24 * 60
+        value %= MINUTES_PER_DAY
         return f"{value // 60:02d}:{value % 60:02d}"
 
     def _trigger_day_end_effects(self) -> None:
@@ -37,6 +37,7 @@ class TradeService:
         if bucket.get(effect.item, 0) < effect.count:
             return []
 
+        self.runtime.state_manager.journal.record_item(bucket, effect.item)
         bucket[effect.item] -= effect.count
         if bucket[effect.item] <= 0:
             bucket.pop(effect.item, None)
@@ -57,6 +58,7 @@ class TradeService:
             return []
 
         bucket = location_state.inventory.items
+        self.runtime.state_manager.journal.record_item(bucket, effect.item)
         bucket[effect.item] = bucket.get(effect.item, 0) + effect.count
 
         return [
@@ -129,7 +131,7 @@ class TradeService:
             if not resell and available < effect.count:
                 return []
             if available >= effect.count:
-                shop_bucket[effect.item] = max(0, available - effect.count)
+                self.runtime.state_manager.journal.set_item(shop_bucket, effect.item, max(0, available - effect.count))
 
         # Money check
         money_before = buyer_state.meters.get("money") if buyer_state.meters else None
@@ -204,7 +206,7 @@ class TradeService:
         ]
 
         if shop_bucket is not None:
-            shop_bucket[effect.item] = shop_bucket.get(effect.item, 0) + effect.count
+            self.runtime.state_manager.journal.set_item(shop_bucket, effect.item, shop_bucket.get(effect.item, 0) + effect.count)
         elif effect.target and effect.target in state.characters:
             transfer_effects.append(
                 InventoryAddEffect(
@@ -53,6 +53,8 @@ class SessionRuntime:
     choice_builder: object | None = field(default=None)
     state_summary_service: object | None = field(default=None)
     discovery_service: object | None = field(default=None)
+    checker_delta_service: object | None = field(default=None)
+    memory_service: object | None = field(default=None)
     time_service: object | None = field(default=None)
     modifier_service: object | None = field(default=None)
     trade_service: object | None = field(default=None)
@@ -9,34 +9,15 @@ focused on sequencing and cross-step data flow.
 
 from __future__ import annotations
 
+from collections import Counter
+from contextlib import aclosing
 from random import Random
-from typing import AsyncIterator
-import json
+from typing import Any, AsyncIterator
+import asyncio
 import math
 from datetime import datetime, timezone
 
-from app.models.effects import (
-    MeterChangeEffect,
-    FlagSetEffect,
-    InventoryAddEffect,
-    InventoryRemoveEffect,
-    InventoryTakeEffect,
-    InventoryDropEffect,
-    InventoryGiveEffect,
-    InventoryPurchaseEffect,
-    InventorySellEffect,
-    MoveEffect,
-    MoveToEffect,
-    TravelToEffect,
-    ApplyModifierEffect,
-    RemoveModifierEffect,
-    ClothingPutOnEffect,
-    ClothingTakeOffEffect,
-    ClothingStateEffect,
-    ClothingSlotStateEffect,
-    OutfitPutOnEffect,
-    OutfitTakeOffEffect,
-)
+from app.core.json_stream import JSONObjectStream
 from app.models.nodes import NodeType
 from app.runtime.context import TurnContext
 from app.runtime.services.action_formatter import ActionFormatter
@@ -45,6 +26,14 @@ from app.runtime.services.actions import ActionService
 from app.runtime.services.events import EventPipeline
 from app.runtime.types import PlayerAction
 
+# Process-wide counts of work abandoned because the client went away
+# (turns rolled back, writer streams closed, checker calls cancelled).
+turn_metrics: Counter[str] = Counter()
+
+
+class _CheckerDeltaError(Exception):
+    """A checker section that could not be applied; the whole payload is discarded."""
+
 
 class TurnManager:
     """
@@ -70,6 +59,30 @@ class TurnManager:
         self.prompt_builder = getattr(runtime, "prompt_builder", None)
 
     async def run_turn(self, action: PlayerAction) -> AsyncIterator[dict]:
+        """
+        Run one turn as a transaction: state mutations are journaled and rolled
+        back if the turn raises or is abandoned before completing.
+        """
+        journal = self.runtime.state_manager.journal
+        transaction = journal.begin(self.runtime.state_manager.state)
+        try:
+            async with aclosing(self._run_turn(action)) as events:
+                async for event in events:
+                    if event["type"] == "complete":
+                        journal.commit()
+                    yield event
+        except BaseException as exc:
+            # A stale generator finalized after a newer turn started must not undo that turn.
+            if journal.active and journal.transaction == transaction:
+                undone = journal.rollback()
+                if isinstance(exc, (asyncio.CancelledError, GeneratorExit)):
+                    turn_metrics["turns_cancelled"] += 1
+                    self.logger.info("Turn cancelled; rolled back %d state mutations", undone)
+                else:
+                    self.logger.warning("Turn failed; rolled back %d state mutations", undone)
+            raise
+
+    async def _run_turn(self, action: PlayerAction) -> AsyncIterator[dict]:
         ctx = self._initialize_context()
         self.runtime.current_context = ctx
         self._validate_node(ctx)
@@ -89,6 +102,9 @@ class TurnManager:
 
         yield {"type": "action_summary", "content": ctx.action_summary}
 
+        if action.action_type == "choice":
+            ctx.scripted_choice = self._scripted_choice(ctx.current_node, action.choice_id)
+
         # Execute deterministic action effects before events/AI.
         self.action_service.execute(ctx, action)
         # Re-evaluate gates after state changes so DSL context reflects new values.
@@ -99,9 +115,16 @@ class TurnManager:
         ctx.event_narratives.extend(event_result.narratives)
         ctx.events_fired.extend(event_result.events_fired)
 
-        if not action.skip_ai and action.action_type in {"say", "do", "choice"} and self.ai_service:
-            async for chunk in self._run_ai_phase(ctx, action):
-                yield chunk
+        # Scripted choices resolve from authored beats: no Writer or Checker call.
+        if (
+            not action.skip_ai
+            and action.action_type in {"say", "do", "choice"}
+            and ctx.scripted_choice is None
+            and self.ai_service
+        ):
+            async with aclosing(self._run_ai_phase(ctx, action)) as chunks:
+                async for chunk in chunks:
+                    yield chunk
 
         self._apply_node_transitions(ctx)
         self._update_presence(ctx)
@@ -114,22 +137,26 @@ class TurnManager:
         state_summary = self.state_summary.build() if self.state_summary else self.runtime.state_manager.state.to_dict()
 
         narrative_parts = ctx.event_narratives.copy()
+        if ctx.scripted_choice is not None:
+            narrative_parts.extend(self._scripted_narrative(ctx))
         if ctx.ai_narrative:
             narrative_parts.append(ctx.ai_narrative)
         if not narrative_parts:
             narrative_parts.append(ctx.action_summary)
         narrative = "\n\n".join(narrative_parts).strip()
-        self.runtime.state_manager.state.narrative_history.append(narrative)
+        state = self.runtime.state_manager.state
+        journal = self.runtime.state_manager.journal
+        journal.append(state.narrative_history, narrative)
+        journal.set_attr(state, "narratives_since_summary", state.narratives_since_summary + 1)
+        if self.runtime.memory_service is not None:
+            self.runtime.memory_service.record_turn(narrative, ctx.milestones_reached)
 
         # Increment AI turn counter for memory summary tracking
         if ctx.ai_narrative:  # Only increment on AI-powered turns
-            self.runtime.state_manager.state.ai_turns_since_summary += 1
+            journal.set_attr(state, "ai_turns_since_summary", state.ai_turns_since_summary + 1)
 
         # Persist updated timestamp for state snapshots/persistence layers
-        try:
-            self.runtime.state_manager.state.updated_at = datetime.now(timezone.utc)
-        except Exception:
-            pass
+        journal.set_attr(state, "updated_at", datetime.now(timezone.utc))
 
         result = {
             "session_id": self.runtime.session_id,
@@ -150,13 +177,32 @@ class TurnManager:
     # Internal helpers (ported from the legacy engine)
     # ------------------------------------------------------------------
 
+    def _scripted_choice(self, node, choice_id: str | None):
+        """The node choice `choice_id` if it resolves scripted, else None."""
+        if node is None or not choice_id:
+            return None
+        for choice in list(node.choices or []) + list(node.dynamic_choices or []):
+            if choice.id == choice_id:
+                scripted = node.scripted if choice.scripted is None else choice.scripted
+                return choice if scripted else None
+        return None
+
+    def _scripted_narrative(self, ctx: TurnContext) -> list[str]:
+        """Render the choice's beats, or those of the node the turn ended on, against current state."""
+        beats = ctx.scripted_choice.beats or (ctx.current_node.beats if ctx.current_node else [])
+        if not beats:
+            return []
+        evaluator = self.runtime.state_manager.create_evaluator()
+        return [evaluator.render_text(beat) for beat in beats]
+
     def _initialize_context(self) -> TurnContext:
         state = self.runtime.state_manager.state
-        state.turn_count += 1
+        journal = self.runtime.state_manager.journal
+        journal.set_attr(state, "turn_count", state.turn_count + 1)
 
         rng_seed = self.runtime.turn_seed()
         rng = Random(rng_seed)
-        state.rng_seed = rng_seed
+        journal.set_attr(state, "rng_seed", rng_seed)
 
         current_node = self.runtime.index.nodes.get(state.current_node)
         if not current_node:
@@ -165,8 +211,8 @@ class TurnManager:
         snapshot = state.to_dict()
 
         if getattr(state, "current_visit_node", None) != current_node.id:
-            state.current_visit_node = current_node.id
-            state.current_visit_minutes = 0
+            journal.set_attr(state, "current_visit_node", current_node.id)
+            journal.set_attr(state, "current_visit_minutes", 0)
 
         return TurnContext(
             turn_number=state.turn_count,
@@ -212,6 +258,9 @@ class TurnManager:
             active_gates[character.id] = gate_results
             char_state = self.runtime.state_manager.state.characters.get(character.id)
             if char_state is not None:
+                journal = self.runtime.state_manager.journal
+                journal.record_attr(char_state, "gates")
+                journal.record_attr(char_state, "gates_full")
                 char_state.gates = {gate_id: result for gate_id, result in gate_results.items() if result}
                 char_state.gates_full = gate_results
 
@@ -285,8 +334,10 @@ class TurnManager:
             self.modifier_service.tick_durations(self.runtime.state_manager.state, minutes=info["minutes"])
         if hasattr(self.time_service, "apply_meter_dynamics"):
             self.time_service.apply_meter_dynamics(
-                day_advanced=info.get("day_advanced", False),
-                slot_advanced=info.get("slot_advanced", False),
+                day_advanced=info.get("decay_days", 0) > 0,
+                slot_advanced=info.get("decay_slots", 0) > 0,
+                days=info.get("decay_days", 1),
+                slots=info.get("decay_slots", 1),
             )
         if hasattr(self.event_pipeline, "decrement_cooldowns"):
             self.event_pipeline.decrement_cooldowns()
@@ -308,7 +359,7 @@ class TurnManager:
                 spent = getattr(state, "current_visit_minutes", 0)
                 remaining = max(0, cap - spent)
                 minutes = min(minutes, remaining)
-                state.current_visit_minutes = spent + minutes
+                self.runtime.state_manager.journal.set_attr(state, "current_visit_minutes", spent + minutes)
 
         return max(0, minutes)
 
@@ -380,14 +431,15 @@ class TurnManager:
         if run_exit and previous_node and previous_node.on_exit and previous_node.id != new_node.id:
             self.runtime.effect_resolver.apply_effects(previous_node.on_exit)
 
-        state.current_node = new_node.id
+        journal = self.runtime.state_manager.journal
+        journal.set_attr(state, "current_node", new_node.id)
         ctx.current_node = new_node
 
         if not state.nodes_history or state.nodes_history[-1] != new_node.id:
-            state.nodes_history.append(new_node.id)
+            journal.append(state.nodes_history, new_node.id)
 
-        state.current_visit_node = new_node.id
-        state.current_visit_minutes = 0
+        journal.set_attr(state, "current_visit_node", new_node.id)
+        journal.set_attr(state, "current_visit_minutes", 0)
 
         if new_node.on_enter:
             self.runtime.effect_resolver.apply_effects(new_node.on_enter)
@@ -416,9 +468,15 @@ class TurnManager:
 
         chunks: list[str] = []
         try:
-            async for token in self.ai_service.generate_stream(writer_prompt, temperature=0.8, max_tokens=400):
-                chunks.append(token)
-                yield {"type": "narrative_chunk", "content": token}
+            # Closed explicitly so an abandoned turn drops the upstream stream right away.
+            stream = self.ai_service.generate_stream(writer_prompt, temperature=0.8, max_tokens=400)
+            async with aclosing(stream) as tokens:
+                async for token in tokens:
+                    chunks.append(token)
+                    yield {"type": "narrative_chunk", "content": token}
+        except (asyncio.CancelledError, GeneratorExit):
+            turn_metrics["writer_streams_cancelled"] += 1
+            raise
         except Exception:  # fallback to one-shot
             response = await self.ai_service.generate(writer_prompt, temperature=0.8, max_tokens=400)
             chunks.append(response.content)
@@ -439,240 +497,86 @@ class TurnManager:
                 f"Active Gates: {ctx.active_gates}"
             )
 
-        try:
-            checker_response = await self.ai_service.generate(
-                checker_prompt,
-                json_mode=True,
-                temperature=0.2,
-                max_tokens=300,
-            )
-            ctx.checker_deltas = json.loads(checker_response.content)
-            self._apply_checker_deltas(ctx)
-        except Exception as exc:
-            self.logger.debug("Checker failed or returned invalid JSON: %s", exc)
+        # The checker is streamed and each top-level section is applied as soon as it
+        # closes, so a truncated, timed-out or prose-wrapped reply keeps what arrived.
+        from app.core.settings import GameSettings
 
-    def _apply_checker_deltas(self, ctx: TurnContext) -> None:
-        """Translate checker JSON into concrete effects."""
-        deltas = ctx.checker_deltas or {}
-        if not isinstance(deltas, dict):
+        ctx.checker_deltas = {}
+        parser = JSONObjectStream()
+        journal = self.runtime.state_manager.journal
+        savepoint = journal.savepoint()
+        applied = 0
+        try:
+            async with asyncio.timeout(GameSettings().checker_timeout_s):
+                stream = self.ai_service.generate_stream(
+                    checker_prompt,
+                    json_mode=True,
+                    temperature=0.2,
+                    max_tokens=300,
+                )
+                async with aclosing(stream) as tokens:
+                    async for token in tokens:
+                        for key, value in parser.feed(token):
+                            applied += self._apply_checker_section(ctx, key, value)
+                        if parser.done:
+                            break
+        except asyncio.CancelledError:
+            turn_metrics["checker_calls_cancelled"] += 1
+            raise
+        except _CheckerDeltaError as exc:
+            # Never keep part of a payload that failed to apply.
+            journal.rollback(savepoint)
+            self.logger.debug("Checker returned invalid deltas in '%s': %s", exc, exc.__cause__)
             return
+        except TimeoutError:
+            self.logger.warning("Checker timed out; keeping %d completed section(s)", len(ctx.checker_deltas))
+        except Exception as exc:
+            self.logger.debug("Checker stream failed; keeping %d completed section(s): %s", len(ctx.checker_deltas), exc)
 
-        effects: list = []
-        inventory_service = getattr(self.runtime, "inventory_service", None)
-
-        meters_payload = deltas.get("meters")
-        if isinstance(meters_payload, dict):
-            for char_id, changes in meters_payload.items():
-                if isinstance(changes, dict):
-                    # simple mapping meter -> delta
-                    for meter_id, delta in changes.items():
-                        effects.append(MeterChangeEffect(target=char_id, meter=meter_id, op="add", value=delta))
-                elif isinstance(changes, list):
-                    for change in changes:
-                        if not isinstance(change, dict):
-                            continue
-                        meter_id = change.get("meter")
-                        value = change.get("value")
-                        op = change.get("operation") or "add"
-                        if op not in {"add", "subtract", "set", "multiply", "divide"}:
-                            op = "add"
-                        if meter_id is None or value is None:
-                            continue
-                        effects.append(MeterChangeEffect(target=char_id, meter=meter_id, op=op, value=value))
-
-        flags_payload = deltas.get("flags")
-        if isinstance(flags_payload, list):
-            for change in flags_payload:
-                if not isinstance(change, dict):
-                    continue
-                key = change.get("key")
-                value = change.get("value")
-                if key is not None:
-                    effects.append(FlagSetEffect(key=key, value=value))
-        elif isinstance(flags_payload, dict):
-            for key, value in flags_payload.items():
-                effects.append(FlagSetEffect(key=key, value=value))
-
-        inventory_payload = deltas.get("inventory")
-        if isinstance(inventory_payload, list):
-            for change in inventory_payload:
-                if not isinstance(change, dict):
-                    continue
-                op = (change.get("op") or "").lower()
-                item_id = change.get("item")
-                if not op or not item_id:
-                    continue
-                raw_count = change.get("count", 1)
+        try:
+            for key, value in parser.finish():
+                applied += self._apply_checker_section(ctx, key, value)
+            # Legacy sections go to the service once, which decides whether they count.
+            delta_service = self.runtime.checker_delta_service
+            legacy = {key: value for key, value in ctx.checker_deltas.items() if delta_service.is_legacy(key)}
+            if legacy:
                 try:
-                    count = abs(int(raw_count))
-                except (TypeError, ValueError):
-                    continue
-                item_type = inventory_service.get_item_type(item_id) if inventory_service else "item"
-
-                if op == "add":
-                    owner = change.get("owner") or change.get("to")
-                    if owner:
-                        effects.append(InventoryAddEffect(target=owner, item_type=item_type, item=item_id, count=count))
-                elif op == "remove":
-                    owner = change.get("owner") or change.get("from")
-                    if owner:
-                        effects.append(InventoryRemoveEffect(target=owner, item_type=item_type, item=item_id, count=count))
-                elif op == "take":
-                    owner = change.get("owner") or change.get("to") or "player"
-                    effects.append(InventoryTakeEffect(target=owner, item_type=item_type, item=item_id, count=count))
-                elif op == "drop":
-                    owner = change.get("owner") or change.get("from") or "player"
-                    effects.append(InventoryDropEffect(target=owner, item_type=item_type, item=item_id, count=count))
-                elif op == "give":
-                    source = change.get("from") or change.get("owner")
-                    target = change.get("to")
-                    if source and target:
-                        effects.append(
-                            InventoryGiveEffect(
-                                source=source,
-                                target=target,
-                                item_type=item_type,
-                                item=item_id,
-                                count=count,
-                            )
-                        )
-                elif op == "purchase":
-                    buyer = change.get("buyer") or "player"
-                    seller = change.get("seller")
-                    price = change.get("price")
-                    effects.append(
-                        InventoryPurchaseEffect(
-                            target=buyer,
-                            source=seller or self.runtime.state_manager.state.current_location,
-                            item_type=item_type,
-                            item=item_id,
-                            count=count,
-                            price=price,
-                        )
-                    )
-                elif op == "sell":
-                    seller = change.get("seller") or "player"
-                    buyer = change.get("buyer") or self.runtime.state_manager.state.current_location
-                    price = change.get("price")
-                    effects.append(
-                        InventorySellEffect(
-                            source=seller,
-                            target=buyer,
-                            item_type=item_type,
-                            item=item_id,
-                            count=count,
-                            price=price,
-                        )
-                    )
-
-        clothing_payload = deltas.get("clothing")
-        if isinstance(clothing_payload, list):
-            for change in clothing_payload:
-                if not isinstance(change, dict):
-                    continue
-                target = change.get("character") or change.get("target")
-                if not target:
-                    continue
-                action_type = (change.get("type") or "").lower()
-                slot = change.get("slot")
-                item = change.get("item")
-                slot_state = change.get("state")
-
-                if action_type == "put_on" and item:
-                    effects.append(ClothingPutOnEffect(target=target, item=item, condition=slot_state))
-                elif action_type == "take_off" and item:
-                    effects.append(ClothingTakeOffEffect(target=target, item=item))
-                elif action_type == "item_state" and item and slot_state:
-                    effects.append(ClothingStateEffect(target=target, item=item, condition=slot_state))
-                elif slot and slot_state:
-                    effects.append(ClothingSlotStateEffect(target=target, slot=slot, condition=slot_state))
-
-        movement_payload = deltas.get("movement")
-        if isinstance(movement_payload, list):
-            for change in movement_payload:
-                if not isinstance(change, dict):
-                    continue
-                move_type = (change.get("type") or "").lower()
-                companions = change.get("with") or []
-
-                if move_type == "move":
-                    direction = change.get("direction")
-                    if direction:
-                        effects.append(MoveEffect(direction=direction, with_characters=companions))
-                elif move_type == "move_to":
-                    location = change.get("location")
-                    if location:
-                        effects.append(MoveToEffect(location=location, with_characters=companions))
-                elif move_type == "travel_to":
-                    location = change.get("location")
-                    method = change.get("method") or "walk"
-                    if location:
-                        effects.append(TravelToEffect(location=location, method=method, with_characters=companions))
-
-        discoveries_payload = deltas.get("discoveries")
-        if isinstance(discoveries_payload, dict):
-            state = self.runtime.state_manager.state
-            for location_id in discoveries_payload.get("locations", []) or []:
-                state.discovered_locations.add(location_id)
-            for zone_id in discoveries_payload.get("zones", []) or []:
-                state.discovered_zones.add(zone_id)
-            for action_id in discoveries_payload.get("actions", []) or []:
-                if action_id not in state.unlocked_actions:
-                    state.unlocked_actions.append(action_id)
-            for ending_id in discoveries_payload.get("endings", []) or []:
-                if ending_id not in state.unlocked_endings:
-                    state.unlocked_endings.append(ending_id)
-
-        modifiers_payload = deltas.get("modifiers")
-        if isinstance(modifiers_payload, dict):
-            for addition in modifiers_payload.get("add", []) or []:
-                if not isinstance(addition, dict):
-                    continue
-                modifier_id = addition.get("modifier")
-                target = addition.get("target")
-                duration = addition.get("duration")
-                if modifier_id and target:
-                    effects.append(ApplyModifierEffect(target=target, modifier_id=modifier_id, duration=duration))
-            for removal in modifiers_payload.get("remove", []) or []:
-                if not isinstance(removal, dict):
-                    continue
-                modifier_id = removal.get("modifier")
-                target = removal.get("target")
-                if modifier_id and target:
-                    effects.append(RemoveModifierEffect(target=target, modifier_id=modifier_id))
-
-        # Legacy support
-        if not effects:
-            if meter_changes := deltas.get("meter_changes"):
-                for char_id, meters in meter_changes.items():
-                    for meter, value in meters.items():
-                        effects.append(MeterChangeEffect(target=char_id, meter=meter, op="add", value=value))
-            if flag_changes := deltas.get("flag_changes"):
-                for key, value in flag_changes.items():
-                    effects.append(FlagSetEffect(key=key, value=value))
-            if inventory_changes := deltas.get("inventory_changes"):
-                for owner_id, items in inventory_changes.items():
-                    for item_id, count in items.items():
-                        if count > 0:
-                            effects.append(InventoryAddEffect(target=owner_id, item_type="item", item=item_id, count=abs(count)))
-                        else:
-                            effects.append(InventoryRemoveEffect(target=owner_id, item_type="item", item=item_id, count=abs(count)))
-            if clothing_changes := deltas.get("clothing_changes"):
-                for char_id, items in clothing_changes.items():
-                    for item_id, state_value in items.items():
-                        effects.append(ClothingStateEffect(target=char_id, item=item_id, condition=state_value))
-
-        # Handle memory updates
+                    self._apply_checker_deltas(ctx, legacy, applied=applied)
+                except Exception as exc:
+                    raise _CheckerDeltaError(", ".join(legacy)) from exc
+        except _CheckerDeltaError as exc:
+            journal.rollback(savepoint)
+            self.logger.debug("Checker returned invalid deltas in '%s': %s", exc, exc.__cause__)
+
+    def _apply_checker_section(self, ctx: TurnContext, key: str, value: Any) -> int:
+        """Record one completed top-level checker section and apply it (legacy sections wait)."""
+        ctx.checker_deltas[key] = value
+        if self.runtime.checker_delta_service.is_legacy(key):
+            return 0
+        try:
+            return self._apply_checker_deltas(ctx, {key: value})
+        except Exception as exc:
+            raise _CheckerDeltaError(key) from exc
+
+    def _apply_checker_deltas(self, ctx: TurnContext, deltas: dict | None = None, *, applied: int = 0) -> int:
+        """
+        Validate checker JSON against the game schema and apply it; returns how many changes were applied.
+        `applied` counts changes already taken from other sections of the same reply.
+        """
+        if deltas is None:
+            deltas = ctx.checker_deltas or {}
+        if not isinstance(deltas, dict):
+            return 0
+        count = self.runtime.checker_delta_service.apply(deltas, applied=applied)
         self._apply_memory_updates(deltas)
-
-        if effects:
-            self.runtime.effect_resolver.apply_effects(effects)
+        return count
 
     def _apply_memory_updates(self, deltas: dict) -> None:
         """Apply character memories and narrative summary from Checker response."""
         from app.core.settings import GameSettings
 
         state = self.runtime.state_manager.state
+        journal = self.runtime.state_manager.journal
         settings = GameSettings()
 
         # Parse character_memories: {"alex": "Shared coffee preference", "emma": ...}
@@ -684,16 +588,22 @@ class TurnManager:
                 # Skip player (only NPC memories)
                 if char_id == "player":
                     continue
-                # Append to character's memory log
+                # Append to character's memory log (the memory service also stores and trims it)
                 if char_id in state.characters:
-                    state.characters[char_id].memory_log.append(memory_text.strip())
+                    if self.runtime.memory_service is not None:
+                        self.runtime.memory_service.remember(char_id, memory_text.strip())
+                    else:
+                        journal.append(state.characters[char_id].memory_log, memory_text.strip())
 
         # Parse narrative_summary: "Long form summary..."
         narrative_summary = deltas.get("narrative_summary")
         if isinstance(narrative_summary, str) and narrative_summary.strip():
-            state.narrative_summary = narrative_summary.strip()
-            # Reset counter when summary is updated
+            journal.record_attr(state, "ai_turns_since_summary")
+            journal.record_attr(state, "narratives_since_summary")
+            journal.set_attr(state, "narrative_summary", narrative_summary.strip())
+            # Reset counters when summary is updated
             state.ai_turns_since_summary = 0
+            state.narratives_since_summary = 0
 
     # ------------------------------------------------------------------
     # AI helpers
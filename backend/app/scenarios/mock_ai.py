@@ -113,10 +113,17 @@ class MockAIService:
         """
         Return mocked Writer response as a stream.
 
-        Streams the narrative character by character for realism.
+        Streams the narrative character by character for realism. With
+        `json_mode` the Checker response is streamed the same way.
         """
         key = self.current_mock_key or "default"
 
+        if kwargs.get("json_mode"):
+            response = await self.generate(prompt, temperature, max_tokens)
+            for char in response.content:
+                yield char
+            return
+
         # Get mock narrative or use default
         narrative = self.writer_responses.get(key, "A scene unfolds...")
 
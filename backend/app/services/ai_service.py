@@ -10,6 +10,7 @@ from pydantic import BaseModel, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from app.core.env import ENV_FILE_PATH
+from app.services.scheduler import AIScheduler, Priority
 
 
 class AISettings(BaseSettings):
@@ -32,6 +33,17 @@ class AISettings(BaseSettings):
     checker_top_p: float = 0.95
     checker_max_tokens: int = 300
 
+    # Background narrative summaries (off the turn path, so a cheaper model will do)
+    summary_model: str = "mistralai/mistral-7b-instruct"
+    summary_temperature: float = 0.3
+    summary_max_tokens: int = 600
+
+    # Request scheduling (shared by every session in the process)
+    ai_max_concurrency: int = 8
+    ai_model_concurrency: dict[str, int] = {}  # e.g. AI_MODEL_CONCURRENCY='{"model/id": 2}'
+    ai_tokens_per_minute: int = 0  # 0 = unlimited
+    ai_model_tokens_per_minute: dict[str, int] = {}
+
     model_config = SettingsConfigDict(env_file=str(ENV_FILE_PATH), extra="ignore")
 
 
@@ -60,11 +72,34 @@ class AIResponse(BaseModel):
 
         return cleaned if cleaned else None
 
+_scheduler: AIScheduler | None = None
+
+
+def get_ai_scheduler() -> AIScheduler:
+    """The scheduler every AIService in this process sends its calls through."""
+    global _scheduler
+    if _scheduler is None:
+        settings = AISettings()
+        _scheduler = AIScheduler(
+            max_concurrency=settings.ai_max_concurrency,
+            model_concurrency=settings.ai_model_concurrency,
+            tokens_per_minute=settings.ai_tokens_per_minute,
+            model_tokens_per_minute=settings.ai_model_tokens_per_minute,
+        )
+    return _scheduler
+
+
+def _token_estimate(prompt: str, max_tokens: int) -> int:
+    """Rough budget charge for a call: prompt at ~4 characters per token plus the completion cap."""
+    return len(prompt) // 4 + max_tokens
+
+
 class AIService:
     """OpenRouter AI service for NSFW-capable text generation"""
 
     def __init__(self):
         self.settings = AISettings()
+        self.scheduler = get_ai_scheduler()
         self.base_url = "https://openrouter.ai/api/v1/chat/completions"
 
         # Validate API key
@@ -79,9 +114,14 @@ class AIService:
             max_tokens: int = 500,
             system_prompt: Optional[str] = None,
             json_mode: bool = False,
-            top_p: float = 0.9
+            top_p: float = 0.9,
+            priority: Priority | None = None,
     ) -> AIResponse:
-        """Generate text using OpenRouter API with NSFW support"""
+        """
+        Generate text using OpenRouter API with NSFW support.
+        Calls are admitted by the shared scheduler; JSON (checker) calls default
+        to checker priority, others to writer priority.
+        """
         model = model or self.settings.writer_model
 
         # Use mock if no API key
@@ -136,43 +176,46 @@ IMPORTANT: This is an adult interactive fiction game for users 18+. You should:
             "Content-Type": "application/json"
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.post(
-                    self.base_url,
-                    json=payload,
-                    headers=headers
-                )
-
-                if response.status_code != 200:
-                    error_data = response.json()
-                    error_msg = error_data.get("error", {}).get("message", response.text)
-                    print(f"OpenRouter API Error ({response.status_code}): {error_msg}")
+        if priority is None:
+            priority = Priority.CHECKER if json_mode else Priority.WRITER
+        async with self.scheduler.slot(model, priority, _token_estimate(prompt, max_tokens)):
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                try:
+                    response = await client.post(
+                        self.base_url,
+                        json=payload,
+                        headers=headers
+                    )
 
-                    # Fall back to mock
+                    if response.status_code != 200:
+                        error_data = response.json()
+                        error_msg = error_data.get("error", {}).get("message", response.text)
+                        print(f"OpenRouter API Error ({response.status_code}): {error_msg}")
+
+                        # Fall back to mock
+                        return self._get_mock_response(prompt, json_mode)
+
+                    data = response.json()
+                    content = data["choices"][0]["message"]["content"]
+
+                    # Check for refusal (shouldn't happen with Mixtral)
+                    if self._is_refusal(content):
+                        print(f"Content refusal detected, using fallback")
+                        content = self._generate_fallback_response(prompt)
+
+                    return AIResponse(
+                        content=content,
+                        model=model,
+                        usage=data.get("usage"),
+                        raw_response=data
+                    )
+
+                except httpx.TimeoutException:
+                    print(f"AI Call TIMEOUT")
+                    return self._get_mock_response(prompt, json_mode)
+                except Exception as e:
+                    print(f"AI Call ERROR: {e}")
                     return self._get_mock_response(prompt, json_mode)
-
-                data = response.json()
-                content = data["choices"][0]["message"]["content"]
-
-                # Check for refusal (shouldn't happen with Mixtral)
-                if self._is_refusal(content):
-                    print(f"Content refusal detected, using fallback")
-                    content = self._generate_fallback_response(prompt)
-
-                return AIResponse(
-                    content=content,
-                    model=model,
-                    usage=data.get("usage"),
-                    raw_response=data
-                )
-
-            except httpx.TimeoutException:
-                print(f"AI Call TIMEOUT")
-                return self._get_mock_response(prompt, json_mode)
-            except Exception as e:
-                print(f"AI Call ERROR: {e}")
-                return self._get_mock_response(prompt, json_mode)
 
     async def generate_stream(
             self,
@@ -181,15 +224,18 @@ IMPORTANT: This is an adult interactive fiction game for users 18+. You should:
             temperature: float = 0.7,
             max_tokens: int = 500,
             system_prompt: Optional[str] = None,
-            top_p: float = 0.9
+            top_p: float = 0.9,
+            json_mode: bool = False,
+            priority: Priority | None = None,
     ) -> AsyncGenerator[str, None]:
-        """Stream text generation from OpenRouter API"""
+        """Stream text generation from OpenRouter API (writer priority by default, checker priority in JSON mode)"""
 
         model = model or self.settings.writer_model
+        priority = priority or (Priority.CHECKER if json_mode else Priority.WRITER)
 
         # Use mock if no API key
         if not self.settings.openrouter_api_key:
-            mock_response = self._get_mock_response(prompt, False)
+            mock_response = self._get_mock_response(prompt, json_mode)
             # Simulate streaming by yielding words
             for word in mock_response.content.split():
                 yield word + " "
@@ -230,6 +276,9 @@ IMPORTANT: This is an adult interactive fiction game for users 18+. You should:
             "stream": True  # Enable streaming
         }
 
+        if json_mode:
+            payload["response_format"] = {"type": "json_object"}
+
         headers = {
             "Authorization": f"Bearer {self.settings.openrouter_api_key}",
             "HTTP-Referer": self.settings.app_url,
@@ -237,45 +286,46 @@ IMPORTANT: This is an adult interactive fiction game for users 18+. You should:
             "Content-Type": "application/json"
         }
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            try:
-                async with client.stream("POST", self.base_url, json=payload, headers=headers) as response:
-                    if response.status_code != 200:
-                        error_data = await response.aread()
-                        print(f"OpenRouter API Error ({response.status_code}): {error_data.decode()}")
-                        # Fall back to mock streaming
-                        mock_response = self._get_mock_response(prompt, False)
-                        for word in mock_response.content.split():
-                            yield word + " "
-                        return
-
-                    # Process SSE stream
-                    async for line in response.aiter_lines():
-                        if line.startswith("data: "):
-                            data_str = line[6:]  # Remove "data: " prefix
-
-                            if data_str.strip() == "[DONE]":
-                                break
-
-                            try:
-                                chunk = json.loads(data_str)
-                                if "choices" in chunk and len(chunk["choices"]) > 0:
-                                    delta = chunk["choices"][0].get("delta", {})
-                                    if "content" in delta:
-                                        yield delta["content"]
-                            except json.JSONDecodeError:
-                                continue  # Skip malformed chunks
-
-            except httpx.TimeoutException:
-                print("OpenRouter API timeout during streaming")
-                mock_response = self._get_mock_response(prompt, False)
-                for word in mock_response.content.split():
-                    yield word + " "
-            except Exception as e:
-                print(f"AI Service Streaming Error: {e}")
-                mock_response = self._get_mock_response(prompt, False)
-                for word in mock_response.content.split():
-                    yield word + " "
+        async with self.scheduler.slot(model, priority, _token_estimate(prompt, max_tokens)):
+            async with httpx.AsyncClient(timeout=60.0) as client:
+                try:
+                    async with client.stream("POST", self.base_url, json=payload, headers=headers) as response:
+                        if response.status_code != 200:
+                            error_data = await response.aread()
+                            print(f"OpenRouter API Error ({response.status_code}): {error_data.decode()}")
+                            # Fall back to mock streaming
+                            mock_response = self._get_mock_response(prompt, json_mode)
+                            for word in mock_response.content.split():
+                                yield word + " "
+                            return
+
+                        # Process SSE stream
+                        async for line in response.aiter_lines():
+                            if line.startswith("data: "):
+                                data_str = line[6:]  # Remove "data: " prefix
+
+                                if data_str.strip() == "[DONE]":
+                                    break
+
+                                try:
+                                    chunk = json.loads(data_str)
+                                    if "choices" in chunk and len(chunk["choices"]) > 0:
+                                        delta = chunk["choices"][0].get("delta", {})
+                                        if "content" in delta:
+                                            yield delta["content"]
+                                except json.JSONDecodeError:
+                                    continue  # Skip malformed chunks
+
+                except httpx.TimeoutException:
+                    print("OpenRouter API timeout during streaming")
+                    mock_response = self._get_mock_response(prompt, json_mode)
+                    for word in mock_response.content.split():
+                        yield word + " "
+                except Exception as e:
+                    print(f"AI Service Streaming Error: {e}")
+                    mock_response = self._get_mock_response(prompt, json_mode)
+                    for word in mock_response.content.split():
+                        yield word + " "
 
     def _is_refusal(self, content: str) -> bool:
         """Check if the AI refused to generate content"""
@@ -3,7 +3,7 @@ Mock AI service for fast testing without API calls.
 """
 
 import json
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
 from app.services.ai_service import AIResponse
 
@@ -24,22 +24,12 @@ class MockAIService:
         system_prompt: str | None = None,
         json_mode: bool = False,
         top_p: float = 0.9,
+        priority: Any = None,
     ) -> AIResponse:
         """Generate instant mock response."""
 
         if json_mode:
-            # Mock Checker response
-            content = json.dumps({
-                "meter_changes": {},
-                "flag_changes": {},
-                "clothing_changes": {},
-                "location_change": None,
-                "player_intent": "test",
-                "content_flags": [],
-                "emotional_tone": "neutral",
-                "intimacy_escalation": False,
-                "memory": []
-            })
+            content = self._checker_content()
         else:
             # Mock Writer response
             content = (
@@ -61,10 +51,18 @@ class MockAIService:
         temperature: float = 0.7,
         max_tokens: int = 500,
         system_prompt: str | None = None,
+        json_mode: bool = False,
         top_p: float = 0.9,
+        priority: Any = None,
     ) -> AsyncGenerator[str, None]:
         """Generate instant mock streaming response."""
 
+        if json_mode:
+            content = self._checker_content()
+            for start in range(0, len(content), 16):
+                yield content[start:start + 16]
+            return
+
         # Mock streaming by yielding the response in chunks
         response = (
             "The scene unfolds as expected. Your action has an effect on the "
@@ -74,3 +72,18 @@ class MockAIService:
         # Yield each word
         for word in response.split():
             yield word + " "
+
+    @staticmethod
+    def _checker_content() -> str:
+        """Mock Checker response."""
+        return json.dumps({
+            "meter_changes": {},
+            "flag_changes": {},
+            "clothing_changes": {},
+            "location_change": None,
+            "player_intent": "test",
+            "content_flags": [],
+            "emotional_tone": "neutral",
+            "intimacy_escalation": False,
+            "memory": []
+        })
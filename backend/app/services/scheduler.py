@@ -0,0 +1,179 @@
+"""
+Admission control for model calls.
+
+Every session shares one AIScheduler per process. A call waits for a slot
+under the global and per-model concurrency limits and the token-rate budgets
+(token buckets refilled per minute), and waiting calls are admitted by
+priority: interactive writer calls first, then checker calls, then background
+summaries. Time spent queued is recorded per priority.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+
+
+class Priority(IntEnum):
+    WRITER = 0
+    CHECKER = 1
+    SUMMARY = 2
+
+
+@dataclass(order=True, slots=True)
+class _Waiter:
+    priority: int
+    seq: int
+    model: str = field(compare=False)
+    tokens: int = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class _TokenBucket:
+    """Refills `per_minute` tokens a minute, holding at most one minute's worth."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60
+        self.level = self.capacity
+        self.stamp = time.monotonic()
+
+    def delay(self, tokens: int, now: float) -> float:
+        """Seconds until `tokens` are available (a request larger than the bucket waits for a full one)."""
+        self.level = min(self.capacity, self.level + (now - self.stamp) * self.rate)
+        self.stamp = now
+        missing = min(tokens, self.capacity) - self.level
+        return missing / self.rate if missing > 0 else 0.0
+
+    def take(self, tokens: int) -> None:
+        self.level -= min(tokens, self.capacity)
+
+
+class AIScheduler:
+    """Admits model calls under concurrency and token-rate limits, by priority."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        model_concurrency: dict[str, int] | None = None,
+        tokens_per_minute: int = 0,
+        model_tokens_per_minute: dict[str, int] | None = None,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.model_concurrency = dict(model_concurrency or {})
+        self._bucket = _TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self._model_buckets = {
+            model: _TokenBucket(limit) for model, limit in (model_tokens_per_minute or {}).items() if limit > 0
+        }
+        self._waiting: list[_Waiter] = []
+        self._seq = itertools.count()
+        self._active = 0
+        self._active_by_model: Counter[str] = Counter()
+        self._timer: asyncio.TimerHandle | None = None
+        self.stats: Counter[str] = Counter()
+        self._queued_max: dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, model: str, priority: Priority = Priority.WRITER, tokens: int = 0):
+        """Hold a slot for one call to `model` that may use about `tokens` tokens."""
+        waiter = _Waiter(int(priority), next(self._seq), model, tokens, asyncio.get_running_loop().create_future())
+        heapq.heappush(self._waiting, waiter)
+        queued_at = time.monotonic()
+        self._dispatch()
+        try:
+            await waiter.future
+        except BaseException:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted just as the caller gave up.
+                self._release(model)
+            else:
+                waiter.future.cancel()
+            raise
+        self._record(Priority(priority), time.monotonic() - queued_at)
+        try:
+            yield
+        finally:
+            self._release(model)
+
+    def metrics(self) -> dict[str, Any]:
+        """Calls admitted and time spent queued per priority, plus current load."""
+        by_priority = {}
+        for priority in Priority:
+            name = priority.name.lower()
+            by_priority[name] = {
+                "calls": self.stats[f"{name}_calls"],
+                "queued_ms_total": round(self.stats[f"{name}_queued_ms"]),
+                "queued_ms_max": round(self._queued_max.get(name, 0.0)),
+            }
+        return {
+            "active": self._active,
+            "waiting": sum(1 for waiter in self._waiting if not waiter.future.done()),
+            "priorities": by_priority,
+        }
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+    def _record(self, priority: Priority, queued: float) -> None:
+        name = priority.name.lower()
+        queued_ms = queued * 1000
+        self.stats[f"{name}_calls"] += 1
+        self.stats[f"{name}_queued_ms"] += queued_ms
+        self._queued_max[name] = max(self._queued_max.get(name, 0.0), queued_ms)
+
+    def _release(self, model: str) -> None:
+        self._active -= 1
+        self._active_by_model[model] -= 1
+        if not self._active_by_model[model]:
+            del self._active_by_model[model]
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Admit waiting calls in priority order while limits allow."""
+        now = time.monotonic()
+        skipped: list[_Waiter] = []
+        retry_in: float | None = None
+        while self._waiting and self._active < self.max_concurrency:
+            waiter = heapq.heappop(self._waiting)
+            if waiter.future.done():
+                continue
+            limit = self.model_concurrency.get(waiter.model)
+            if limit is not None and self._active_by_model[waiter.model] >= limit:
+                # Another model's call may still go ahead.
+                skipped.append(waiter)
+                continue
+            model_bucket = self._model_buckets.get(waiter.model)
+            if model_bucket is not None:
+                delay = model_bucket.delay(waiter.tokens, now)
+                if delay:
+                    skipped.append(waiter)
+                    retry_in = delay if retry_in is None else min(retry_in, delay)
+                    continue
+            if self._bucket is not None:
+                delay = self._bucket.delay(waiter.tokens, now)
+                if delay:
+                    # Out of shared budget: lower priorities must not overtake this call.
+                    skipped.append(waiter)
+                    retry_in = delay if retry_in is None else min(retry_in, delay)
+                    break
+                self._bucket.take(waiter.tokens)
+            if model_bucket is not None:
+                model_bucket.take(waiter.tokens)
+            self._active += 1
+            self._active_by_model[waiter.model] += 1
+            waiter.future.set_result(None)
+        for waiter in skipped:
+            heapq.heappush(self._waiting, waiter)
+        if retry_in is not None:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = asyncio.get_running_loop().call_later(retry_in, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
@@ -0,0 +1,133 @@
+"""
+Background narrative summaries.
+
+Every `memory_summary_interval` AI turns a session's rolling narrative summary
+is rewritten. That request used to ride on the checker, making exactly those
+turns slower; it now runs here once the turn has completed, on a small pool of
+workers, at the scheduler's lowest priority and with its own (cheaper) model
+settings. The queue is bounded: while it is full a session's refresh is
+skipped and offered again after its next AI turn, so summaries lag behind
+instead of piling up.
+"""
+
+import asyncio
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.settings import GameSettings
+from app.services.ai_service import AISettings
+from app.services.scheduler import Priority
+
+
+@dataclass(slots=True)
+class SummaryJob:
+    """One summary refresh, captured from the session when its turn completed."""
+    engine: Any
+    prompt: str
+    # The summary the new one is written from; the swap only replaces this one.
+    previous: str
+    # AI turns the new summary covers
+    covered: int
+    # Narratives (of any turn) the new summary covers
+    narratives: int = 0
+
+    @property
+    def session_id(self) -> str:
+        return self.engine.session_id
+
+
+class SummaryQueue:
+    """Runs summary jobs off the turn path, at most one per session at a time."""
+
+    def __init__(self, max_pending: int = 32, workers: int = 2):
+        self.max_pending = max(1, max_pending)
+        self.workers = max(1, workers)
+        self._pending: deque[SummaryJob] = deque()
+        # Sessions with a job queued or running
+        self._sessions: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self.stats: Counter[str] = Counter()
+
+    def submit(self, job: SummaryJob) -> bool:
+        """Queue a job; False if the session already has one or the queue is full."""
+        if job.session_id in self._sessions:
+            return False
+        if len(self._pending) >= self.max_pending:
+            self.stats["dropped"] += 1
+            return False
+        self._pending.append(job)
+        self._sessions.add(job.session_id)
+        self.stats["queued"] += 1
+        loop = asyncio.get_running_loop()
+        # Workers left behind by a loop that is gone never finish; forget them.
+        self._tasks.difference_update([task for task in self._tasks if task.get_loop() is not loop or task.done()])
+        if len(self._tasks) < self.workers:
+            task = loop.create_task(self._drain())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return True
+
+    def metrics(self) -> dict[str, Any]:
+        return {"pending": len(self._pending), "running": len(self._sessions) - len(self._pending), **self.stats}
+
+    async def join(self) -> None:
+        """Wait until every queued job has finished."""
+        while running := [task for task in self._tasks if not task.done()]:
+            await asyncio.gather(*running, return_exceptions=True)
+
+    async def shutdown(self) -> None:
+        """Drop queued jobs and cancel running ones (their sessions are offered again on a later turn)."""
+        for job in self._pending:
+            self._sessions.discard(job.session_id)
+        self._pending.clear()
+        tasks, self._tasks = self._tasks, set()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _drain(self) -> None:
+        while self._pending:
+            job = self._pending.popleft()
+            try:
+                await self._run(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.stats["failed"] += 1
+                job.engine.runtime.logger.exception("Background narrative summary failed")
+            finally:
+                self._sessions.discard(job.session_id)
+
+    async def _run(self, job: SummaryJob) -> None:
+        settings = AISettings()
+        response = await job.engine.runtime.ai_service.generate(
+            job.prompt,
+            model=settings.summary_model,
+            temperature=settings.summary_temperature,
+            max_tokens=settings.summary_max_tokens,
+            priority=Priority.SUMMARY,
+        )
+        summary = (response.content or "").strip()
+        if not summary:
+            self.stats["failed"] += 1
+            return
+        outcome = await job.engine.apply_summary(
+            summary, previous=job.previous, covered=job.covered, narratives=job.narratives,
+        )
+        self.stats[_OUTCOME_STATS[outcome]] += 1
+
+
+# Engine.apply_summary outcome -> stats key
+_OUTCOME_STATS = {"applied": "completed", "deferred": "deferred", "stale": "stale"}
+
+_summary_queue: SummaryQueue | None = None
+
+
+def get_summary_queue() -> SummaryQueue:
+    """The process-wide summary queue."""
+    global _summary_queue
+    if _summary_queue is None:
+        settings = GameSettings()
+        _summary_queue = SummaryQueue(settings.summary_queue_size, settings.summary_workers)
+    return _summary_queue
@@ -1 +1,31 @@
 """Storage and persistence layer"""
+
+from app.storage.sessions import (
+    InMemorySessionRepository,
+    SessionRecord,
+    SessionRepository,
+    SQLiteSessionRepository,
+)
+
+__all__ = [
+    "InMemorySessionRepository",
+    "SessionRecord",
+    "SessionRepository",
+    "SQLiteSessionRepository",
+    "create_session_repository",
+]
+
+
+def create_session_repository(settings=None) -> SessionRepository:
+    """Build the session repository configured in GameSettings."""
+    from app.core.settings import GameSettings
+
+    settings = settings or GameSettings()
+    if settings.session_store == "memory":
+        return InMemorySessionRepository()
+    return SQLiteSessionRepository(
+        settings.session_db_path,
+        fsync=settings.session_fsync,
+        flush_interval=settings.session_flush_interval_ms / 1000,
+        max_batch=settings.session_flush_batch,
+    )
@@ -0,0 +1,402 @@
+"""
+Session persistence for the runtime engine.
+
+A SessionRepository stores one SessionRecord per session: the GameState plus
+the few runtime fields needed to rehydrate a PlotPlayEngine (game id, seeds).
+The state is snapshotted (pickled) synchronously by save(), which the engine
+runs on a worker thread so large states never stall the event loop; the SQLite
+repository then writes snapshots behind the caller on a background thread,
+grouping all saves that arrive within a short window into one transaction.
+
+Repositories also hand out per-session leases so that several worker processes
+sharing one store never run turns for the same session concurrently, and a
+monotonically increasing revision lets a worker notice that its cached engine
+is older than the stored snapshot.
+"""
+
+from __future__ import annotations
+
+import logging
+import io
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+from app.models.game import GameState
+
+logger = logging.getLogger(__name__)
+
+FsyncPolicy = Literal["off", "normal", "full"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    game_id TEXT NOT NULL,
+    turn_count INTEGER NOT NULL,
+    base_seed INTEGER,
+    generated_seed INTEGER,
+    updated_at REAL NOT NULL,
+    revision INTEGER NOT NULL DEFAULT 0,
+    state BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS session_leases (
+    session_id TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+_UPSERT = """
+INSERT INTO sessions (session_id, game_id, turn_count, base_seed, generated_seed, updated_at, revision, state)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(session_id) DO UPDATE SET
+    game_id = excluded.game_id,
+    turn_count = excluded.turn_count,
+    base_seed = excluded.base_seed,
+    generated_seed = excluded.generated_seed,
+    updated_at = excluded.updated_at,
+    revision = excluded.revision,
+    state = excluded.state
+"""
+
+_SELECT = (
+    "SELECT session_id, game_id, turn_count, base_seed, generated_seed, updated_at, revision, state "
+    "FROM sessions WHERE session_id = ?"
+)
+
+# Take the lease when it is free, expired, or already ours (renewal).
+_ACQUIRE = """
+INSERT INTO session_leases (session_id, owner, expires_at) VALUES (?, ?, ?)
+ON CONFLICT(session_id) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+WHERE session_leases.owner = excluded.owner OR session_leases.expires_at < ?
+"""
+
+
+@dataclass(slots=True)
+class SessionRecord:
+    """Everything needed to rebuild a session's engine."""
+    session_id: str
+    game_id: str
+    state: GameState
+    base_seed: int | None = None
+    generated_seed: int | None = None
+    updated_at: float = field(default_factory=time.time)
+    revision: int = 0
+
+
+# A snapshot row, in column order: the state is already encoded so it is
+# immune to further mutations of the live GameState.
+_Row = tuple[str, str, int, int | None, int | None, float, int, bytes]
+
+
+# Strings up to this length (ids, times, short values) are interned when a
+# snapshot is decoded, so restored sessions share them instead of each holding
+# its own copy of every zone, location, item and meter id.
+_INTERN_MAX_LEN = 64
+
+
+class _InterningPickler(pickle.Pickler):
+    def persistent_id(self, obj):
+        if type(obj) is str and len(obj) <= _INTERN_MAX_LEN:
+            return obj
+        return None
+
+
+class _InterningUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        return sys.intern(pid)
+
+
+def _dumps(state: GameState) -> bytes:
+    buffer = io.BytesIO()
+    _InterningPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(state)
+    return buffer.getvalue()
+
+
+def _loads(blob: bytes) -> GameState:
+    return _InterningUnpickler(io.BytesIO(blob)).load()
+
+
+def _encode(record: SessionRecord) -> _Row:
+    return (
+        record.session_id,
+        record.game_id,
+        record.state.turn_count,
+        record.base_seed,
+        record.generated_seed,
+        record.updated_at,
+        record.revision,
+        _dumps(record.state),
+    )
+
+
+def _decode(row: _Row) -> SessionRecord:
+    session_id, game_id, _turn_count, base_seed, generated_seed, updated_at, revision, blob = row
+    return SessionRecord(
+        session_id=session_id,
+        game_id=game_id,
+        state=_loads(blob),
+        base_seed=base_seed,
+        generated_seed=generated_seed,
+        updated_at=updated_at,
+        revision=revision,
+    )
+
+
+class SessionRepository(ABC):
+    """Interface for session stores."""
+
+    @abstractmethod
+    def save(self, record: SessionRecord) -> None:
+        """Snapshot a session. Implementations may persist it asynchronously."""
+
+    @abstractmethod
+    def load(self, session_id: str) -> SessionRecord | None:
+        """Return the latest saved snapshot of a session, or None."""
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        """Forget a session."""
+
+    @abstractmethod
+    def revision(self, session_id: str) -> int | None:
+        """Return the revision of the latest saved snapshot without decoding it."""
+
+    @abstractmethod
+    def acquire_lease(self, session_id: str, owner: str, ttl: float) -> bool:
+        """Try to take (or renew) the exclusive lease on a session for `ttl` seconds."""
+
+    @abstractmethod
+    def release_lease(self, session_id: str, owner: str) -> None:
+        """Release a lease held by `owner`; a no-op if it expired and moved on."""
+
+    def flush(self) -> None:
+        """Block until every snapshot saved so far is durable."""
+
+    def close(self) -> None:
+        """Flush and release resources."""
+        self.flush()
+
+
+class InMemorySessionRepository(SessionRepository):
+    """Process-local repository; snapshots are still encoded so they never alias live state."""
+
+    def __init__(self) -> None:
+        self._rows: dict[str, _Row] = {}
+        self._leases: dict[str, tuple[str, float]] = {}
+        self._lease_lock = threading.Lock()
+
+    def save(self, record: SessionRecord) -> None:
+        self._rows[record.session_id] = _encode(record)
+
+    def load(self, session_id: str) -> SessionRecord | None:
+        row = self._rows.get(session_id)
+        return _decode(row) if row else None
+
+    def delete(self, session_id: str) -> None:
+        self._rows.pop(session_id, None)
+
+    def revision(self, session_id: str) -> int | None:
+        row = self._rows.get(session_id)
+        return row[6] if row else None
+
+    def acquire_lease(self, session_id: str, owner: str, ttl: float) -> bool:
+        now = time.time()
+        with self._lease_lock:
+            holder = self._leases.get(session_id)
+            if holder and holder[0] != owner and holder[1] >= now:
+                return False
+            self._leases[session_id] = (owner, now + ttl)
+            return True
+
+    def release_lease(self, session_id: str, owner: str) -> None:
+        with self._lease_lock:
+            holder = self._leases.get(session_id)
+            if holder and holder[0] == owner:
+                del self._leases[session_id]
+
+
+class SQLiteSessionRepository(SessionRepository):
+    """
+    SQLite-backed repository with write-behind group commit.
+
+    save() encodes the snapshot and queues it; a writer thread waits up to
+    `flush_interval` seconds (or until `max_batch` sessions are queued) and then
+    upserts the whole batch in one transaction. Repeated saves of a session
+    within a window collapse into the latest snapshot. `fsync` maps to SQLite's
+    `synchronous` pragma: "off" leaves flushing to the OS, "normal" syncs at WAL
+    checkpoints, "full" syncs every commit.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        fsync: FsyncPolicy = "normal",
+        flush_interval: float = 0.05,
+        max_batch: int = 64,
+    ) -> None:
+        if fsync not in ("off", "normal", "full"):
+            raise ValueError(f"Unknown fsync policy '{fsync}'")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+
+        self._pending: dict[str, _Row] = {}
+        self._failed_batches = 0
+        self._writing = False
+        self._flush_requested = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._read_lock = threading.Lock()
+
+        self._read_conn = self._connect()
+        self._read_conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._read_conn.execute("PRAGMA table_info(sessions)")}
+        if "revision" not in columns:
+            # Databases created before revisions existed.
+            self._read_conn.execute("ALTER TABLE sessions ADD COLUMN revision INTEGER NOT NULL DEFAULT 0")
+
+        self._writer = threading.Thread(target=self._run, name="session-writer", daemon=True)
+        self._writer.start()
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+    def save(self, record: SessionRecord) -> None:
+        row = _encode(record)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Session repository is closed")
+            self._pending[record.session_id] = row
+            self._cond.notify_all()
+
+    def load(self, session_id: str) -> SessionRecord | None:
+        with self._cond:
+            row = self._pending.get(session_id)
+        if row is None:
+            with self._read_lock:
+                row = self._read_conn.execute(_SELECT, (session_id,)).fetchone()
+        return _decode(row) if row else None
+
+    def delete(self, session_id: str) -> None:
+        with self._cond:
+            self._pending.pop(session_id, None)
+            # Let an in-flight batch land first so it cannot resurrect the row.
+            while self._writing:
+                self._cond.wait()
+            with self._read_lock:
+                self._read_conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    def revision(self, session_id: str) -> int | None:
+        with self._cond:
+            row = self._pending.get(session_id)
+        if row is not None:
+            return row[6]
+        with self._read_lock:
+            found = self._read_conn.execute(
+                "SELECT revision FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return found[0] if found else None
+
+    def acquire_lease(self, session_id: str, owner: str, ttl: float) -> bool:
+        now = time.time()
+        with self._read_lock:
+            cursor = self._read_conn.execute(_ACQUIRE, (session_id, owner, now + ttl, now))
+        return cursor.rowcount == 1
+
+    def release_lease(self, session_id: str, owner: str) -> None:
+        with self._read_lock:
+            self._read_conn.execute(
+                "DELETE FROM session_leases WHERE session_id = ? AND owner = ?", (session_id, owner)
+            )
+
+    def flush(self) -> None:
+        with self._cond:
+            failures = self._failed_batches
+            self._flush_requested = True
+            self._cond.notify_all()
+            while (self._pending or self._writing) and self._writer.is_alive():
+                if self._failed_batches != failures:
+                    self._flush_requested = False
+                    raise RuntimeError("Session snapshots could not be persisted")
+                self._cond.wait()
+            self._flush_requested = False
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._writer.join()
+        with self._read_lock:
+            self._read_conn.close()
+
+    # ------------------------------------------------------------------ #
+    # Writer thread
+    # ------------------------------------------------------------------ #
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.fsync.upper()}")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def _run(self) -> None:
+        conn = self._connect()
+        try:
+            while True:
+                with self._cond:
+                    while not self._pending and not self._closed:
+                        self._cond.wait()
+                    if not self._pending:
+                        return
+                    # Group-commit window: gather more sessions unless asked to hurry.
+                    deadline = time.monotonic() + self.flush_interval
+                    while (
+                        len(self._pending) < self.max_batch
+                        and not self._closed
+                        and not self._flush_requested
+                    ):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    batch, self._pending = self._pending, {}
+                    self._writing = True
+                try:
+                    self._write_batch(conn, list(batch.values()))
+                except sqlite3.Error:
+                    logger.exception("Failed to persist %d session snapshot(s)", len(batch))
+                    with self._cond:
+                        self._failed_batches += 1
+                        if not self._closed:
+                            # Requeue for the next window unless a newer snapshot arrived meanwhile.
+                            for session_id, row in batch.items():
+                                self._pending.setdefault(session_id, row)
+                    time.sleep(self.flush_interval)
+                finally:
+                    with self._cond:
+                        self._writing = False
+                        self._cond.notify_all()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _write_batch(conn: sqlite3.Connection, rows: list[_Row]) -> None:
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(_UPSERT, rows)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
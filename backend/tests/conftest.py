@@ -18,6 +18,18 @@ from app.runtime.types import PlayerAction
 from app.services.mock_ai_service import MockAIService
 
 
+@pytest.fixture(scope="session", autouse=True)
+def session_logs_dir(tmp_path_factory) -> Path:
+    """Write session logs into a temporary directory instead of ./logs."""
+    from app.core import logger as session_logging
+
+    logs_dir = tmp_path_factory.mktemp("logs")
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(session_logging, "LOGS_DIR", logs_dir)
+        yield logs_dir
+        session_logging.shutdown_session_logging()
+
+
 @pytest.fixture(scope="session")
 def games_dir() -> Path:
     """Return the path to the repo's games directory."""
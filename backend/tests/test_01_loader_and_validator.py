@@ -2,6 +2,7 @@ import re
 
 import pytest
 
+from app.core.graph import IndexedGraph
 from app.core.validator import GameValidator
 
 
@@ -35,6 +36,42 @@ def test_loader_rejects_unknown_game(fixture_loader):
 # VALIDATION & SECURITY TESTS
 # ============================================================================
 
+async def test_game_loading_runs_off_the_event_loop(fixture_loader):
+    """Verify games parse with libyaml when available and load on a worker thread."""
+    import asyncio
+    import threading
+
+    import yaml
+
+    from app.core import GameCache, loader as loader_module
+
+    assert loader_module._YAML_LOADER is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    cache = GameCache(fixture_loader)
+    load_game = fixture_loader.load_game
+    threads = []
+
+    def tracked_load(game_id):
+        threads.append(threading.get_ident())
+        return load_game(game_id)
+
+    fixture_loader.load_game = tracked_load
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(ticker())
+    game = await cache.aget("checklist_demo")
+    task.cancel()
+    assert game.meta.id == "checklist_demo"
+    assert threads and threads[0] != threading.get_ident()
+    assert ticks > 0
+
+
 def test_enforce_max_include_depth_no_nested_includes(fixture_loader):
     """Verify Nested includes beyond depth 1 are rejected."""
     with pytest.raises(ValueError, match="Nested includes"):
@@ -59,6 +96,78 @@ def test_detect_circular_references_in_node_transitions(fixture_loader):
     validator = GameValidator(game)
     validator.validate()
     assert any("circular" in warning.lower() for warning in validator.warnings)
+    assert validator.node_graph.closed_cycles == [["node_a", "node_b"]]
+
+
+def test_graph_analysis_reports_dead_ends_endings_and_exits():
+    """Verify One analysis pass reports dead ends, unreachable endings and SCC exits."""
+    edges = {
+        "start": {"loop_a", "stuck"},
+        "loop_a": {"loop_b"},
+        "loop_b": {"loop_a", "finale"},
+        "trap": {"trap"},
+        "orphan_ending": set(),
+    }
+    graph = IndexedGraph(["start", "loop_a", "loop_b", "stuck", "finale", "trap", "orphan_ending"], edges)
+    report = graph.analyze(["start"], terminals={"finale", "orphan_ending"})
+
+    assert report.dead_ends == ["stuck"]
+    assert report.unreachable == ["trap"]
+    assert report.unreachable_terminals == ["orphan_ending"]
+    loop = report.component_of[graph.index["loop_a"]]
+    assert report.component_of[graph.index["loop_b"]] == loop
+    assert report.component_exits[loop] == {"finale"}
+    assert report.closed_cycles == [["trap"]]
+
+
+def test_graph_analysis_is_iterative_on_deep_graphs():
+    """Verify A 100k-node goto chain is analysed without hitting the recursion limit."""
+    ids = [f"n{i}" for i in range(100_000)]
+    edges = {ids[i]: {ids[i + 1]} for i in range(len(ids) - 1)}
+    edges[ids[-1]] = {ids[-2]}
+    report = IndexedGraph(ids, edges).analyze([ids[0]])
+    assert len(report.components) == len(ids) - 1
+    assert report.closed_cycles == [[ids[-2], ids[-1]]]
+    assert not report.unreachable and not report.dead_ends
+
+
+def test_validation_reuses_sections_whose_files_are_unchanged(fixture_games_dir, tmp_path, monkeypatch):
+    """Verify Reloading re-runs only the validator sections fed by edited files."""
+    import shutil
+
+    from app.core.loader import GameLoader
+
+    shutil.copytree(fixture_games_dir / "checklist_demo", tmp_path / "checklist_demo")
+    loader = GameLoader(games_dir=tmp_path)
+    GameValidator.clear_cache()
+    loader.load_game("checklist_demo")
+
+    story = tmp_path / "checklist_demo" / "content" / "story.yaml"
+    story.write_text(story.read_text().replace('title: "Campus Hub"', 'title: "Campus Commons"'))
+    validators: list[GameValidator] = []
+    original_validate = GameValidator.validate
+
+    def capture(self):
+        validators.append(self)
+        return original_validate(self)
+
+    monkeypatch.setattr(GameValidator, "validate", capture)
+    game = loader.load_game("checklist_demo")
+    monkeypatch.undo()
+
+    # Only the sections reading `nodes` re-run; the rest come from the cache.
+    assert set(validators[0].cached_sections) == {
+        "start", "time", "zones", "characters", "items", "events", "actions", "modifiers", "arcs",
+        "zone_connectivity", "outfits",
+    }
+    assert validators[0].node_graph is not None
+    assert any(node.title == "Campus Commons" for node in game.nodes)
+
+    # Results from the cache match a full, uncached validation.
+    full = GameValidator(game)
+    full.validate()
+    assert full.cached_sections == []
+    assert full.warnings == validators[0].warnings
 
 
 def test_detect_circular_references_in_arc_stages(fixture_loader):
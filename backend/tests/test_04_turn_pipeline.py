@@ -33,3 +33,223 @@ async def test_state_summary_contains_required_fields(started_fixture_engine):
     assert "location" in summary
     assert "meters" in summary
     assert "inventory" in summary
+
+
+@pytest.mark.asyncio
+async def test_failed_turn_rolls_back_state(started_fixture_engine, monkeypatch):
+    """A turn that raises mid-pipeline leaves no partial state behind."""
+    engine, _ = started_fixture_engine
+    state = engine.runtime.state_manager.state
+    before = state.to_dict()
+
+    def fail(*_args, **_kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(engine.turn_manager, "_update_discoveries", fail)
+    with pytest.raises(RuntimeError):
+        await engine.process_action(PlayerAction(action_type="choice", choice_id="greet_alex"))
+
+    assert state.to_dict() == before
+    assert not engine.runtime.state_manager.journal.active
+
+
+@pytest.mark.asyncio
+async def test_rollback_undoes_only_recorded_writes(started_fixture_engine, monkeypatch):
+    """Nothing is copied when a turn begins; a turn failing at its very end still rolls back fully."""
+    engine, _ = started_fixture_engine
+    state = engine.runtime.state_manager.state
+    journal = engine.runtime.state_manager.journal
+    before = state.to_dict()
+
+    journal.begin(state)
+    assert journal.rollback() == 0
+    journal.begin(state)
+    journal.add(state.discovered_zones, "nowhere")
+    journal.discard(state.discovered_locations, state.current_location)
+    assert journal.rollback() == 2
+    assert state.to_dict() == before
+
+    record_turn = engine.memory_service.record_turn
+
+    def fail_after(*args, **kwargs):
+        record_turn(*args, **kwargs)
+        raise RuntimeError("late failure")
+
+    monkeypatch.setattr(engine.memory_service, "record_turn", fail_after)
+    with pytest.raises(RuntimeError):
+        await engine.process_action(PlayerAction(action_type="choice", choice_id="greet_alex"))
+    assert state.to_dict() == before
+
+
+@pytest.mark.asyncio
+async def test_failed_turn_can_be_retried_on_restored_state(started_fixture_engine, monkeypatch):
+    """process_action(retries=...) reruns a rolled-back turn exactly once."""
+    engine, _ = started_fixture_engine
+    state = engine.runtime.state_manager.state
+    turn_before = state.turn_count
+    original = engine.turn_manager._update_discoveries
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("transient")
+        original()
+
+    monkeypatch.setattr(engine.turn_manager, "_update_discoveries", flaky)
+    await engine.process_action(PlayerAction(action_type="do", action_text="Look around"), retries=1)
+
+    assert len(calls) == 2
+    assert state.turn_count == turn_before + 1
+    assert len(state.narrative_history) == turn_before + 1
+
+
+@pytest.mark.asyncio
+async def test_partially_applied_checker_deltas_are_rolled_back(started_fixture_engine, monkeypatch):
+    """Checker deltas apply all-or-nothing; a failing delta undoes the earlier ones."""
+    import json
+
+    engine, _ = started_fixture_engine
+    state = engine.runtime.state_manager.state
+    energy_before = state.characters["player"].meters["energy"]
+    state.characters["player"].inventory.clothing.pop("dress", None)
+    generate_stream = engine.runtime.ai_service.generate_stream
+
+    async def stream(prompt, **kwargs):
+        if not kwargs.get("json_mode"):
+            async for token in generate_stream(prompt, **kwargs):
+                yield token
+            return
+        payload = {
+            "meters": {"player": {"energy": 3}},
+            "flags": {"met_alex": True},
+            "clothing": [{"type": "put_on", "character": "player", "item": "dress"}],
+        }
+        content = json.dumps(payload)
+        for start in range(0, len(content), 7):
+            yield content[start:start + 7]
+
+    monkeypatch.setattr(engine.runtime.ai_service, "generate_stream", stream)
+    await engine.process_action(PlayerAction(action_type="do", action_text="Try on the dress"))
+
+    assert state.characters["player"].meters["energy"] == energy_before
+    assert state.flags["met_alex"] is False
+
+
+@pytest.mark.asyncio
+async def test_truncated_checker_stream_keeps_completed_sections(started_fixture_engine, monkeypatch):
+    """Checker sections apply as they close; a reply cut off mid-section keeps the earlier ones."""
+    engine, _ = started_fixture_engine
+    state = engine.runtime.state_manager.state
+    state.characters["player"].meters["energy"] = 10
+    generate_stream = engine.runtime.ai_service.generate_stream
+
+    async def stream(prompt, **kwargs):
+        if not kwargs.get("json_mode"):
+            async for token in generate_stream(prompt, **kwargs):
+                yield token
+            return
+        yield 'Here you go: {"flags": {"met_a'
+        yield 'lex": true}, "meters": {"player": {"ene'
+        raise ConnectionError("stream reset")
+
+    monkeypatch.setattr(engine.runtime.ai_service, "generate_stream", stream)
+    await engine.process_action(PlayerAction(action_type="do", action_text="Wave"))
+
+    assert state.flags["met_alex"] is True
+    assert state.characters["player"].meters["energy"] == 10
+
+
+def test_checker_deltas_are_validated_against_the_game_schema(started_fixture_engine):
+    """Checker entries naming things the game lacks are rejected one by one and counted; the rest apply."""
+    from collections import Counter
+
+    from app.runtime.services.checker_deltas import checker_metrics
+
+    engine, _ = started_fixture_engine
+    state = engine.runtime.state_manager.state
+    player = state.characters["player"]
+    energy_before = player.meters["energy"]
+    coffee_before = player.inventory.items.get("coffee", 0)
+    metrics_before = Counter(checker_metrics)
+
+    applied = engine.checker_delta_service.apply({
+        # The "<char>.<meter>": "+N" / "=N" form the checker prompt asks for
+        "meters": {"player.energy": "+5", "alex.trust": "=40", "player.charisma": "+1", "ghost.trust": 2},
+        "flags": {"met_alex": True, "route": "enemies", "hidden_clue": "yes", "no_such_flag": True},
+        "inventory": [
+            {"op": "add", "item": "coffee", "owner": "player"},
+            {"op": "add", "item": "unicorn", "owner": "player"},
+        ],
+        "discoveries": {"locations": ["library", "atlantis"]},
+    })
+
+    assert applied == 5
+    assert player.meters["energy"] == energy_before + 5
+    assert state.characters["alex"].meters["trust"] == 40
+    assert state.flags["met_alex"] is True
+    assert state.flags["route"] == "neutral" and state.flags["hidden_clue"] is False
+    assert player.inventory.items.get("coffee", 0) == coffee_before + 1
+    assert "library" in state.discovered_locations and "atlantis" not in state.discovered_locations
+
+    rejected = Counter(checker_metrics)
+    rejected.subtract(metrics_before)
+    assert rejected["deltas_applied"] == 5
+    assert rejected["deltas_rejected"] == 7
+    assert rejected["rejected.meters.unknown_meter"] == 1
+    assert rejected["rejected.meters.unknown_character"] == 1
+    assert rejected["rejected.flags.disallowed_value"] == 1
+    assert rejected["rejected.flags.bad_value"] == 1
+    assert rejected["rejected.flags.unknown_flag"] == 1
+    assert rejected["rejected.inventory.unknown_item"] == 1
+    assert rejected["rejected.discoveries.unknown_location"] == 1
+
+
+@pytest.mark.asyncio
+async def test_checker_deltas_accept_per_character_meters_and_reject_unhashable_ids(started_engine):
+    """Meters a character defines itself are accepted; ids that are not strings are rejected as malformed."""
+    from app.runtime.services.checker_deltas import checker_metrics
+
+    engine, _ = started_engine
+    characters = engine.runtime.state_manager.state.characters
+    trust_before = characters["alex_local"].meters["trust"]
+    mood_before = characters["mara_vendor"].meters["mood"]
+    energy_before = characters["player"].meters["energy"]
+    rejected_before = checker_metrics["rejected.meters.unknown_meter"]
+
+    applied = engine.checker_delta_service.apply({
+        "meters": {
+            "alex_local": {"trust": 5},
+            "mara_vendor": {"mood": -3, "trust": 2},
+            "player": {"energy": -10},
+        },
+    })
+
+    assert applied == 3
+    assert characters["alex_local"].meters["trust"] == trust_before + 5
+    assert characters["mara_vendor"].meters["mood"] == mood_before - 3
+    assert characters["player"].meters["energy"] == energy_before - 10
+    assert checker_metrics["rejected.meters.unknown_meter"] == rejected_before + 1
+
+    compiled = engine.checker_delta_service.compile({
+        "meters": {"alex_local": [{"meter": ["trust"], "value": 1}]},
+        "flags": [{"key": {"met": True}, "value": True}],
+        "inventory": [{"op": "add", "item": ["phone"], "owner": "player"}, {"op": "add", "item": "phone", "owner": ["player"]}],
+        "clothing": [{"type": "take_off", "character": ["player"], "item": "jacket"}],
+        "movement": [{"type": "move_to", "location": {"id": "x"}}, {"type": "move", "direction": "n", "with": [["alex_local"]]}],
+        "discoveries": {"locations": [["plaza"]]},
+        "modifiers": {"add": [{"modifier": ["tired"], "target": "player"}]},
+    })
+    assert not compiled.effects and not compiled.discoveries
+    assert [reason for _, reason, _ in compiled.rejected] == ["malformed"] * 9
+
+
+def test_legacy_checker_sections_count_only_without_current_changes(started_fixture_engine):
+    """The service alone decides whether legacy sections apply, also across separately applied sections."""
+    engine, _ = started_fixture_engine
+    service = engine.checker_delta_service
+    legacy = {"meter_changes": {"player": {"energy": 5}}}
+
+    assert service.compile({"flags": {"met_alex": True}, **legacy}).size == 1
+    assert service.compile(legacy, applied=1).size == 0
+    assert service.compile(legacy).size == 1
@@ -58,3 +58,130 @@ def test_state_persistence_and_snapshot_roundtrip(fixture_engine_factory):
     assert restored.current_node == state.current_node
     assert restored.flags == state.flags
     assert restored.characters["player"].meters == state.characters["player"].meters
+
+
+@pytest.mark.asyncio
+async def test_ai_scheduler_admits_writer_calls_before_checker_calls(monkeypatch):
+    """Verify queued model calls are admitted by priority through a local stub provider."""
+    import asyncio
+    import json
+
+    import httpx
+
+    from app.services import ai_service as ai_module
+    from app.services.scheduler import AIScheduler, Priority
+
+    admitted = []
+    first_call = asyncio.Event()
+    release = asyncio.Event()
+
+    async def stub_provider(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        admitted.append(body["messages"][-1]["content"])
+        first_call.set()
+        await release.wait()
+        if body.get("stream"):
+            chunk = json.dumps({"choices": [{"delta": {"content": "Rain falls."}}]})
+            return httpx.Response(200, text=f"data: {chunk}\n\ndata: [DONE]\n\n")
+        return httpx.Response(200, json={"choices": [{"message": {"content": "{}"}}]})
+
+    client = httpx.AsyncClient
+    monkeypatch.setattr(
+        ai_module.httpx, "AsyncClient",
+        lambda **kwargs: client(transport=httpx.MockTransport(stub_provider), **kwargs),
+    )
+    service = ai_module.AIService()
+    service.settings.openrouter_api_key = "test-key"
+    service.scheduler = AIScheduler(max_concurrency=1)
+
+    async def stream_writer():
+        return "".join([token async for token in service.generate_stream("writer")])
+
+    summary = asyncio.create_task(service.generate("summary", priority=Priority.SUMMARY))
+    await first_call.wait()
+    checker = asyncio.create_task(service.generate("checker", json_mode=True))
+    writer = asyncio.create_task(stream_writer())
+    while service.scheduler.metrics()["waiting"] < 2:
+        await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(summary, checker, writer)
+
+    assert admitted == ["summary", "writer", "checker"]
+    assert writer.result() == "Rain falls."
+    metrics = service.scheduler.metrics()
+    assert metrics["active"] == 0 and metrics["waiting"] == 0
+    assert metrics["priorities"]["checker"]["calls"] == 1
+    assert metrics["priorities"]["checker"]["queued_ms_max"] >= metrics["priorities"]["writer"]["queued_ms_max"]
+
+
+@pytest.mark.asyncio
+async def test_ai_scheduler_enforces_model_concurrency_and_token_budget():
+    """Verify per-model slots let other models through and the token budget delays calls."""
+    import asyncio
+    import time
+
+    from app.services.scheduler import AIScheduler
+
+    scheduler = AIScheduler(max_concurrency=4, model_concurrency={"slow": 1})
+    release = asyncio.Event()
+    admitted = []
+
+    async def call(model):
+        async with scheduler.slot(model):
+            admitted.append(model)
+            await release.wait()
+
+    calls = [asyncio.create_task(call(model)) for model in ("slow", "slow", "fast")]
+    while len(admitted) < 2:
+        await asyncio.sleep(0)
+    assert admitted == ["slow", "fast"]
+    assert scheduler.metrics()["waiting"] == 1
+    release.set()
+    await asyncio.gather(*calls)
+    assert admitted == ["slow", "fast", "slow"]
+
+    # 6000 tokens a minute refills 100 tokens a second.
+    budgeted = AIScheduler(tokens_per_minute=6000)
+    async with budgeted.slot("model", tokens=6000):
+        pass
+    started = time.monotonic()
+    async with budgeted.slot("model", tokens=10):
+        waited = time.monotonic() - started
+    assert waited >= 0.05
+
+
+def test_json_object_stream_yields_members_as_they_close():
+    """Checker replies are parsed incrementally and tolerate prose, bad members and truncation."""
+    from app.core.json_stream import JSONObjectStream
+
+    reply = (
+        'Sure, here are the deltas:\n```json\n'
+        '{"meters": {"player": {"energy": 3}}, "flags": {"met_alex": tru}, '
+        '"memory": ["a, {quoted} \\"brace\\" }"], "safety": {"ok": true}}\n```'
+    )
+    parser = JSONObjectStream()
+    seen = []
+    for start in range(0, len(reply), 5):
+        seen.extend(parser.feed(reply[start:start + 5]))
+    assert parser.done and parser.finish() == []
+    assert seen == [
+        ("meters", {"player": {"energy": 3}}),
+        ("memory", ['a, {quoted} "brace" }']),
+        ("safety", {"ok": True}),
+    ]
+
+    truncated = JSONObjectStream()
+    assert truncated.feed('{"flags": {"met_alex": true}, "meters": {"player"') == [("flags", {"met_alex": True})]
+    assert truncated.finish() == []
+
+    unterminated = JSONObjectStream()
+    assert unterminated.feed('{"flags": {"met_alex": true}') == []
+    assert unterminated.finish() == [("flags", {"met_alex": True})]
+
+    cut_number = JSONObjectStream()
+    assert cut_number.feed('{"flags": {"met_alex": true}, "gold": 12') == [("flags", {"met_alex": True})]
+    assert cut_number.finish() == []
+
+    cut_literal = JSONObjectStream()
+    assert cut_literal.feed('{"flags": {"met_alex": true}, "rival": null ') == [("flags", {"met_alex": True})]
+    assert cut_literal.finish() == [("rival", None)]
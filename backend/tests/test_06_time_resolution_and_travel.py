@@ -138,6 +138,45 @@ async def test_zone_travel_passive_method_ignores_modifiers(fixture_engine_facto
     assert mover._calculate_travel_minutes("loc_c", "bus") is None
 
 
+@pytest.mark.asyncio
+async def test_zone_travel_plans_cheapest_multi_hop_route(fixture_engine_factory):
+    """Verify travel routes across several zones per method, avoiding blocked waypoints."""
+    from app.core.routes import TravelPlanner
+    from app.models.game import GameIndex
+    from app.models.locations import Zone
+
+    engine = fixture_engine_factory(game_id="time_cases")
+    game = engine.runtime.game
+    zone_a, zone_b = (zone.model_dump() for zone in game.zones[:2])
+    zone_a["connections"].append({"to": ["zone_d"], "methods": ["walk"], "distance": 0.5})
+    zone_b["connections"] = [{"to": ["zone_c"], "distance": 1.0}]
+    game.zones = [Zone.model_validate(zone) for zone in (
+        zone_a,
+        zone_b,
+        {"id": "zone_c", "name": "Zone C", "locations": [{"id": "loc_d", "name": "Loc D"}]},
+        {
+            "id": "zone_d", "name": "Zone D", "locations": [],
+            "connections": [{"to": ["zone_c"], "methods": ["walk"], "distance": 0.5}],
+        },
+    )]
+    game._index = GameIndex.from_game(game)
+    planner = TravelPlanner(game)
+
+    walk = planner.route("zone_a", "zone_c", "walk")
+    assert walk.zones == ("zone_a", "zone_d", "zone_c")
+    assert walk.minutes == 5
+    run = planner.route("zone_a", "zone_c", "run")
+    assert run.zones == ("zone_a", "zone_b", "zone_c")
+    assert run.minutes == 70
+    assert planner.route("zone_c", "zone_a", "walk") is None
+
+    detour = planner.route("zone_a", "zone_c", "walk", blocked=lambda zone_id: zone_id == "zone_d")
+    assert detour.zones == ("zone_a", "zone_b", "zone_c")
+    assert detour.minutes == 18
+    # The cached unblocked route is untouched by the detour.
+    assert planner.route("zone_a", "zone_c", "walk") is walk
+
+
 # ============================================================================
 # DAY/SLOT ROLLOVER EFFECTS
 # ============================================================================
@@ -186,6 +225,42 @@ async def test_day_rollover_complete_sequence(fixture_engine_factory):
     assert state.time.time_hhmm == "00:40"
 
 
+@pytest.mark.asyncio
+async def test_multi_day_advance_batches_day_and_slot_decay(fixture_engine_factory):
+    """Verify a span of several days advances the day per midnight and decays per day and slot crossed."""
+    engine = fixture_engine_factory(game_id="time_cases")
+    state = engine.runtime.state_manager.state
+    assert (state.time.time_hhmm, state.time.slot) == ("08:00", "morning")
+
+    info = engine.time_service.advance_minutes(3 * 24 * 60 + 5 * 60)
+    assert state.time.day == 4
+    assert (state.time.time_hhmm, state.time.slot) == ("13:00", "afternoon")
+    # Each day crosses 12:00 (afternoon) and 06:00 (morning), plus today's 12:00
+    assert (info["days"], info["slots"]) == (3, 7)
+    assert state.characters["player"].meters["energy"] == 50 - 3 * 5 - 7 * 1
+
+    table = engine.runtime.index.slot_table
+    assert table.slot_at(11 * 60 + 59) == "morning"
+    assert table.slot_at(20 * 60) is None  # outside every window: the previous slot is kept
+    assert table.changes_per_day == 2
+
+
+@pytest.mark.asyncio
+async def test_multi_day_advance_decays_each_day_before_the_next_day_starts(fixture_engine_factory, monkeypatch):
+    """Verify day-start effects see the decay of the days before them, as with one day at a time."""
+    engine = fixture_engine_factory(game_id="time_cases")
+    meters = engine.runtime.state_manager.state.characters["player"].meters
+    seen = []
+    monkeypatch.setattr(engine.time_service, "_trigger_day_start_effects", lambda: seen.append(meters["energy"]))
+
+    info = engine.time_service.advance_minutes(3 * 24 * 60 + 5 * 60, apply_decay=False)
+    # Day 1 crosses 12:00; days 2 and 3 cross 06:00 and 12:00 (5 energy a day, 1 a slot)
+    assert seen == [50, 50 - 5 - 1, 50 - 10 - 3]
+    assert (info["decay_days"], info["decay_slots"]) == (1, 4)
+    engine.time_service.apply_meter_dynamics(day_advanced=True, slot_advanced=True, days=1, slots=4)
+    assert meters["energy"] == 50 - 3 * 5 - 7 * 1
+
+
 # ============================================================================
 # TIME ROUNDING
 # ============================================================================
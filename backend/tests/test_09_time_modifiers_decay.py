@@ -19,6 +19,26 @@ async def test_meter_decay_over_slots_and_days(fixture_engine_factory):
     assert state.day == 2
 
 
+@pytest.mark.asyncio
+async def test_bulk_meter_decay_respects_modifier_clamps(fixture_engine_factory):
+    """Verify batched decay is clamped by active modifier clamps and meter bounds."""
+    from app.models.modifiers import Modifier
+
+    engine = fixture_engine_factory(game_id="time_cases")
+    state = engine.runtime.state_manager.state
+    engine.modifier_service.library["energy_floor"] = Modifier.model_validate(
+        {"id": "energy_floor", "clamp_meters": {"energy": {"min": 45, "max": 100}}}
+    )
+    state.modifiers["player"] = [{"id": "energy_floor"}]
+
+    engine.time_service.advance_minutes(2 * 24 * 60)  # -10 per two days, -4 for four slots
+    assert state.characters["player"].meters["energy"] == 45
+
+    state.modifiers["player"] = []
+    engine.time_service.advance_minutes(20 * 24 * 60)
+    assert state.characters["player"].meters["energy"] == 0
+
+
 def test_time_multiplier_stacking_and_clamp(fixture_engine_factory):
     """Verify time multiplier stacking clamps to [0.5, 2.0]."""
     engine = fixture_engine_factory(game_id="time_cases", session_id="stack")
@@ -324,3 +324,53 @@ async def test_auto_activation_coexists_with_manual_application(started_mod_engi
 
     await engine.process_action(PlayerAction(action_type="choice", choice_id="wait_long"))
     assert "manual_boost" not in active_mod_ids(state)
+
+
+# ============================================================================
+# COMPILED CONDITION TEMPLATES
+# ============================================================================
+
+
+def test_condition_template_binds_character_without_substitution(fixture_engine_factory):
+    """Templates bind {character} at eval time and match text-substituted results."""
+    from app.core.conditions import ConditionTemplate
+
+    engine = fixture_engine_factory(game_id="modifier_auto", session_id="template-bind")
+    state = engine.runtime.state_manager.state
+    evaluator = engine.runtime.state_manager.create_evaluator()
+    template = ConditionTemplate.compile("meters.{character}.trust >= 50")
+
+    assert template.meter_refs == (("__character__", "trust"),)
+    for char_id in state.characters:
+        expected = evaluator.evaluate(f"meters.{char_id}.trust >= 50")
+        assert evaluator.evaluate_template(template, character=char_id) is expected
+
+    night = ConditionTemplate.compile('time.slot == "night" and "{character}" == "player"')
+    assert night.meter_refs is None
+    assert not night.textual
+
+
+@pytest.mark.asyncio
+async def test_meter_only_conditions_are_cached_until_meters_change(started_mod_engine, monkeypatch):
+    """Meter-only templates reuse cached results while the relevant meters hold still."""
+    from app.core.conditions import ConditionEvaluator
+
+    engine, _ = started_mod_engine
+    service = engine.modifier_service
+    state = engine.runtime.state_manager.state
+    calls: list[str | None] = []
+    original = ConditionEvaluator.evaluate_template
+
+    def counting(self, template, *, character=None):
+        if template is service.templates["trust_guard"]:
+            calls.append(character)
+        return original(self, template, character=character)
+
+    monkeypatch.setattr(ConditionEvaluator, "evaluate_template", counting)
+    service.update_modifiers_for_turn(state)
+    assert calls == []
+
+    state.characters["jamie"].meters["trust"] = 10
+    service.update_modifiers_for_turn(state)
+    assert calls == ["jamie"]
+    assert "trust_guard" not in active_mod_ids(state, "jamie")
@@ -403,3 +403,32 @@ async def test_event_effects_influence_game_state(started_event_engine):
     result = await engine.process_action(PlayerAction(action_type="do", action_text="night event"))
     assert state.flags["scheduled_fired"] is True
     assert result.narrative
+
+
+@pytest.mark.asyncio
+async def test_event_history_membership_survives_rollback(fixture_engine_factory):
+    """Verify indexed history lists keep O(1) membership in sync through journal rollback."""
+    from app.models import IndexedList
+
+    engine = fixture_engine_factory(game_id="event_cases")
+    manager = engine.runtime.state_manager
+    state = manager.state
+    assert isinstance(state.events_history, IndexedList)
+
+    state.unlocked_actions.extend(["kept", "locked"])
+    manager.journal.begin(state)
+    manager.journal.append(state.events_history, "evt_once")
+    manager.journal.append(state.unlocked_actions, "secret")
+    manager.journal.remove(state.unlocked_actions, "kept")
+    assert "evt_once" in state.events_history and "secret" in state.unlocked_actions
+    assert "kept" not in state.unlocked_actions
+    manager.journal.rollback()
+    assert "evt_once" not in state.events_history
+    assert "secret" not in state.unlocked_actions
+    assert state.unlocked_actions == ["kept", "locked"] and "kept" in state.unlocked_actions
+
+    history = IndexedList(["a", "b", "a"])
+    history.remove("a")
+    assert "a" in history and history.count("a") == 1
+    history[1:] = ["c"]
+    assert history == ["b", "c"] and "a" not in history
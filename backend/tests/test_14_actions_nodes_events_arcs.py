@@ -42,3 +42,61 @@ async def test_events_register_and_can_trigger(started_fixture_engine):
     # Event firing is stochastic; assert that engine tracks event ids when fired
     state = engine.runtime.state_manager.state
     _ = getattr(state, "last_event_id", None)
+
+
+@pytest.mark.asyncio
+async def test_scripted_choices_resolve_without_ai(fixture_engine_factory, mock_ai_service, monkeypatch):
+    """Verify scripted choices skip the Writer and Checker and render their beats against state."""
+    from app.core.validator import GameValidator
+
+    engine = fixture_engine_factory(session_id="scripted")
+    await engine.start()
+    intro = engine.runtime.index.nodes["intro"]
+    greet = next(choice for choice in intro.choices if choice.id == "greet_alex")
+    greet.scripted = True
+    greet.beats = ["Alex waves back. Trust: {meters.alex.trust}.", "Broken: {meters.alex.trust +}"]
+
+    async def no_ai(*args, **kwargs):
+        raise AssertionError("scripted turns must not call the AI service")
+
+    monkeypatch.setattr(mock_ai_service, "generate", no_ai)
+    monkeypatch.setattr(mock_ai_service, "generate_stream", no_ai)
+    ai_turns = engine.runtime.state_manager.state.ai_turns_since_summary
+
+    result = await engine.process_action(PlayerAction(action_type="choice", choice_id="greet_alex"))
+
+    trust = engine.runtime.state_manager.state.characters["alex"].meters["trust"]
+    assert f"Alex waves back. Trust: {trust:g}." in result.narrative
+    assert "Broken: {meters.alex.trust +}" in result.narrative
+    assert engine.runtime.state_manager.state.current_node == "campus_hub"
+    assert engine.runtime.state_manager.state.ai_turns_since_summary == ai_turns
+
+    # A scripted node without choice beats narrates the node the turn arrives at.
+    greet.beats = []
+    intro.scripted, greet.scripted = True, None
+    engine.runtime.state_manager.state.current_node = "intro"
+    result = await engine.process_action(PlayerAction(action_type="choice", choice_id="greet_alex"))
+    hub = engine.runtime.index.nodes["campus_hub"]
+    assert hub.beats and all(beat in result.narrative for beat in hub.beats)
+
+    greet.beats = ["{meters.alex.trust +}"]
+    validator = GameValidator(engine.runtime.game)
+    validator._validate_choices(intro.choices, "Node: intro")
+    assert any("{meters.alex.trust +}" in error for error in validator.errors)
+
+    # The hub is not scripted, but greet_alex would narrate its beats.
+    greet.beats = []
+    intro.scripted, greet.scripted = False, True
+    hub.beats = [*hub.beats, "{meters.alex.trust +}"]
+    validator = GameValidator(engine.runtime.game)
+    validator._validate_nodes()
+    assert any("Node: campus_hub" in error and "{meters.alex.trust +}" in error for error in validator.errors)
+
+    # Writer bullets no scripted turn renders may hold any braces; they only warn.
+    hub.beats.pop()
+    ending = engine.runtime.index.nodes["ending_exit"]
+    ending.beats = [*ending.beats, "Mention {Alex's mood}"]
+    validator = GameValidator(engine.runtime.game)
+    validator._validate_nodes()
+    assert not validator.errors
+    assert any("Node: ending_exit" in warning and "{Alex's mood}" in warning for warning in validator.warnings)
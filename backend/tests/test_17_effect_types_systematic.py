@@ -606,3 +606,45 @@ async def test_effect_execution_order(started_fixture_engine):
     ]
     engine.runtime.effect_resolver.apply_effects(effects)
     assert state.flags["route"] == "ordered"
+
+
+async def test_definition_effect_lists_are_compiled_once_per_game(started_fixture_engine):
+    """Definition effect lists compile to cached programs shared by the resolver."""
+    engine, _ = started_fixture_engine
+    resolver = engine.runtime.effect_resolver
+    node = next(n for n in engine.runtime.index.nodes.values() if n.on_enter)
+
+    program = resolver.compile(node.on_enter)
+    assert resolver.compile(node.on_enter) is program
+    assert all(not isinstance(op.effect, dict) for op in program.ops)
+
+
+async def test_conditional_lowering_runs_one_branch_and_counts_effects(started_fixture_engine):
+    """Conditionals compile to branch/jump ops; only the taken branch executes."""
+    engine, _ = started_fixture_engine
+    resolver = engine.runtime.effect_resolver
+    state = engine.runtime.state_manager.state
+    resolver.stats.clear()
+
+    effects = [
+        ConditionalEffect(
+            when="flags.met_alex == true",
+            then=[FlagSetEffect(key="route", value="then")],
+            otherwise=[
+                FlagSetEffect(key="route", value="otherwise"),
+                ConditionalEffect(
+                    when='flags.route == "otherwise"',
+                    then=[FlagSetEffect(key="met_alex", value=True)],
+                ),
+            ],
+        ),
+    ]
+    state.flags["met_alex"] = False
+    program = resolver.compile(effects)
+    assert [op.kind for op in program.ops] == ["branch", "exec", "jump", "exec", "branch", "exec"]
+
+    resolver.run(program)
+    assert state.flags["route"] == "otherwise"
+    assert state.flags["met_alex"] is True
+    assert resolver.stats["conditional"] == 2
+    assert resolver.stats["flag_set"] == 2
@@ -1,8 +1,22 @@
+import asyncio
+
 import pytest
+from starlette.requests import Request
 
 from app.runtime.types import PlayerAction
 
 
+def _connected_request(disconnected: asyncio.Event | None = None) -> Request:
+    """An HTTP request whose client stays connected until `disconnected` is set."""
+    disconnected = disconnected or asyncio.Event()
+
+    async def receive():
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    return Request({"type": "http", "method": "POST", "headers": []}, receive)
+
+
 def test_invalid_action_type_rejected(fixture_engine_factory):
     """
     Spec coverage: API 400 for bad action_type, error payload structure.
@@ -31,3 +45,332 @@ async def test_action_on_ending_node_rejected(started_fixture_engine):
     engine.runtime.state_manager.state.current_node = "ending_exit"
     with pytest.raises(ValueError):
         await engine.process_action(PlayerAction(action_type="do", action_text="Trigger ending"))
+
+
+def test_session_logs_are_written_behind_and_rotated(tmp_path, monkeypatch):
+    """
+    Session loggers enqueue records; the background writer samples DEBUG,
+    rotates segments past the size limit and detaches closed sessions.
+    """
+    import logging
+    from app.core import logger as session_logging
+
+    session_logging.shutdown_session_logging()
+    monkeypatch.setattr(session_logging, "LOGS_DIR", tmp_path)
+    monkeypatch.setenv("SESSION_LOG_MAX_BYTES", "400")
+    monkeypatch.setenv("SESSION_LOG_BACKUPS", "1")
+
+    log = session_logging.setup_session_logger("rotating", debug_sample_rate=0.5)
+    for i in range(4):
+        log.debug("debug %d", i)
+    for i in range(8):
+        log.info("info %d", i)
+    session_logging.shutdown_session_logging()
+
+    current = session_logging.session_log_path("rotating")
+    segments = current.with_name(current.name + ".1").read_text() + current.read_text()
+    assert "debug 0" in segments and "debug 2" in segments
+    assert "debug 1" not in segments and "debug 3" not in segments
+    assert all(f"info {i}" in segments for i in range(8))
+    assert current.stat().st_size <= 400
+
+    session_logging.close_session_logger("rotating")
+    assert "rotating" not in session_logging._session_loggers
+    assert "rotating" not in logging.Logger.manager.loggerDict
+    session_logging.shutdown_session_logging()
+
+
+def test_session_logs_survive_eviction_and_start_fresh_only_for_new_sessions(tmp_path, monkeypatch):
+    """
+    A closed session's logger picks up its log where it left off; only
+    start_session_log (a newly created session) truncates it.
+    """
+    from app.core import logger as session_logging
+
+    session_logging.shutdown_session_logging()
+    monkeypatch.setattr(session_logging, "LOGS_DIR", tmp_path)
+    path = session_logging.session_log_path("evicted")
+    path.write_text("written by another worker\n")
+
+    session_logging.setup_session_logger("evicted").info("before eviction")
+    session_logging.close_session_logger("evicted")
+    session_logging.setup_session_logger("evicted").info("after rehydration")
+    session_logging.shutdown_session_logging()
+    log = path.read_text()
+    assert log.startswith("written by another worker")
+    assert "before eviction" in log and "after rehydration" in log
+
+    session_logging.start_session_log("evicted")
+    session_logging.setup_session_logger("evicted").info("new session")
+    session_logging.shutdown_session_logging()
+    assert "before eviction" not in path.read_text() and "new session" in path.read_text()
+    session_logging.close_session_logger("evicted")
+
+
+@pytest.mark.asyncio
+async def test_idle_sessions_are_evicted_past_the_live_limit(fixture_engine_factory, monkeypatch):
+    """
+    Spec coverage: only MAX_LIVE_SESSIONS engines stay in memory; idle ones are closed.
+    """
+    from app.api import game as game_api
+    from app.storage import InMemorySessionRepository
+
+    monkeypatch.setenv("MAX_LIVE_SESSIONS", "1")
+    monkeypatch.setattr(game_api, "game_sessions", {})
+    older = fixture_engine_factory(session_id="evict_old")
+    newer = fixture_engine_factory(session_id="evict_new")
+    repository = InMemorySessionRepository()
+    older.repository = newer.repository = repository
+    await older.start()
+    await newer.start()
+    closed = []
+    monkeypatch.setattr(older, "close", lambda: closed.append(older.session_id))
+
+    game_api._remember_engine(older.session_id, older)
+    game_api._remember_engine(newer.session_id, newer)
+    assert list(game_api.game_sessions) == ["evict_new"]
+    assert closed == ["evict_old"]
+
+
+@pytest.mark.asyncio
+async def test_start_stream_forwards_opening_narrative_tokens(fixture_loader, mock_ai_service, monkeypatch):
+    """
+    Spec coverage: /start/stream sends state and choices first, then streams the
+    opening scene's writer tokens before the checker runs.
+    """
+    import json
+
+    from app.api import game as game_api
+    from app.core import GameCache
+    from app.storage import InMemorySessionRepository
+
+    monkeypatch.setattr(game_api, "game_cache", GameCache(fixture_loader))
+    monkeypatch.setattr(game_api, "AIService", lambda: mock_ai_service)
+    monkeypatch.setattr(game_api, "_session_repository", InMemorySessionRepository())
+    monkeypatch.setattr(game_api, "game_sessions", {})
+    # Send every token as soon as it arrives (no coalescing window)
+    monkeypatch.setenv("STREAM_FLUSH_INTERVAL_MS", "0")
+
+    events = []
+    checker_saw = []
+    generate_stream = mock_ai_service.generate_stream
+
+    async def tracked_stream(*args, **kwargs):
+        if kwargs.get("json_mode"):
+            checker_saw.append([event["type"] for event in events])
+        async for token in generate_stream(*args, **kwargs):
+            yield token
+
+    monkeypatch.setattr(mock_ai_service, "generate_stream", tracked_stream)
+
+    response = await game_api.start_game_stream(
+        game_api.StartGameRequest(game_id="checklist_demo"), _connected_request()
+    )
+    async for line in response.body_iterator:
+        payload = line[len("data: "):].strip()
+        if payload != "[DONE]":
+            events.append(json.loads(payload))
+
+    types = [event["type"] for event in events]
+    assert types[:3] == ["session_created", "initial_state", "action_summary"]
+    assert types[-1] == "complete" and types.count("action_summary") == 1
+    assert "narrative_chunk" in types
+    assert checker_saw and "narrative_chunk" in checker_saw[0]
+    assert events[-1]["narrative"]
+
+
+@pytest.mark.asyncio
+async def test_sse_stream_coalesces_tokens_and_sends_keepalives():
+    """
+    Spec coverage: narrative tokens are batched into frames on a size/time
+    budget, other events flush the batch, and idle streams get keep-alives.
+    """
+    import asyncio
+    import json
+
+    from app.api.streaming import KEEPALIVE_FRAME, sse_frame, sse_stream
+
+    async def events():
+        yield {"type": "action_summary", "content": "You wait."}
+        for token in ["a", "b", "c", "d", "e"]:
+            yield {"type": "narrative_chunk", "content": token}
+        await asyncio.sleep(0.1)
+        yield {"type": "narrative_chunk", "content": "é"}
+        await asyncio.sleep(0.1)
+        yield {"type": "complete", "narrative": "abcdeé"}
+        yield "data: [DONE]\n\n"
+
+    frames = [frame async for frame in sse_stream(events(), flush_interval=0.01, flush_bytes=3, keepalive=0.03)]
+
+    decoded = [json.loads(frame[len("data: "):]) for frame in frames if frame.startswith("data: {")]
+    chunks = [event["content"] for event in decoded if event["type"] == "narrative_chunk"]
+    assert chunks == ["abc", "de", "é"]
+    assert decoded[0]["type"] == "action_summary" and decoded[-1]["type"] == "complete"
+    assert KEEPALIVE_FRAME in frames
+    assert frames[-1] == "data: [DONE]\n\n"
+    chunk = {"type": "narrative_chunk", "content": 'say "hi"\n'}
+    assert sse_frame(chunk) == f"data: {json.dumps(chunk)}\n\n"
+
+
+@pytest.mark.asyncio
+async def test_client_disconnect_cancels_turn_and_rolls_back(fixture_engine_factory, mock_ai_service, monkeypatch):
+    """
+    Spec coverage: closing the stream mid-turn closes the writer stream, skips
+    the checker, rolls the turn back and counts the cancellation.
+    """
+    import json
+
+    from app.api import game as game_api
+    from app.runtime.turn_manager import turn_metrics
+    from app.storage import InMemorySessionRepository
+
+    monkeypatch.setattr(game_api, "_session_repository", InMemorySessionRepository())
+    monkeypatch.setattr(game_api, "game_sessions", {})
+    monkeypatch.setenv("STREAM_FLUSH_INTERVAL_MS", "0")
+    engine = fixture_engine_factory(session_id="disconnecting")
+    await engine.start()
+    game_api.game_sessions[engine.session_id] = engine
+    before = engine.runtime.state_manager.state.to_dict()
+
+    writer_closed = asyncio.Event()
+    checker_calls = []
+
+    async def endless_stream(*args, **kwargs):
+        if kwargs.get("json_mode"):
+            checker_calls.append(args)
+            yield "{}"
+            return
+        try:
+            yield "The rain "
+            await asyncio.Event().wait()
+        finally:
+            writer_closed.set()
+
+    monkeypatch.setattr(mock_ai_service, "generate_stream", endless_stream)
+    cancelled = turn_metrics["turns_cancelled"]
+    writers_cancelled = turn_metrics["writer_streams_cancelled"]
+
+    disconnected = asyncio.Event()
+    response = await game_api.process_action_stream(
+        engine.session_id,
+        game_api.GameAction(action_type="do", action_text="Wait"),
+        _connected_request(disconnected),
+    )
+    frames = []
+    async for frame in response.body_iterator:
+        frames.append(frame)
+        if frame.startswith("data: ") and json.loads(frame[len("data: "):])["type"] == "narrative_chunk":
+            disconnected.set()
+
+    assert writer_closed.is_set()
+    assert not checker_calls
+    assert not any('"complete"' in frame for frame in frames)
+    assert engine.runtime.state_manager.state.to_dict() == before
+    assert not engine._turn_active
+    assert turn_metrics["turns_cancelled"] == cancelled + 1
+    assert turn_metrics["writer_streams_cancelled"] == writers_cancelled + 1
+    # The lease was released, so the session keeps playing.
+    async with game_api.session_lease(engine.session_id):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_stream_closed_before_its_body_starts_releases_the_session(fixture_engine_factory, monkeypatch):
+    """
+    Spec coverage: a client gone before the stream body is iterated still hands
+    back the session's lease and turn, and no turn is played.
+    """
+    from starlette.requests import ClientDisconnect
+
+    from app.api import game as game_api
+    from app.storage import InMemorySessionRepository
+
+    monkeypatch.setattr(game_api, "_session_repository", InMemorySessionRepository())
+    monkeypatch.setattr(game_api, "game_sessions", {})
+    monkeypatch.setenv("SESSION_LEASE_WAIT_S", "0.2")
+    engine = fixture_engine_factory(session_id="gone-early")
+    await engine.start()
+    game_api.game_sessions[engine.session_id] = engine
+    turns_before = engine.runtime.state_manager.state.turn_count
+
+    response = await game_api.process_action_stream(
+        engine.session_id,
+        game_api.GameAction(action_type="do", action_text="Wait"),
+        _connected_request(),
+        idempotency_key="click-1",
+    )
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        raise OSError("connection reset")
+
+    with pytest.raises(ClientDisconnect):
+        await response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send)
+
+    assert engine.runtime.state_manager.state.turn_count == turns_before
+    assert game_api._turn_queues == {}
+    async with game_api.session_lease(engine.session_id):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_concurrent_actions_are_serialized_coalesced_and_bounded(
+    fixture_engine_factory, mock_ai_service, monkeypatch
+):
+    """
+    Spec coverage: turns for one session run one at a time, duplicates of an
+    in-flight request (same Idempotency-Key) share its result, and requests
+    past the per-session queue are refused with 429.
+    """
+    from fastapi import HTTPException
+
+    from app.api import game as game_api
+    from app.storage import InMemorySessionRepository
+
+    monkeypatch.setattr(game_api, "_session_repository", InMemorySessionRepository())
+    monkeypatch.setattr(game_api, "game_sessions", {})
+    monkeypatch.setenv("SESSION_TURN_QUEUE", "1")
+    engine = fixture_engine_factory(session_id="busy")
+    await engine.start()
+    game_api.game_sessions[engine.session_id] = engine
+    turns_before = engine.runtime.state_manager.state.turn_count
+
+    release = asyncio.Event()
+    writing = []
+    overlapped = []
+    stream = mock_ai_service.generate_stream
+
+    async def slow_stream(*args, **kwargs):
+        if kwargs.get("json_mode"):
+            async for token in stream(*args, **kwargs):
+                yield token
+            return
+        overlapped.append(bool(writing))
+        writing.append(True)
+        await release.wait()
+        async for token in stream(*args, **kwargs):
+            yield token
+        writing.pop()
+
+    monkeypatch.setattr(mock_ai_service, "generate_stream", slow_stream)
+    wait = game_api.GameAction(action_type="do", action_text="Wait")
+
+    first = asyncio.create_task(game_api.process_action("busy", wait, idempotency_key="click-1"))
+    duplicate = asyncio.create_task(game_api.process_action("busy", wait, idempotency_key="click-1"))
+    queued = asyncio.create_task(game_api.process_action("busy", wait, idempotency_key="click-2"))
+    while not writing:
+        await asyncio.sleep(0)
+
+    with pytest.raises(HTTPException) as refused:
+        await game_api.process_action("busy", wait, idempotency_key="click-3")
+    assert refused.value.status_code == 429
+
+    release.set()
+    first_result, duplicate_result, queued_result = await asyncio.gather(first, duplicate, queued)
+    assert duplicate_result is first_result
+    assert queued_result is not first_result
+    assert overlapped == [False, False]
+    assert engine.runtime.state_manager.state.turn_count == turns_before + 2
+    assert game_api._turn_queues == {}
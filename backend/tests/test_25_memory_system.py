@@ -5,8 +5,9 @@ Verifies that:
 - Character memories are stored per-character in CharacterState
 - Narrative summary is updated every N AI turns
 - Writer receives summary + recent narratives
-- Checker receives conditional summary request
+- Narrative summary is written in the background, off the turn path
 - Memory system keeps tokens bounded
+- Older scenes and memories are folded into a store and retrieved by relevance
 """
 
 import pytest
@@ -106,13 +107,13 @@ async def test_checker_prompt_requests_character_memories(fixture_engine_factory
 
 
 @pytest.mark.asyncio
-async def test_checker_prompt_conditionally_requests_summary(fixture_engine_factory):
+async def test_summary_is_requested_by_its_own_prompt_not_the_checker(fixture_engine_factory):
     """
-    Verify that Checker prompt requests narrative_summary every N turns.
+    Verify that the narrative summary is no longer piggybacked on the Checker.
 
     Should test:
-    - Summary NOT requested when ai_turns_since_summary < N
-    - Summary requested when ai_turns_since_summary >= N
+    - Checker prompt never asks for narrative_summary, even when one is due
+    - Summary prompt folds the previous summary and the latest narratives together
     """
     from app.core.settings import GameSettings
 
@@ -124,15 +125,57 @@ async def test_checker_prompt_conditionally_requests_summary(fixture_engine_fact
     state = engine.runtime.state_manager.state
     ctx = engine.runtime.current_context
 
-    # At start, counter = 0, should not request summary
-    state.ai_turns_since_summary = 0
-    checker_prompt = prompt_builder.build_checker_prompt(ctx, "Say hello", "You wave.")
-    assert "narrative_summary" not in checker_prompt
+    for count in (0, settings.memory_summary_interval):
+        state.ai_turns_since_summary = count
+        checker_prompt = prompt_builder.build_checker_prompt(ctx, "Say hello", "You wave.")
+        assert "narrative_summary" not in checker_prompt
 
-    # At N turns, should request summary
-    state.ai_turns_since_summary = settings.memory_summary_interval
-    checker_prompt = prompt_builder.build_checker_prompt(ctx, "Say hello", "You wave.")
-    assert "narrative_summary" in checker_prompt
+    state.narrative_summary = "You arrived on campus."
+    state.narrative_history.extend(["Old scene.", "Alex waves back.", "You buy a coffee."])
+    summary_prompt = prompt_builder.build_summary_prompt(2)
+    assert "You arrived on campus." in summary_prompt
+    assert "Alex waves back." in summary_prompt and "You buy a coffee." in summary_prompt
+    assert "Old scene." not in summary_prompt
+
+
+@pytest.mark.asyncio
+async def test_summary_covers_every_narrative_since_the_last_one(fixture_engine_factory, monkeypatch):
+    """
+    Verify turns without AI do not push AI scenes out of the summary window.
+
+    Should test:
+    - Every turn's narrative counts towards narratives_since_summary; only AI turns towards ai_turns_since_summary
+    - The queued summary prompt covers all narratives since the last summary
+    - Swapping it in subtracts what it covered from both counters
+    """
+    from types import SimpleNamespace
+
+    from app.runtime import engine as engine_module
+
+    jobs = []
+    monkeypatch.setattr(engine_module, "get_summary_queue", lambda: SimpleNamespace(submit=jobs.append))
+    monkeypatch.setenv("MEMORY_SUMMARY_INTERVAL", "2")
+    engine = fixture_engine_factory("checklist_demo")
+    await engine.start()
+    state = engine.runtime.state_manager.state
+    state.narrative_history = ["Already summarized."]
+    state.ai_turns_since_summary = state.narratives_since_summary = 0
+
+    await engine.process_action(PlayerAction(action_type="do", action_text="Wave at Alex"))
+    await engine.process_action(PlayerAction(action_type="do", action_text="Wait", skip_ai=True))
+    await engine.process_action(PlayerAction(action_type="do", action_text="Wait", skip_ai=True))
+    assert (state.ai_turns_since_summary, state.narratives_since_summary) == (1, 3)
+    assert not jobs
+    await engine.process_action(PlayerAction(action_type="do", action_text="Look around"))
+
+    job, = jobs
+    assert (job.covered, job.narratives) == (2, 4)
+    assert all(narrative in job.prompt for narrative in state.narrative_history[-4:])
+    assert "Already summarized." not in job.prompt
+
+    outcome = await engine.apply_summary("Summary.", previous=job.previous, covered=job.covered, narratives=job.narratives)
+    assert outcome == "applied"
+    assert (state.ai_turns_since_summary, state.narratives_since_summary) == (0, 0)
 
 
 @pytest.mark.asyncio
@@ -306,3 +349,202 @@ async def test_memory_system_prevents_token_bloat(fixture_engine_factory):
 
     # Should be reasonable size even with long history
     assert token_estimate < 2000, f"Prompt too large: ~{int(token_estimate)} tokens"
+
+
+@pytest.mark.asyncio
+async def test_narrative_summary_is_written_in_the_background(fixture_engine_factory, monkeypatch):
+    """
+    Verify that a due summary runs after the turn, without holding it up.
+
+    Should test:
+    - The turn completes while the summary call is still running
+    - Summary calls use the summary model at the lowest scheduling priority
+    - One job per session; a full queue drops further jobs (backpressure)
+    - The summary is swapped in unless another one replaced it meanwhile
+    - Turns played during the call still count towards the next summary
+    """
+    import asyncio
+
+    from app.core.settings import GameSettings
+    from app.services import summarizer
+    from app.services.ai_service import AIResponse, AISettings
+    from app.services.scheduler import Priority
+
+    queue = summarizer.SummaryQueue(max_pending=1, workers=1)
+    monkeypatch.setattr(summarizer, "_summary_queue", queue)
+    interval = GameSettings().memory_summary_interval
+
+    engine = fixture_engine_factory("checklist_demo", session_id="summary-a")
+    other = fixture_engine_factory("checklist_demo", session_id="summary-b")
+    dropped = fixture_engine_factory("checklist_demo", session_id="summary-c")
+    await engine.start()
+    state = engine.runtime.state_manager.state
+    state.ai_turns_since_summary = interval - 1
+
+    release = asyncio.Event()
+    calls = []
+
+    async def generate(prompt, **kwargs):
+        calls.append(kwargs)
+        await release.wait()
+        return AIResponse(content="  The story so far.  ", model="mock", usage={}, raw_response=None)
+
+    monkeypatch.setattr(engine.runtime.ai_service, "generate", generate)
+
+    await engine.process_action(PlayerAction(action_type="do", action_text="Look around"))
+    await asyncio.sleep(0)
+    await engine.process_action(PlayerAction(action_type="do", action_text="Look around"))
+    assert len(calls) == 1 and state.narrative_summary == ""
+    assert calls[0]["model"] == AISettings().summary_model
+    assert calls[0]["priority"] == Priority.SUMMARY
+
+    assert queue.submit(summarizer.SummaryJob(other, "prompt", previous="", covered=interval))
+    assert not queue.submit(summarizer.SummaryJob(dropped, "prompt", previous="", covered=interval))
+    other.runtime.state_manager.state.narrative_summary = "Written by the checker."
+
+    release.set()
+    await queue.join()
+
+    assert state.narrative_summary == "The story so far."
+    assert state.ai_turns_since_summary == 1
+    assert other.runtime.state_manager.state.narrative_summary == "Written by the checker."
+    assert dropped.runtime.state_manager.state.narrative_summary == ""
+    assert queue.metrics() == {
+        "pending": 0, "running": 0, "queued": 2, "completed": 1, "stale": 1, "dropped": 1,
+    }
+
+
+def test_bm25_index_ranks_documents_by_relevance():
+    """
+    Verify the local lexical index behind memory retrieval.
+
+    Should test:
+    - Rare query terms outweigh common ones
+    - Stopwords and possessives are ignored
+    - Filtered and unmatched documents are left out
+    """
+    from app.core.text_index import BM25Index, tokenize
+
+    assert tokenize("Alex's sister and the murals") == ["alex", "sister", "murals"]
+
+    index = BM25Index()
+    index.add(0, "Alex orders coffee at the cafe.")
+    index.add(1, "Alex talks about their sister Mara, who paints murals.")
+    index.add(2, "Alex studies in the library with coffee.")
+    index.add(3, "It rains over the quad.")
+
+    assert [doc for doc, _ in index.search("coffee with Mara", 3)] == [1, 2, 0]
+    assert [doc for doc, _ in index.search("coffee with Mara", 3, accept=lambda doc: doc != 1)] == [2, 0]
+    assert index.search("the and of", 3) == []
+    assert len(index) == 4
+
+
+@pytest.mark.asyncio
+async def test_memory_store_folds_days_and_retrieves_relevant_memories(fixture_engine_factory, monkeypatch):
+    """
+    Verify the hierarchical long-term memory store.
+
+    Should test:
+    - Each turn stores a scene tagged with the NPCs present
+    - Finished days are folded into one bounded day chunk
+    - Arc milestones add an arc chunk from the arc character's scenes
+    - narrative_history is trimmed; rollback restores the store
+    - The writer prompt quotes the top relevant memories only
+    """
+    from app.models import MemoryEntry
+
+    monkeypatch.setenv("MEMORY_HISTORY_LIMIT", "4")
+    monkeypatch.setenv("MEMORY_RECALL_K", "2")
+    engine = fixture_engine_factory("checklist_demo")
+    await engine.start()
+
+    memory = engine.runtime.memory_service
+    state = engine.runtime.state_manager.state
+    journal = engine.runtime.state_manager.journal
+    state.memories = []
+    state.present_characters = ["player", "alex"]
+    state.time.day = 1
+
+    memory.record_turn("Alex talks about their sister Mara. She paints murals downtown. " + "Details. " * 200)
+    memory.record_turn("You share a coffee with Alex at the cafe.")
+    memory.remember("alex", "The player promised to visit Mara's murals")
+    state.present_characters = ["player"]
+    memory.record_turn("You walk across the empty quad.")
+    assert [entry.kind for entry in state.memories] == ["scene", "scene", "memory", "scene"]
+    assert state.memories[0].characters == ["alex"] and state.memories[3].characters == []
+
+    state.time.day = 2
+    state.present_characters = ["player", "alex"]
+    memory.record_turn("A quiet morning at the library with Alex.", ["met"])
+    kinds = [entry.kind for entry in state.memories]
+    assert kinds == ["memory", "day", "scene", "arc"]
+    day = state.memories[1]
+    assert day.text.startswith("Day 1: Alex talks about their sister Mara.")
+    assert len(day.text) <= len("Day 1: ") + 600
+    assert day.characters == ["alex"]
+    assert state.memories[3].text.startswith("Friendship Arc - Met Alex: A quiet morning")
+    assert state.memories[3].arc == "friendship"
+
+    # Rolling a turn back restores the store, and the index follows it.
+    before = list(state.memories)
+    journal.begin(state)
+    state.time.day = 3
+    memory.record_turn("Alex shows you the murals.")
+    assert [entry.kind for entry in state.memories] == ["memory", "day", "arc", "day", "scene"]
+    journal.rollback()
+    assert state.memories == before
+
+    hits = memory.recall("ask about Mara and the murals", ["alex"], skip_recent=0)
+    assert sorted(entry.kind for entry in hits) == ["day", "memory"]
+    assert memory.recall("ask about Mara", ["player"]) == []
+
+    state.narrative_history = [f"Narrative {i}: Something happened." for i in range(7)]
+    memory.record_turn(state.narrative_history[-1])
+    assert state.narrative_history == [f"Narrative {i}: Something happened." for i in range(3, 7)]
+
+    state.memories.extend(
+        MemoryEntry(kind="scene", text=f"Alex mentions lecture {i}.", characters=["alex"], day=2, turn=10 + i)
+        for i in range(50)
+    )
+    writer_prompt = engine.prompt_builder.build_writer_prompt(engine.runtime.current_context, "Ask Alex about Mara")
+    assert "Relevant memories:" in writer_prompt
+    assert "- Alex remembers (day 1): The player promised to visit Mara's murals" in writer_prompt
+    assert sum(f"lecture {i}." in writer_prompt for i in range(50)) == 0
+    assert len(writer_prompt) / 4 < 2000
+
+
+@pytest.mark.asyncio
+async def test_character_memories_are_folded_and_memory_log_is_trimmed(fixture_engine_factory, monkeypatch):
+    """
+    Verify character memories stay bounded.
+
+    Should test:
+    - memory_log keeps only the latest MEMORY_LOG_LIMIT memories
+    - A finished day's memories of one character are folded into one entry
+    - Lone memories and today's memories are left as they are
+    """
+    monkeypatch.setenv("MEMORY_LOG_LIMIT", "3")
+    engine = fixture_engine_factory("checklist_demo")
+    await engine.start()
+
+    memory = engine.runtime.memory_service
+    state = engine.runtime.state_manager.state
+    state.memories = []
+    state.characters["alex"].memory_log = []
+    state.time.day = 1
+    for i in range(5):
+        memory.remember("alex", f"Alex recalls detail {i}")
+    assert state.characters["alex"].memory_log == [f"Alex recalls detail {i}" for i in range(2, 5)]
+    assert [entry.kind for entry in state.memories] == ["memory"] * 5
+
+    state.time.day = 2
+    memory.remember("alex", "Alex recalls the second day")
+    memory.record_turn("")
+    assert [(entry.kind, entry.day) for entry in state.memories] == [("memory", 2), ("memory", 1)]
+    folded = state.memories[1]
+    assert folded.characters == ["alex"]
+    assert folded.text == " ".join(f"Alex recalls detail {i}." for i in range(5))
+
+    state.time.day = 3
+    memory.record_turn("")
+    assert [(entry.kind, entry.day) for entry in state.memories] == [("memory", 2), ("memory", 1)]
@@ -0,0 +1,302 @@
+"""
+Session persistence: SessionRepository implementations and engine rehydration.
+"""
+
+import pytest
+
+from app.runtime.engine import PlotPlayEngine
+from app.runtime.types import PlayerAction
+from app.storage import InMemorySessionRepository, SQLiteSessionRepository
+
+
+@pytest.mark.asyncio
+async def test_sqlite_repository_rehydrates_engine(fixture_engine_factory, tmp_path):
+    """A completed turn is written behind and restores into an identical engine."""
+    db_path = tmp_path / "sessions.sqlite3"
+    repository = SQLiteSessionRepository(db_path, fsync="full", flush_interval=0.01)
+    engine = fixture_engine_factory(session_id="persisted")
+    engine.repository = repository
+    await engine.start()
+    await engine.process_action(PlayerAction(action_type="choice", choice_id="greet_alex"))
+    repository.close()
+
+    reopened = SQLiteSessionRepository(db_path)
+    record = reopened.load("persisted")
+    assert record is not None
+    assert record.game_id == engine.runtime.game.meta.id
+
+    restored = PlotPlayEngine.restore(engine.runtime.game, record, ai_service=engine.runtime.ai_service)
+    state = engine.runtime.state_manager.state
+    assert restored.runtime.state_manager.state.to_dict() == state.to_dict()
+    assert restored.runtime.base_seed == engine.runtime.base_seed
+
+    # The rehydrated session keeps playing deterministically.
+    expected = await engine.process_action(PlayerAction(action_type="do", action_text="Wait"))
+    replayed = await restored.process_action(PlayerAction(action_type="do", action_text="Wait"))
+    assert replayed.rng_seed == expected.rng_seed
+    assert replayed.state_summary == expected.state_summary
+    reopened.close()
+
+
+def test_sqlite_repository_group_commits_latest_snapshot(fixture_engine_factory, tmp_path):
+    """Saves within one window collapse to the latest snapshot per session."""
+    repository = SQLiteSessionRepository(tmp_path / "sessions.sqlite3", flush_interval=0.5)
+    engines = [fixture_engine_factory(session_id=f"s{i}") for i in range(3)]
+    for turn in range(5):
+        for engine in engines:
+            engine.runtime.state_manager.state.turn_count = turn
+            repository.save(engine.snapshot())
+
+    # Pending snapshots are readable before they reach disk.
+    assert repository.load("s0").state.turn_count == 4
+    repository.flush()
+
+    rows = repository._read_conn.execute("SELECT session_id, turn_count FROM sessions ORDER BY session_id").fetchall()
+    assert rows == [("s0", 4), ("s1", 4), ("s2", 4)]
+    repository.delete("s1")
+    assert repository.load("s1") is None
+    repository.close()
+
+
+@pytest.mark.asyncio
+async def test_snapshots_do_not_alias_live_state(fixture_engine_factory):
+    """Mutating the live state after save() does not change the stored snapshot."""
+    repository = InMemorySessionRepository()
+    engine = fixture_engine_factory(session_id="isolated")
+    engine.repository = repository
+    await engine.persist()
+
+    engine.runtime.state_manager.state.flags["met_alex"] = True
+    assert repository.load("isolated").state.flags["met_alex"] is False
+
+
+@pytest.mark.asyncio
+async def test_restored_sessions_share_interned_ids(fixture_engine_factory):
+    """Decoded snapshots reuse one copy of each id, and slotted state rolls back and restores."""
+    import copyreg
+    import pickle
+
+    from app.models import IndexedList
+    from app.models.locations import LocationState
+    from app.storage.sessions import _loads
+
+    repository = InMemorySessionRepository()
+    for session_id in ("first", "second"):
+        engine = fixture_engine_factory(session_id=session_id)
+        engine.repository = repository
+        await engine.persist()
+
+    first, second = repository.load("first").state, repository.load("second").state
+    assert first is not second
+    key_a = next(iter(first.locations))
+    key_b = next(iter(second.locations))
+    assert key_a == key_b and key_a is key_b
+
+    # Slotted state dataclasses are journaled like any other
+    manager = fixture_engine_factory(session_id="rollback").runtime.state_manager
+    location = next(iter(manager.state.locations.values()))
+    locked = location.locked
+    manager.journal.begin(manager.state)
+    manager.journal.touch(location)
+    location.locked = not locked
+    manager.journal.rollback()
+    assert location.locked is locked
+
+    # Snapshots pickled before state classes had slots carry a plain __dict__ state
+    class Legacy:
+        def __reduce_ex__(self, protocol):
+            return copyreg._reconstructor, (LocationState, object, None), {"id": "old", "zone_id": "z", "locked": True}
+
+    restored = _loads(pickle.dumps(Legacy()))
+    assert isinstance(restored, LocationState)
+    assert (restored.id, restored.locked, restored.discovered) == ("old", True, True)
+
+    # ...and plain lists where histories are now indexed
+    first.__dict__["events_history"] = ["evt_seen"]
+    upgraded = _loads(pickle.dumps(first)).events_history
+    assert isinstance(upgraded, IndexedList) and "evt_seen" in upgraded
+
+
+def test_incomplete_repository_fails_when_created():
+    """A backend missing part of the repository interface cannot be instantiated."""
+    from app.storage.sessions import SessionRepository
+
+    class SaveOnly(SessionRepository):
+        def save(self, record):
+            pass
+
+    with pytest.raises(TypeError, match="abstract"):
+        SaveOnly()
+
+
+@pytest.mark.parametrize("store", ["memory", "sqlite"])
+def test_session_leases_are_exclusive_until_released_or_expired(store, tmp_path):
+    """Two workers sharing a store never hold the same session at once."""
+    if store == "sqlite":
+        db_path = tmp_path / "sessions.sqlite3"
+        worker_a, worker_b = SQLiteSessionRepository(db_path), SQLiteSessionRepository(db_path)
+    else:
+        worker_a = worker_b = InMemorySessionRepository()
+
+    assert worker_a.acquire_lease("s1", "a", ttl=30)
+    assert not worker_b.acquire_lease("s1", "b", ttl=30)
+    assert worker_a.acquire_lease("s1", "a", ttl=30)  # renewal
+    assert worker_b.acquire_lease("s2", "b", ttl=30)
+
+    worker_b.release_lease("s1", "b")  # not the holder: no effect
+    assert not worker_b.acquire_lease("s1", "b", ttl=30)
+    worker_a.release_lease("s1", "a")
+    assert worker_b.acquire_lease("s1", "b", ttl=-1)
+
+    # An expired lease can be taken over.
+    assert worker_a.acquire_lease("s1", "a", ttl=30)
+    worker_a.close()
+    worker_b.close()
+
+
+@pytest.mark.asyncio
+async def test_engine_revision_detects_turns_from_another_worker(fixture_engine_factory, tmp_path):
+    """A stale cached engine sees a newer stored revision and rehydrates from it."""
+    db_path = tmp_path / "sessions.sqlite3"
+    worker_a, worker_b = SQLiteSessionRepository(db_path), SQLiteSessionRepository(db_path)
+    engine_a = fixture_engine_factory(session_id="shared")
+    engine_a.repository = worker_a
+    await engine_a.start()
+    worker_a.flush()
+    assert worker_b.revision("shared") == engine_a.revision == 1
+
+    engine_b = PlotPlayEngine.restore(
+        engine_a.runtime.game, worker_b.load("shared"), ai_service=engine_a.runtime.ai_service, repository=worker_b
+    )
+    await engine_b.process_action(PlayerAction(action_type="choice", choice_id="greet_alex"))
+    worker_b.flush()
+
+    assert worker_a.revision("shared") == 2 > engine_a.revision
+    record = worker_a.load("shared")
+    assert record.state.to_dict() == engine_b.runtime.state_manager.state.to_dict()
+    assert worker_a.revision("missing") is None
+    worker_a.close()
+    worker_b.close()
+
+
+@pytest.mark.asyncio
+async def test_background_summary_swaps_under_the_lease_and_drops_when_stale(fixture_engine_factory, monkeypatch):
+    """
+    A summary lands under a non-blocking session lease, waits for a turn that
+    holds the session, and is dropped on an engine another worker moved past.
+    """
+    from app.api import game as game_api
+
+    repository = InMemorySessionRepository()
+    monkeypatch.setattr(game_api, "_session_repository", repository)
+    engine = fixture_engine_factory(session_id="summarized")
+    engine.repository, engine.lease = repository, game_api.try_session_lease
+    await engine.start()
+    state = engine.runtime.state_manager.state
+
+    assert await engine.apply_summary("First summary.", previous="", covered=0) == "applied"
+    assert state.narrative_summary == "First summary."
+    assert repository.revision("summarized") == engine.revision == 2
+    assert game_api._turn_queues == {}
+
+    async with game_api.session_lease("summarized"):
+        assert await engine.apply_summary("Second summary.", previous="First summary.", covered=0) == "deferred"
+        assert state.narrative_summary == "First summary."
+        await engine.process_action(PlayerAction(action_type="do", action_text="Wait"))
+    assert state.narrative_summary == "Second summary."
+    assert game_api._turn_queues == {}
+
+    other = PlotPlayEngine.restore(
+        engine.runtime.game, repository.load("summarized"), ai_service=engine.runtime.ai_service, repository=repository
+    )
+    await other.process_action(PlayerAction(action_type="choice", choice_id="greet_alex"))
+    assert await engine.apply_summary("Late summary.", previous="Second summary.", covered=0) == "stale"
+    assert state.narrative_summary == "Second summary."
+    assert repository.load("summarized").state.narrative_summary != "Late summary."
+
+
+def test_game_cache_reuses_definitions_until_files_change(fixture_games_dir, tmp_path):
+    """Each worker loads a game once and reloads it only when its YAML changes."""
+    import shutil
+
+    from app.core.loader import GameCache, GameLoader
+
+    shutil.copytree(fixture_games_dir / "checklist_demo", tmp_path / "checklist_demo")
+    cache = GameCache(GameLoader(games_dir=tmp_path))
+    first = cache.get("checklist_demo")
+    assert cache.get("checklist_demo") is first
+
+    manifest = tmp_path / "checklist_demo" / "game.yaml"
+    manifest.write_text(manifest.read_text() + "\n")
+    reloaded = cache.get("checklist_demo")
+    assert reloaded is not first
+    assert reloaded.meta.id == first.meta.id
+
+
+def test_game_cache_loads_other_games_while_one_is_loading(fixture_games_dir, tmp_path):
+    """A slow load holds only its own game's lock, not the whole cache."""
+    import shutil
+    import threading
+
+    from app.core.loader import GameCache, GameLoader
+
+    for game_id in ("checklist_demo", "time_cases"):
+        shutil.copytree(fixture_games_dir / game_id, tmp_path / game_id)
+    loader = GameLoader(games_dir=tmp_path)
+    started, release = threading.Event(), threading.Event()
+    load_game = loader.load_game
+
+    def slow_load(game_id):
+        if game_id == "checklist_demo":
+            started.set()
+            assert release.wait(5)
+        return load_game(game_id)
+
+    loader.load_game = slow_load
+    cache = GameCache(loader)
+    slow = threading.Thread(target=cache.get, args=("checklist_demo",))
+    slow.start()
+    try:
+        assert started.wait(5)
+        assert cache.get("time_cases").meta.id == "time_cases"
+    finally:
+        release.set()
+        slow.join(5)
+    assert cache.get("checklist_demo").meta.id == "checklist_demo"
+
+
+@pytest.mark.asyncio
+async def test_hot_reload_swaps_edited_game_into_live_session(fixture_games_dir, mock_ai_service, tmp_path):
+    """Edited include files are re-parsed alone and swapped in without losing GameState."""
+    import shutil
+
+    from app.core.loader import GameCache, GameLoader
+
+    shutil.copytree(fixture_games_dir / "checklist_demo", tmp_path / "checklist_demo")
+    cache = GameCache(GameLoader(games_dir=tmp_path))
+    engine = PlotPlayEngine(cache.get("checklist_demo"), "hot", ai_service=mock_ai_service)
+    await engine.start()
+    state = engine.runtime.state_manager.state
+    turn_count = state.turn_count
+    manifest = cache.loader._sources[tmp_path / "checklist_demo" / "game.yaml"]
+    assert cache.refresh() == {}
+
+    story = tmp_path / "checklist_demo" / "content" / "story.yaml"
+    story.write_text(story.read_text().replace('title: "Campus Hub"', 'title: "Campus Commons"'))
+    reloaded = cache.refresh()
+    assert list(reloaded) == ["checklist_demo"]
+    # The untouched manifest was not parsed again.
+    assert cache.loader._sources[tmp_path / "checklist_demo" / "game.yaml"] is manifest
+
+    # A reload arriving mid-turn waits for the turn to finish.
+    stream = engine.process_action_stream(PlayerAction(action_type="do", action_text="Wait"))
+    async for _event in stream:
+        if engine.runtime.game is not reloaded["checklist_demo"]:
+            engine.reload_game(reloaded["checklist_demo"])
+            assert engine.runtime.index.nodes["campus_hub"].title == "Campus Hub"
+    assert engine.runtime.game is reloaded["checklist_demo"]
+    assert engine.runtime.state_manager.index.nodes["campus_hub"].title == "Campus Commons"
+
+    await engine.process_action(PlayerAction(action_type="do", action_text="Wait"))
+    assert engine.runtime.state_manager.state is state
+    assert state.turn_count == turn_count + 2